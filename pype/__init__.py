@@ -2,8 +2,8 @@ import os
 
 from pyblish import api as pyblish
 from avalon import api as avalon
-from .api import config, Anatomy
-from .lib import filter_pyblish_plugins
+from .api import Anatomy
+from .lib import filter_pyblish_plugins, get_preset_value
 
 
 import logging
@@ -49,9 +49,8 @@ def patched_discover(superclass):
         plugin_type = "create"
 
     print(">>> trying to find presets for {}:{} ...".format(host, plugin_type))
-    try:
-        config_data = config.get_presets()['plugins'][host][plugin_type]
-    except KeyError:
+    config_data = get_preset_value("plugins", host, plugin_type)
+    if config_data is None:
         print("*** no presets found.")
     else:
         for plugin in plugins:
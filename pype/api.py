@@ -41,7 +41,9 @@ from .lib import (
     get_last_version_from_path,
     modified_environ,
     add_tool_to_environment,
-    get_latest_version
+    get_latest_version,
+    get_presets,
+    get_preset_value
 )
 
 # Special naming case for subprocess since its a built-in method.
@@ -87,5 +89,7 @@ __all__ = [
     "add_tool_to_environment",
 
     "subprocess",
-    "get_latest_version"
+    "get_latest_version",
+    "get_presets",
+    "get_preset_value"
 ]
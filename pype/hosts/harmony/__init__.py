@@ -1,9 +1,8 @@
 import os
 import sys
 
-from avalon import api, io, harmony
+from avalon import api, harmony
 from avalon.vendor import Qt
-import avalon.tools.sceneinventory
 import pyblish.api
 from pype import lib
 
@@ -94,23 +93,10 @@ def ensure_scene_settings():
 
 
 def check_inventory():
-    if not lib.any_outdated():
+    outdated_containers = lib.get_outdated_containers()
+    if not outdated_containers:
         return
 
-    host = avalon.api.registered_host()
-    outdated_containers = []
-    for container in host.ls():
-        representation = container['representation']
-        representation_doc = io.find_one(
-            {
-                "_id": io.ObjectId(representation),
-                "type": "representation"
-            },
-            projection={"parent": True}
-        )
-        if representation_doc and not lib.is_latest(representation_doc):
-            outdated_containers.append(container)
-
     # Colour nodes.
     func = """function func(args){
         for( var i =0; i <= args[0].length - 1; ++i)
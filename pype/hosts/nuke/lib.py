@@ -8,6 +8,7 @@ from avalon import api, io, lib
 import avalon.nuke
 from avalon.nuke import lib as anlib
 import pype.api as pype
+from pype.lib import get_container_resolver
 
 import nuke
 
@@ -48,41 +49,29 @@ def check_inventory_versions():
     it to red.
     """
     # get all Loader nodes by avalon attribute metadata
+    containers = []
     for each in nuke.allNodes():
         if each.Class() == 'Read':
             container = avalon.nuke.parse_container(each)
-
             if container:
-                node = container["_node"]
-                avalon_knob_data = avalon.nuke.get_avalon_knob_data(
-                    node, ['avalon:', 'ak:'])
-
-                # get representation from io
-                representation = io.find_one({
-                    "type": "representation",
-                    "_id": io.ObjectId(avalon_knob_data["representation"])
-                })
-
-                # Get start frame from version data
-                version = io.find_one({
-                    "type": "version",
-                    "_id": representation["parent"]
-                })
-
-                # get all versions in list
-                versions = io.find({
-                    "type": "version",
-                    "parent": version["parent"]
-                }).distinct('name')
-
-                max_version = max(versions)
-
-                # check the available version and do match
-                # change color of node if not max verion
-                if version.get("name") not in [max_version]:
-                    node["tile_color"].setValue(int("0xd84f20ff", 16))
-                else:
-                    node["tile_color"].setValue(int("0x4ecd25ff", 16))
+                containers.append(container)
+
+    # resolve versions of all containers at once
+    infos = get_container_resolver().resolve(
+        container["representation"] for container in containers
+    )
+    for container in containers:
+        info = infos.get(str(container["representation"]))
+        if not info:
+            continue
+
+        # check the available version and do match
+        # change color of node if not max verion
+        node = container["_node"]
+        if not info["is_latest"]:
+            node["tile_color"].setValue(int("0xd84f20ff", 16))
+        else:
+            node["tile_color"].setValue(int("0x4ecd25ff", 16))
 
 
 def writes_version_sync():
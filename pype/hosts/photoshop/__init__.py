@@ -1,30 +1,17 @@
 import os
 import sys
 
-from avalon import api, io
+from avalon import api
 from avalon.vendor import Qt
 from pype import lib
 import pyblish.api
 
 
 def check_inventory():
-    if not lib.any_outdated():
+    outdated_containers = lib.get_outdated_containers()
+    if not outdated_containers:
         return
 
-    host = api.registered_host()
-    outdated_containers = []
-    for container in host.ls():
-        representation = container['representation']
-        representation_doc = io.find_one(
-            {
-                "_id": io.ObjectId(representation),
-                "type": "representation"
-            },
-            projection={"parent": True}
-        )
-        if representation_doc and not lib.is_latest(representation_doc):
-            outdated_containers.append(container)
-
     # Warn about outdated containers.
     print("Starting new QApplication..")
     app = Qt.QtWidgets.QApplication(sys.argv)
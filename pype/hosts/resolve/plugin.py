@@ -2,7 +2,7 @@ import re
 from avalon import api
 from pype.hosts import resolve
 from avalon.vendor import qargparse
-from pype.api import config
+from pype.api import get_presets
 
 from Qt import QtWidgets, QtCore
 
@@ -258,7 +258,7 @@ class Creator(api.Creator):
 
     def __init__(self, *args, **kwargs):
         super(Creator, self).__init__(*args, **kwargs)
-        self.presets = config.get_presets()['plugins']["resolve"][
+        self.presets = get_presets()['plugins']["resolve"][
             "create"].get(self.__class__.__name__, {})
 
         # adding basic current context resolve objects
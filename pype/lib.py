@@ -1,7 +1,10 @@
 import os
 import sys
+import copy
+import errno
 import types
 import re
+import stat
 import uuid
 import json
 import collections
@@ -10,14 +13,38 @@ import itertools
 import contextlib
 import subprocess
 import inspect
+import time
+import shutil
+import datetime
+import hashlib
+import threading
+from multiprocessing.pool import ThreadPool
 from abc import ABCMeta, abstractmethod
 
+import clique
+from pymongo import UpdateOne
 from avalon import io, pipeline
+from avalon.vendor import filelink
 import six
+from six.moves import queue
 import avalon.api
-from .api import config
+from .api import config, project_overrides_dir_path
 
 
+# this is needed until speedcopy for linux is fixed
+if sys.platform == "win32":
+    from speedcopy import copyfile
+else:
+    from shutil import copyfile
+
+try:
+    from os import scandir as _scandir
+except ImportError:
+    try:
+        from scandir import scandir as _scandir
+    except ImportError:
+        _scandir = None
+
 log = logging.getLogger(__name__)
 
 
@@ -239,48 +266,17 @@ def is_latest(representation):
 
     """
 
-    version = io.find_one({"_id": representation['parent']})
-    if version["type"] == "master_version":
-        return True
-
-    # Get highest version under the parent
-    highest_version = io.find_one({
-        "type": "version",
-        "parent": version["parent"]
-    }, sort=[("name", -1)], projection={"name": True})
-
-    if version['name'] == highest_version['name']:
-        return True
-    else:
-        return False
+    version_id = representation["parent"]
+    info = get_container_resolver().resolve_versions([version_id]).get(
+        str(version_id)
+    )
+    return bool(info and info["is_latest"])
 
 
 def any_outdated():
     """Return whether the current scene has any outdated content"""
 
-    checked = set()
-    host = avalon.api.registered_host()
-    for container in host.ls():
-        representation = container['representation']
-        if representation in checked:
-            continue
-
-        representation_doc = io.find_one(
-            {
-                "_id": io.ObjectId(representation),
-                "type": "representation"
-            },
-            projection={"parent": True}
-        )
-        if representation_doc and not is_latest(representation_doc):
-            return True
-        elif not representation_doc:
-            log.debug("Container '{objectName}' has an invalid "
-                      "representation, it is missing in the "
-                      "database".format(**container))
-
-        checked.add(representation)
-    return False
+    return bool(get_outdated_containers())
 
 
 def _rreplace(s, a, b, n=1):
@@ -535,7 +531,7 @@ def filter_pyblish_plugins(plugins):
 
     host = api.current_host()
 
-    presets = config.get_presets().get('plugins', {})
+    presets = get_presets().get('plugins', {})
 
     # iterate over plugins
     for plugin in plugins[:]:
@@ -569,6 +565,142 @@ def filter_pyblish_plugins(plugins):
                 setattr(plugin, option, value)
 
 
+# Compound indexes supporting latest version queries
+# - versions of subsets sorted by name, subsets of assets by name
+# - `$lookup` of representations (children) by version id
+LATEST_VERSION_INDEXES = [
+    [("type", 1), ("parent", 1), ("name", -1)],
+    [("parent", 1), ("type", 1)]
+]
+_indexed_collections = set()
+
+
+def get_project_collection(project_name=None):
+    """Collection of project with ensured indexes for latest versions.
+
+    Args:
+        project_name (str): Name of project. Session project is used if not
+            entered.
+    """
+    project_name = project_name or io.Session["AVALON_PROJECT"]
+    database = get_avalon_database()
+    collection = database[project_name]
+    key = (database.name, project_name)
+    if key not in _indexed_collections:
+        for keys in LATEST_VERSION_INDEXES:
+            try:
+                collection.create_index(keys, background=True)
+            except Exception:
+                log.warning(
+                    "Failed to create index {} in \"{}\"".format(
+                        keys, project_name
+                    ),
+                    exc_info=True
+                )
+        _indexed_collections.add(key)
+    return collection
+
+
+def _latest_versions_pipeline(subset_ids, version_filter=None):
+    version_match = {"type": "version", "parent": {"$in": list(subset_ids)}}
+    if version_filter:
+        version_match.update(version_filter)
+
+    return [
+        {"$match": version_match},
+        {"$sort": {"parent": 1, "name": -1}},
+        {"$group": {"_id": "$parent", "version": {"$first": "$$ROOT"}}},
+        {"$replaceRoot": {"newRoot": "$version"}}
+    ]
+
+
+def get_latest_versions(
+    subset_ids, version_filter=None, projection=None, project_name=None
+):
+    """Latest versions of multiple subsets with one aggregation.
+
+    Args:
+        subset_ids (list): Ids of subsets.
+        version_filter (dict): Additional filter of versions (e.g. version
+            name or families).
+        projection (dict): Fields of version documents to return.
+        project_name (str): Name of project.
+
+    Returns:
+        dict: Version document by subset id. Subsets without version are
+            not in output.
+    """
+    subset_ids = list(subset_ids)
+    if not subset_ids:
+        return {}
+
+    pipeline = _latest_versions_pipeline(subset_ids, version_filter)
+    if projection:
+        pipeline.append({"$project": projection})
+
+    collection = get_project_collection(project_name)
+    return {
+        version["parent"]: version
+        for version in collection.aggregate(pipeline)
+    }
+
+
+def get_latest_versions_with_representations(
+    subset_ids,
+    version_filter=None,
+    representation_names=None,
+    project_name=None
+):
+    """Latest versions of subsets with their representations.
+
+    Versions and representations are queried with one aggregation.
+
+    Args:
+        subset_ids (list): Ids of subsets.
+        version_filter (dict): Additional filter of versions.
+        representation_names (list): Return only representations with
+            these names. All representations are returned if not entered.
+        project_name (str): Name of project.
+
+    Returns:
+        dict: Tuple of version document and list of its representations by
+            subset id.
+    """
+    subset_ids = list(subset_ids)
+    if not subset_ids:
+        return {}
+
+    collection = get_project_collection(project_name)
+    repre_conditions = [{"$eq": ["$$repre.type", "representation"]}]
+    if representation_names is not None:
+        repre_conditions.append(
+            {"$in": ["$$repre.name", list(representation_names)]}
+        )
+
+    pipeline = _latest_versions_pipeline(subset_ids, version_filter)
+    pipeline.extend([
+        {"$lookup": {
+            "from": collection.name,
+            "localField": "_id",
+            "foreignField": "parent",
+            "as": "representations"
+        }},
+        {"$addFields": {
+            "representations": {"$filter": {
+                "input": "$representations",
+                "as": "repre",
+                "cond": {"$and": repre_conditions}
+            }}
+        }}
+    ])
+
+    output = {}
+    for version in collection.aggregate(pipeline):
+        repres = version.pop("representations")
+        output[version["parent"]] = (version, repres)
+    return output
+
+
 def get_subsets(asset_name,
                 regex_filter=None,
                 version=None,
@@ -613,33 +745,25 @@ def get_subsets(asset_name,
                      "Try this for start `r'.*'`: "
                      "asset: `{}`").format(asset_name)
 
+    version_filter = None
+    if version:
+        assert isinstance(version, int), "version needs to be `int` type"
+        version_filter = {"name": int(version)}
+
+    versions_by_subset_id = get_latest_versions_with_representations(
+        [subset["_id"] for subset in subsets],
+        version_filter=version_filter,
+        representation_names=representations
+    )
+
     output_dict = {}
     # Process subsets
     for subset in subsets:
-        if not version:
-            version_sel = io.find_one(
-                {
-                    "type": "version",
-                    "parent": subset["_id"]
-                },
-                sort=[("name", -1)]
-            )
-        else:
-            assert isinstance(version, int), "version needs to be `int` type"
-            version_sel = io.find_one({
-                "type": "version",
-                "parent": subset["_id"],
-                "name": int(version)
-            })
-
-        find_dict = {"type": "representation",
-                     "parent": version_sel["_id"]}
-
-        filter_repr = {"name": {"$in": representations}}
-
-        find_dict.update(filter_repr)
-        repres_out = [i for i in io.find(find_dict)]
+        version_data = versions_by_subset_id.get(subset["_id"])
+        if not version_data:
+            continue
 
+        version_sel, repres_out = version_data
         if len(repres_out) > 0:
             output_dict[subset["name"]] = {"version": version_sel,
                                            "representations": repres_out}
@@ -928,7 +1052,7 @@ class BuildWorkfile:
         :rtype: dict | None
         """
         host_name = avalon.api.registered_host().__name__.rsplit(".", 1)[-1]
-        presets = config.get_presets(io.Session["AVALON_PROJECT"])
+        presets = get_presets(io.Session["AVALON_PROJECT"])
         # Get presets for host
         build_presets = (
             presets["plugins"]
@@ -1309,24 +1433,15 @@ class BuildWorkfile:
         }))
         subset_entity_by_ids = {subset["_id"]: subset for subset in subsets}
 
-        sorted_versions = list(io.find({
-            "type": "version",
-            "parent": {"$in": subset_entity_by_ids.keys()}
-        }).sort("name", -1))
+        versions_by_subset_id = get_latest_versions_with_representations(
+            subset_entity_by_ids.keys()
+        )
 
-        subset_id_with_latest_version = []
         last_versions_by_id = {}
-        for version in sorted_versions:
-            subset_id = version["parent"]
-            if subset_id in subset_id_with_latest_version:
-                continue
-            subset_id_with_latest_version.append(subset_id)
+        repres = []
+        for version, version_repres in versions_by_subset_id.values():
             last_versions_by_id[version["_id"]] = version
-
-        repres = io.find({
-            "type": "representation",
-            "parent": {"$in": last_versions_by_id.keys()}
-        })
+            repres.extend(version_repres)
 
         output = {}
         for repre in repres:
@@ -1361,8 +1476,8 @@ class BuildWorkfile:
         return output
 
 
-def ffprobe_streams(path_to_file):
-    """Load streams from entered filepath via ffprobe."""
+def _ffprobe_streams(path_to_file):
+    """Load streams from entered filepath via ffprobe without cache."""
     log.info(
         "Getting information about input \"{}\".".format(path_to_file)
     )
@@ -1380,9 +1495,244 @@ def ffprobe_streams(path_to_file):
 
     popen_output = popen.communicate()[0]
     log.debug("FFprobe output: {}".format(popen_output))
+    if popen.returncode != 0:
+        raise RuntimeError("Failed to run: {}".format(command))
     return json.loads(popen_output)["streams"]
 
 
+class FFprobeCache(object):
+    """Cache of ffprobe streams keyed by path, size and modification time.
+
+    Probed streams are kept in memory (least recently used are dropped
+    when `max_size` is reached) and optionally in SQLite database so
+    streams are shared across processes. Entries are invalid when size or
+    modification time of the file changes.
+
+    Args:
+        max_size (int): Maximum number of files kept in memory.
+        db_path (str): Path to SQLite database file. On-disk store is not
+            used when not set.
+    """
+
+    def __init__(self, max_size=256, db_path=None):
+        self.max_size = max_size
+        self.db_path = db_path
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._db_initialized = False
+
+    @staticmethod
+    def _key(path):
+        path = os.path.normpath(os.path.abspath(path))
+        stat = os.stat(path)
+        return (path, stat.st_size, stat.st_mtime)
+
+    def get(self, path):
+        """Streams of file from cache or from ffprobe on cache miss.
+
+        Returns:
+            list: Streams data as ffprobe returns them.
+        """
+        key = self._key(path)
+        streams = self._get_cached(key)
+        if streams is None:
+            streams = _ffprobe_streams(path)
+            self._set_cached(key, streams)
+        return copy.deepcopy(streams)
+
+    def get_many(self, paths, workers=None):
+        """Streams of multiple files probed concurrently.
+
+        Args:
+            paths (list): Paths to files.
+            workers (int): Number of concurrently running ffprobe processes.
+
+        Returns:
+            dict: Streams by path. Files which can't be probed are set to
+                `None`.
+        """
+        output = {}
+        missing = []
+        for path in paths:
+            if path in output or path in missing:
+                continue
+            try:
+                streams = self._get_cached(self._key(path))
+            except OSError:
+                output[path] = None
+                continue
+
+            if streams is None:
+                missing.append(path)
+            else:
+                output[path] = copy.deepcopy(streams)
+
+        if not missing:
+            return output
+
+        def probe(path):
+            try:
+                return path, self.get(path)
+            except Exception:
+                log.warning(
+                    "Failed to probe \"{}\"".format(path), exc_info=True
+                )
+                return path, None
+
+        workers = workers or min(len(missing), 8)
+        pool = ThreadPool(max(min(workers, len(missing)), 1))
+        try:
+            output.update(pool.map(probe, missing))
+        finally:
+            pool.close()
+            pool.join()
+        return output
+
+    def clear(self):
+        """Clear in-memory cache."""
+        with self._lock:
+            self._items.clear()
+
+    def _get_cached(self, key):
+        with self._lock:
+            if key in self._items:
+                streams = self._items.pop(key)
+                self._items[key] = streams
+                return streams
+
+        streams = self._db_get(key)
+        if streams is not None:
+            self._set_memory(key, streams)
+        return streams
+
+    def _set_cached(self, key, streams):
+        self._set_memory(key, streams)
+        self._db_set(key, streams)
+
+    def _set_memory(self, key, streams):
+        with self._lock:
+            # Remove previous entries of the path (file has changed)
+            for item_key in tuple(self._items.keys()):
+                if item_key[0] == key[0]:
+                    self._items.pop(item_key)
+
+            self._items[key] = streams
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def _import_sqlite(self):
+        """Import sqlite3 when database is used.
+
+        Some hosts' embedded interpreters don't ship `_sqlite3`, database is
+        disabled in that case.
+        """
+        try:
+            import sqlite3
+        except ImportError:
+            log.warning((
+                "Module sqlite3 is not available."
+                " FFprobe cache database is not used."
+            ))
+            self.db_path = None
+            return None
+        return sqlite3
+
+    def _db_connection(self, sqlite3):
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        if not self._db_initialized:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS streams ("
+                "path TEXT PRIMARY KEY, size INTEGER, mtime REAL, data TEXT)"
+            )
+            connection.commit()
+            self._db_initialized = True
+        return connection
+
+    def _db_get(self, key):
+        if not self.db_path:
+            return None
+
+        sqlite3 = self._import_sqlite()
+        if sqlite3 is None:
+            return None
+
+        path, size, mtime = key
+        try:
+            connection = self._db_connection(sqlite3)
+            try:
+                row = connection.execute(
+                    "SELECT size, mtime, data FROM streams WHERE path = ?",
+                    (path, )
+                ).fetchone()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            log.warning("FFprobe cache database is not available.")
+            return None
+
+        if row is None or row[0] != size or row[1] != mtime:
+            return None
+        return json.loads(row[2])
+
+    def _db_set(self, key, streams):
+        if not self.db_path:
+            return
+
+        sqlite3 = self._import_sqlite()
+        if sqlite3 is None:
+            return
+
+        path, size, mtime = key
+        try:
+            connection = self._db_connection(sqlite3)
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO streams VALUES (?, ?, ?, ?)",
+                    (path, size, mtime, json.dumps(streams))
+                )
+                connection.commit()
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            log.warning("Couldn't store ffprobe output to cache database.")
+
+
+_ffprobe_cache = None
+
+
+def get_ffprobe_cache():
+    """Global ffprobe cache.
+
+    On-disk store is used when environment "PYPE_FFPROBE_CACHE_DB" is set to
+    path of SQLite database file.
+    """
+    global _ffprobe_cache
+    if _ffprobe_cache is None:
+        _ffprobe_cache = FFprobeCache(
+            db_path=os.environ.get("PYPE_FFPROBE_CACHE_DB") or None
+        )
+    return _ffprobe_cache
+
+
+def ffprobe_streams(path_to_file):
+    """Load streams from entered filepath via ffprobe.
+
+    Result is cached by path, size and modification time of the file.
+    """
+    return get_ffprobe_cache().get(path_to_file)
+
+
+def ffprobe_streams_batch(paths, workers=None):
+    """Load streams of multiple files at once via ffprobe.
+
+    Files missing in cache are probed concurrently.
+
+    Returns:
+        dict: Streams by path, `None` for files which can't be probed.
+    """
+    return get_ffprobe_cache().get_many(paths, workers)
+
+
 def get_latest_version(asset_name, subset_name):
     """Retrieve latest version from `asset_name`, and `subset_name`.
 
@@ -1409,12 +1759,1504 @@ def get_latest_version(asset_name, subset_name):
         "parent": True,
     }
 
-    version = io.find_one(
-        {"type": "version", "parent": subset["_id"]},
-        projection=version_projection,
-        sort=[("name", -1)],
-    )
+    version = get_latest_versions(
+        [subset["_id"]], projection=version_projection
+    ).get(subset["_id"])
 
     assert version, "No version found, this is a bug"
 
     return version
+
+
+class FileTransfers(object):
+    """Copy or hardlink many files at once with bounded parallelism.
+
+    Transfers are registered with `add` and executed with `process`. Each
+    destination directory is created only once, copied files are verified
+    by size (optionally by checksum) and failed transfers are retried with
+    exponential backoff.
+
+    Args:
+        workers (int): Number of worker threads. Defaults to `cpu_count`
+            capped to 8.
+        verify (str): Verification of copied files. One of "size",
+            "checksum" or `None` to skip verification.
+        retries (int): How many times is transfer retried before it fails.
+        retry_delay (float): Initial delay between retries in seconds,
+            doubled after each failed attempt.
+        log (logging.Logger): Logger used for progress report.
+    """
+
+    verify_modes = ("size", "checksum", None)
+    report_interval = 5.0
+
+    def __init__(
+        self, workers=None, verify="size", retries=3, retry_delay=0.5,
+        log=None
+    ):
+        if verify not in self.verify_modes:
+            raise ValueError("Unknown verify mode \"{}\". Expected {}".format(
+                verify, ", ".join(str(mode) for mode in self.verify_modes)
+            ))
+
+        if not workers:
+            try:
+                import multiprocessing
+                workers = min(multiprocessing.cpu_count(), 8)
+            except NotImplementedError:
+                workers = 4
+
+        self.workers = max(int(workers), 1)
+        self.verify = verify
+        self.retries = max(int(retries), 0)
+        self.retry_delay = retry_delay
+        self.log = log or logging.getLogger(self.__class__.__name__)
+
+        self._transfers = []
+        self._created_dirs = set()
+
+    def add(self, src, dst, mode="copy"):
+        """Register transfer of `src` to `dst`.
+
+        Args:
+            src (str): Source file path.
+            dst (str): Destination file path.
+            mode (str): "copy" or "hardlink".
+        """
+        if mode not in ("copy", "hardlink"):
+            raise ValueError("Unknown transfer mode \"{}\"".format(mode))
+        self._transfers.append(
+            (os.path.normpath(src), os.path.normpath(dst), mode)
+        )
+
+    def __len__(self):
+        return len(self._transfers)
+
+    def process(self):
+        """Execute all registered transfers.
+
+        Returns:
+            dict: Report with "files", "bytes" and "seconds" keys.
+
+        Raises:
+            RuntimeError: When any transfer failed after all retries.
+        """
+        transfers, self._transfers = self._transfers, []
+        report = {"files": 0, "bytes": 0, "seconds": 0.0}
+        if not transfers:
+            return report
+
+        self._make_dirs(os.path.dirname(dst) for _, dst, _ in transfers)
+
+        jobs = queue.Queue()
+        for item in transfers:
+            jobs.put(item)
+
+        lock = threading.Lock()
+        errors = []
+        start = time.time()
+        state = {"last_report": start}
+
+        def worker():
+            while not errors:
+                try:
+                    src, dst, mode = jobs.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    size = self._transfer_with_retry(src, dst, mode)
+                except Exception as exc:
+                    with lock:
+                        errors.append((src, dst, exc))
+                    return
+
+                with lock:
+                    report["files"] += 1
+                    report["bytes"] += size
+                    now = time.time()
+                    if now - state["last_report"] >= self.report_interval:
+                        state["last_report"] = now
+                        self._log_progress(
+                            report, len(transfers), now - start
+                        )
+
+        threads = []
+        for _ in range(min(self.workers, len(transfers))):
+            thread = threading.Thread(target=worker)
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        report["seconds"] = time.time() - start
+        if errors:
+            src, dst, exc = errors[0]
+            raise RuntimeError(
+                "Failed to transfer {} file/s. First failure \"{}\" -> \"{}\""
+                ": {}".format(len(errors), src, dst, exc)
+            )
+
+        self._log_progress(report, len(transfers), report["seconds"])
+        return report
+
+    def _log_progress(self, report, total, seconds):
+        mb_per_sec = 0.0
+        if seconds > 0:
+            mb_per_sec = report["bytes"] / (1024.0 * 1024.0) / seconds
+        self.log.info(
+            "Transferred {}/{} files ({:.1f} MB) in {:.1f}s ({:.1f} MB/s)"
+            .format(
+                report["files"], total,
+                report["bytes"] / (1024.0 * 1024.0), seconds, mb_per_sec
+            )
+        )
+
+    def _make_dirs(self, dirpaths):
+        for dirpath in set(dirpaths):
+            if not dirpath or dirpath in self._created_dirs:
+                continue
+            try:
+                os.makedirs(dirpath)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    self.log.critical(
+                        "Couldn't create directory \"{}\"".format(dirpath)
+                    )
+                    raise
+            self._created_dirs.add(dirpath)
+
+    def _transfer_with_retry(self, src, dst, mode):
+        delay = self.retry_delay
+        attempt = 0
+        while True:
+            try:
+                if mode == "hardlink":
+                    return self._hardlink(src, dst)
+                return self._copy(src, dst)
+            except Exception as exc:
+                attempt += 1
+                if attempt > self.retries:
+                    raise
+                self.log.warning(
+                    "Transfer \"{}\" -> \"{}\" failed ({}). Retrying in"
+                    " {:.1f}s ({}/{})".format(
+                        src, dst, exc, delay, attempt, self.retries
+                    )
+                )
+                time.sleep(delay)
+                delay *= 2
+
+    def _hardlink(self, src, dst):
+        filelink.create(src, dst, filelink.HARDLINK)
+        return os.path.getsize(dst)
+
+    def _copy(self, src, dst):
+        if os.path.exists(dst) and os.path.samefile(src, dst):
+            # Destination is hardlink or same file as source, break the link
+            # so the published file is independent on the source
+            self.log.debug("Files are the same {} to {}".format(src, dst))
+            os.remove(dst)
+            shutil.copyfile(src, dst)
+        else:
+            copyfile(src, dst)
+
+        src_size = os.path.getsize(src)
+        if self.verify is None:
+            return src_size
+
+        dst_size = os.path.getsize(dst)
+        if src_size != dst_size:
+            raise IOError(
+                "Size mismatch of copied file \"{}\" ({} != {})".format(
+                    dst, src_size, dst_size
+                )
+            )
+
+        if self.verify == "checksum":
+            if file_checksum(src) != file_checksum(dst):
+                raise IOError(
+                    "Checksum mismatch of copied file \"{}\"".format(dst)
+                )
+        return src_size
+
+
+def file_checksum(filepath, algorithm="sha1", chunk_size=1024 * 1024):
+    """Return hex digest of file content.
+
+    Args:
+        filepath (str): Path to file.
+        algorithm (str): Name of `hashlib` algorithm.
+        chunk_size (int): Size of chunks read from file.
+    """
+    hasher = hashlib.new(algorithm)
+    with open(filepath, "rb") as stream:
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+class PresetsCache(object):
+    """In-process cache of presets loaded with `config.get_presets`.
+
+    Presets are cached by project name and project overrides directory.
+    Cached presets are reloaded when any preset or anatomy file (json/yaml)
+    in default config or in project overrides directory is added, removed
+    or modified. Files are checked at most once per `check_interval`
+    seconds.
+
+    Args:
+        check_interval (float): Min seconds between checks of preset files.
+    """
+
+    def __init__(self, check_interval=2.0):
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._cache = {}
+
+    def get(self, project_name=None):
+        """Presets of project, returned copy can be modified.
+
+        Args:
+            project_name (str): Name of project. Project from "AVALON_PROJECT"
+                environment is used if not passed.
+        """
+        return copy.deepcopy(self._get(project_name))
+
+    def get_value(self, *keys, **kwargs):
+        """Copy of preset value under passed keys.
+
+        Args:
+            keys (str): Keys leading to value in presets.
+            project_name (str): Name of project.
+            default (object): Returned when value is not found.
+        """
+        value = self._get(kwargs.get("project_name"))
+        for key in keys:
+            if not isinstance(value, dict) or key not in value:
+                return kwargs.get("default")
+            value = value[key]
+        return copy.deepcopy(value)
+
+    def signature(self, project_name=None):
+        """Signature of preset and anatomy files of project.
+
+        Signature changes when presets or anatomy templates of project are
+        changed so it can be used for invalidation of values computed from
+        them.
+        """
+        return self._get_item(project_name)["signature"]
+
+    def clear(self):
+        with self._lock:
+            self._cache.clear()
+
+    def _get(self, project_name):
+        return self._get_item(project_name)["presets"]
+
+    def _get_item(self, project_name):
+        if not project_name:
+            project_name = os.environ.get("AVALON_PROJECT") or None
+
+        overrides_dir = None
+        if project_name:
+            try:
+                overrides_dir = project_overrides_dir_path(project_name)
+            except Exception:
+                overrides_dir = None
+
+        key = (project_name, overrides_dir)
+        now = time.time()
+        with self._lock:
+            item = self._cache.get(key)
+            if (
+                item is not None
+                and now - item["checked"] < self.check_interval
+            ):
+                return item
+
+            signature = self._signature(overrides_dir)
+            if item is None or item["signature"] != signature:
+                item = {
+                    "presets": config.get_presets(project=project_name),
+                    "signature": signature
+                }
+                self._cache[key] = item
+            item["checked"] = now
+            return item
+
+    # Extensions of files included in signature (presets and anatomy)
+    signature_extensions = (".json", ".yaml", ".yml")
+
+    def _signature(self, overrides_dir):
+        """Count, last modification time and size of config files.
+
+        Preset files and anatomy templates of default config and of project
+        overrides are included.
+        """
+        config_dir = os.environ.get("PYPE_CONFIG") or ""
+        dirpaths = [
+            os.path.join(config_dir, "presets"),
+            os.path.join(config_dir, "anatomy")
+        ]
+        if overrides_dir:
+            dirpaths.append(overrides_dir)
+
+        signature = []
+        for dirpath in dirpaths:
+            count = 0
+            latest = 0
+            size = 0
+            for root, _, filenames in os.walk(dirpath):
+                for filename in filenames:
+                    if not filename.endswith(self.signature_extensions):
+                        continue
+                    try:
+                        stat = os.stat(os.path.join(root, filename))
+                    except OSError:
+                        continue
+                    count += 1
+                    latest = max(latest, stat.st_mtime)
+                    size += stat.st_size
+            signature.append((count, latest, size))
+        return tuple(signature)
+
+
+_presets_cache = None
+
+
+def get_presets_cache():
+    """Global presets cache.
+
+    Interval of preset files check can be changed with environment
+    "PYPE_PRESETS_CHECK_INTERVAL" (seconds).
+    """
+    global _presets_cache
+    if _presets_cache is None:
+        _presets_cache = PresetsCache(
+            float(os.environ.get("PYPE_PRESETS_CHECK_INTERVAL") or 2.0)
+        )
+    return _presets_cache
+
+
+def get_presets(project_name=None):
+    """Cached variant of `config.get_presets`.
+
+    Returns:
+        dict: Copy of presets which can be modified.
+    """
+    return get_presets_cache().get(project_name)
+
+
+def get_preset_value(*keys, **kwargs):
+    """Cached preset value under passed keys.
+
+    Args:
+        keys (str): Keys leading to value in presets.
+        project_name (str): Name of project.
+        default (object): Returned when value is not found.
+    """
+    return get_presets_cache().get_value(*keys, **kwargs)
+
+
+def get_plugins_presets(host_name, plugin_type, project_name=None):
+    """Presets of plugins of type (e.g. "publish") for host."""
+    return get_preset_value(
+        "plugins", host_name, plugin_type,
+        project_name=project_name, default={}
+    )
+
+
+def get_ftrack_config_presets(project_name=None):
+    """Presets of ftrack configuration ("ftrack/ftrack_config.json")."""
+    return get_preset_value(
+        "ftrack", "ftrack_config", project_name=project_name, default={}
+    )
+
+
+def get_burnin_presets(project_name=None):
+    """Presets of burnins ("tools/burnins.json")."""
+    return get_preset_value(
+        "tools", "burnins", project_name=project_name, default={}
+    )
+
+
+# Positions of burnin values in burnin definitions
+BURNIN_POSITIONS = (
+    "top_left", "top_centered", "top_right",
+    "bottom_right", "bottom_centered", "bottom_left"
+)
+
+# Default options for burnins for cases that are not set in presets
+DEFAULT_BURNIN_OPTIONS = {
+    "opacity": 1,
+    "x_offset": 5,
+    "y_offset": 5,
+    "bg_padding": 5,
+    "bg_opacity": 0.5,
+    "font_size": 42
+}
+
+
+def prepare_burnin_basic_data(instance, logger=None):
+    """Pick data from instance for processing and for burnin strings.
+
+    Shared by `ExtractBurnin` and burnins of `ExtractReview` so burnins
+    are filled with the same data.
+
+    Args:
+        instance (pyblish.api.Instance): Currently processed instance.
+        logger (logging.Logger): Logger for warnings.
+
+    Returns:
+        tuple: `(burnin_data, temp_data)` - `burnin_data` contain data for
+            filling burnin strings. `temp_data` are for repre pre-process
+            preparation.
+    """
+    logger = logger or log
+    context = instance.context
+
+    version = instance.data.get("version")
+    if version is None:
+        version = context.data.get("version")
+
+    frame_start = instance.data.get("frameStart")
+    if frame_start is None:
+        logger.warning("Key \"frameStart\" is not set. Setting to \"0\".")
+        frame_start = 0
+    frame_start = int(frame_start)
+
+    frame_end = instance.data.get("frameEnd")
+    if frame_end is None:
+        logger.warning("Key \"frameEnd\" is not set. Setting to \"1\".")
+        frame_end = 1
+    frame_end = int(frame_end)
+
+    handles = instance.data.get("handles")
+    if handles is None:
+        handles = context.data.get("handles")
+        if handles is None:
+            handles = 0
+
+    handle_start = instance.data.get("handleStart")
+    if handle_start is None:
+        handle_start = context.data.get("handleStart")
+        if handle_start is None:
+            handle_start = handles
+
+    handle_end = instance.data.get("handleEnd")
+    if handle_end is None:
+        handle_end = context.data.get("handleEnd")
+        if handle_end is None:
+            handle_end = handles
+
+    frame_start_handle = frame_start - handle_start
+    frame_end_handle = frame_end + handle_end
+
+    burnin_data = copy.deepcopy(instance.data["anatomyData"])
+
+    if "slate.farm" in instance.data["families"]:
+        frame_start_handle += 1
+
+    burnin_data.update({
+        "version": int(version),
+        "comment": context.data.get("comment") or ""
+    })
+
+    intent_label = context.data.get("intent")
+    if intent_label and isinstance(intent_label, dict):
+        intent_label = intent_label.get("label")
+
+    if intent_label:
+        burnin_data["intent"] = intent_label
+
+    temp_data = {
+        "frame_start": frame_start,
+        "frame_end": frame_end,
+        "frame_start_handle": frame_start_handle,
+        "frame_end_handle": frame_end_handle
+    }
+
+    return burnin_data, temp_data
+
+
+def prepare_burnin_repre_data(instance, repre, burnin_data, temp_data):
+    """Add representation specific data to burnin data.
+
+    Args:
+        instance (pyblish.api.Instance): Currently processed Instance.
+        repre (dict): Currently processed representation.
+        burnin_data (dict): Copy of basic burnin data based on instance
+            data.
+        temp_data (dict): Copy of basic temp data.
+    """
+    # Add representation name to burnin data
+    burnin_data["representation"] = repre["name"]
+
+    # no handles switch from profile tags
+    if "no-handles" in repre["tags"]:
+        burnin_frame_start = temp_data["frame_start"]
+        burnin_frame_end = temp_data["frame_end"]
+
+    else:
+        burnin_frame_start = temp_data["frame_start_handle"]
+        burnin_frame_end = temp_data["frame_end_handle"]
+
+    burnin_duration = burnin_frame_end - burnin_frame_start + 1
+
+    burnin_data.update({
+        "frame_start": burnin_frame_start,
+        "frame_end": burnin_frame_end,
+        "duration": burnin_duration,
+    })
+    temp_data["duration"] = burnin_duration
+
+    # Add values for slate frames
+    burnin_slate_frame_start = burnin_frame_start
+
+    # Move frame start by 1 frame when slate is used.
+    if (
+        "slate" in instance.data["families"]
+        and "slate-frame" in repre["tags"]
+    ):
+        burnin_slate_frame_start -= 1
+
+    burnin_data.update({
+        "slate_frame_start": burnin_slate_frame_start,
+        "slate_frame_end": burnin_frame_end,
+        "slate_duration": (
+            burnin_frame_end - burnin_slate_frame_start + 1
+        )
+    })
+
+
+def prepare_burnin_options_and_values(
+    burnin_def, default_options=None, options=None, fields=None
+):
+    """Burnin options and values of burnin definition.
+
+    Options are `default_options` overridden by `options` presets and by
+    "options" of burnin definition. Values are `fields` presets overridden
+    by positions of burnin definition, position set to `None` is removed.
+
+    Args:
+        burnin_def (dict): Burnin definition.
+        default_options (dict): Default burnin options.
+        options (dict): Burnin options from presets.
+        fields (dict): Burnin values from presets.
+
+    Returns:
+        tuple: Burnin options and burnin values by position.
+    """
+    burnin_options = copy.deepcopy(default_options or {})
+    for _options in (options, burnin_def.get("options")):
+        for key, value in (_options or {}).items():
+            if value is not None:
+                burnin_options[key] = value
+
+    burnin_values = {}
+    for key, value in (fields or {}).items():
+        key_low = key.lower()
+        if key_low in BURNIN_POSITIONS and value is not None:
+            burnin_values[key_low] = value
+
+    for key, value in burnin_def.items():
+        key_low = key.lower()
+        if key_low not in BURNIN_POSITIONS:
+            continue
+
+        if value is not None:
+            burnin_values[key_low] = value
+
+        elif key_low in burnin_values:
+            burnin_values.pop(key_low)
+
+    return burnin_options, burnin_values
+
+
+class ProfilesMatcher(object):
+    """Find most matching preset profile by host, task and family.
+
+    Profiles are filtered with keys "hosts", "tasks" and "families" where
+    each item of their lists is a regex. Regexes are compiled once, matches of
+    each filter value are indexed and result for each combination of
+    (host, task, family) is memoized so repeated lookups for many instances
+    are cheap.
+
+    Each profile gets 1 point for each matching filter. Profile with most
+    points is returned. When more profiles have same points then profile with
+    set host filter is preferred, then with set task filter and then with set
+    family filter. Otherwise first of them is used.
+
+    Args:
+        profiles (list): Profiles definition from presets.
+        logger (logging.Logger): Logger used for matching messages.
+    """
+    filter_keys = ("hosts", "tasks", "families")
+
+    def __init__(self, profiles, logger=None):
+        self.profiles = profiles
+        self.log = logger or log
+        # Filter which is not set (missing or empty list) is stored as
+        # `None`, filter with only empty or invalid items does not match
+        # any value
+        self._filters = [
+            tuple(
+                self.compile_list_of_regexes(profile[key])
+                if profile.get(key) else None
+                for key in self.filter_keys
+            )
+            for profile in profiles or tuple()
+        ]
+        self._value_index = {}
+        self._results = {}
+
+    def compile_list_of_regexes(self, in_list):
+        """Convert strings in entered list to compiled regex objects."""
+        regexes = []
+        if not in_list:
+            return regexes
+
+        for item in in_list:
+            if not item:
+                continue
+
+            try:
+                regexes.append(re.compile(item))
+            except TypeError:
+                self.log.warning((
+                    "Invalid type \"{}\" value \"{}\"."
+                    " Expected string based object. Skipping."
+                ).format(str(type(item)), str(item)))
+
+        return regexes
+
+    def _value_matches(self, filter_idx, value):
+        """Match value against filter of each profile.
+
+        Returns:
+            tuple: For each profile `0` when filter is not set, `1` when any
+                regex match value and `-1` when none of regexes match.
+        """
+        key = (filter_idx, value)
+        matches = self._value_index.get(key)
+        if matches is not None:
+            return matches
+
+        _value = value or ""
+        matches = []
+        for filters in self._filters:
+            regexes = filters[filter_idx]
+            if regexes is None:
+                matches.append(0)
+                continue
+
+            match = -1
+            for regex in regexes:
+                if regex.match(_value):
+                    match = 1
+                    break
+            matches.append(match)
+
+        matches = tuple(matches)
+        self._value_index[key] = matches
+        return matches
+
+    def find_matching_profile(self, host_name, task_name, family):
+        """Most matching profile for entered host, task and family.
+
+        Args:
+            host_name (str): Current running host name.
+            task_name (str): Current context task name.
+            family (str): Main family of current Instance.
+
+        Returns:
+            dict/None: Return most matching profile or None if none of profiles
+                match at least one criteria.
+        """
+        key = (host_name, task_name, family)
+        if key in self._results:
+            idx = self._results[key]
+        else:
+            idx = self._find_profile_index(host_name, task_name, family)
+            self._results[key] = idx
+
+        if idx is None:
+            return None
+        return self.profiles[idx]
+
+    def _find_profile_index(self, host_name, task_name, family):
+        if not self._filters:
+            return None
+
+        values = (host_name, task_name, family)
+        all_matches = [
+            self._value_matches(filter_idx, value)
+            for filter_idx, value in enumerate(values)
+        ]
+
+        matching = []
+        highest_points = -1
+        for profile_idx in range(len(self._filters)):
+            profile_value = [matches[profile_idx] for matches in all_matches]
+            if -1 in profile_value:
+                continue
+
+            profile_points = sum(profile_value)
+            if profile_points < highest_points:
+                continue
+
+            if profile_points > highest_points:
+                matching = []
+                highest_points = profile_points
+
+            matching.append(
+                (profile_idx, [bool(match) for match in profile_value])
+            )
+
+        if not matching:
+            self.log.warning((
+                "None of profiles match your setup."
+                " Host \"{}\" | Task: \"{}\" | Family: \"{}\""
+            ).format(host_name, task_name, family))
+            return None
+
+        if len(matching) > 1:
+            self.log.info(
+                "Search for first most matching profile in match order:"
+                " Host name -> Task name -> Family."
+            )
+            # Filter profiles with matching host if there are any then
+            # filter by task name and lastly by family.
+            for value_idx in range(len(values)):
+                matching_true = [
+                    item for item in matching if item[1][value_idx]
+                ]
+                if matching_true:
+                    matching = matching_true
+                if len(matching) == 1:
+                    break
+
+        return matching[0][0]
+
+
+_profiles_matchers = {}
+
+
+def get_profiles_matcher(profiles, logger=None):
+    """Shared `ProfilesMatcher` for profiles object.
+
+    Profiles are set on plugins from presets once so matcher is kept for
+    each profiles object and reused by all processed instances.
+    """
+    key = id(profiles)
+    item = _profiles_matchers.get(key)
+    # Keep profiles in cache item so id can't be reused by other object
+    if item is not None and item[0] is profiles:
+        return item[1]
+
+    if len(_profiles_matchers) > 32:
+        _profiles_matchers.clear()
+
+    matcher = ProfilesMatcher(profiles, logger)
+    _profiles_matchers[key] = (profiles, matcher)
+    return matcher
+
+
+_last_workfiles = {}
+
+
+def get_last_workfile(
+    workdir, file_template, fill_data, extensions, full_path=False
+):
+    """Cached variant of `avalon.api.last_workfile`.
+
+    Result is cached by modification time of work directory so directory is
+    listed only when files in it were added, removed or renamed.
+
+    Args:
+        workdir (str): Path to work directory.
+        file_template (str): Workfile template from anatomy.
+        fill_data (dict): Data for filling of template.
+        extensions (list): Workfile extensions of host.
+        full_path (bool): Return full path instead of filename.
+    """
+    try:
+        dir_mtime = os.stat(workdir).st_mtime
+    except OSError:
+        dir_mtime = None
+
+    key = (
+        workdir,
+        file_template,
+        json.dumps(fill_data, sort_keys=True, default=str),
+        tuple(extensions),
+        full_path
+    )
+    item = _last_workfiles.get(key)
+    if item is not None and item[0] == dir_mtime:
+        return item[1]
+
+    result = avalon.api.last_workfile(
+        workdir, file_template, fill_data, extensions, full_path
+    )
+    # Modification time may have low resolution on some file systems so
+    # don't trust listing of directory which was just modified
+    if dir_mtime is not None and time.time() - dir_mtime > 2:
+        if len(_last_workfiles) > 500:
+            _last_workfiles.clear()
+        _last_workfiles[key] = (dir_mtime, result)
+    return result
+
+
+class TextureHashRegistry(object):
+    """Index of published texture paths by source hash of texture.
+
+    Registry is stored in "texture_hashes" collection of avalon database
+    with unique index on project name and hash. Document for each hash:
+        {
+            "project": "<project name>",
+            "hash": "<source hash>",
+            "paths": ["<published path>", ...],
+            "version_ids": [<ObjectId of version>, ...]
+        }
+
+    Hashes are registered by integrator when version with "sourceHashes"
+    is stored. Versions published before registry existed are registered
+    with `backfill` which stores marker document of project:
+        {
+            "project": "<project name>",
+            "hash": None,
+            "backfilled": <datetime>
+        }
+    Until project is backfilled are hashes missing in registry looked up
+    with one query over versions and registered.
+
+    Args:
+        project_name (str): Name of project. Current session project is used
+            if not entered.
+        database (pymongo.database.Database): Avalon database.
+    """
+
+    collection_name = "texture_hashes"
+    # Databases where index was already ensured in this process
+    _indexed_databases = set()
+
+    def __init__(self, project_name=None, database=None):
+        self.database = database or get_avalon_database()
+        self.project_name = project_name or io.Session["AVALON_PROJECT"]
+        self._is_backfilled = None
+
+    @property
+    def is_backfilled(self):
+        """Versions of project were registered with `backfill`."""
+        if not self._is_backfilled:
+            self._is_backfilled = self.collection.find_one(
+                {"project": self.project_name, "hash": None},
+                {"_id": True}
+            ) is not None
+        return self._is_backfilled
+
+    @property
+    def collection(self):
+        collection = self.database[self.collection_name]
+        if self.database.name not in self._indexed_databases:
+            collection.create_index(
+                [("project", 1), ("hash", 1)], unique=True
+            )
+            self._indexed_databases.add(self.database.name)
+        return collection
+
+    def register(self, source_hashes, version_id):
+        """Register published paths of source hashes.
+
+        Args:
+            source_hashes (dict): Published path by source hash.
+            version_id (ObjectId): Id of version which published paths.
+        """
+        bulk_writes = []
+        for texture_hash, path in source_hashes.items():
+            bulk_writes.append(UpdateOne(
+                {"project": self.project_name, "hash": texture_hash},
+                {"$addToSet": {"paths": path, "version_ids": version_id}},
+                upsert=True
+            ))
+
+        if bulk_writes:
+            self.collection.bulk_write(bulk_writes, ordered=False)
+
+    def find_paths(self, texture_hashes, fallback=None):
+        """Published paths of multiple source hashes in one query.
+
+        Args:
+            texture_hashes (list): Source hashes.
+            fallback (bool): Look for hashes missing in registry in version
+                documents and register them. Versions are scanned only if
+                project was not backfilled when not entered.
+
+        Returns:
+            dict: List of published paths by source hash. Hashes which were
+                not published are not in output.
+        """
+        texture_hashes = list(set(texture_hashes))
+        output = {}
+        if not texture_hashes:
+            return output
+
+        for doc in self.collection.find(
+            {"project": self.project_name, "hash": {"$in": texture_hashes}},
+            {"hash": True, "paths": True}
+        ):
+            output[doc["hash"]] = doc["paths"]
+
+        missing = [
+            texture_hash
+            for texture_hash in texture_hashes
+            if texture_hash not in output
+        ]
+        if fallback is None:
+            fallback = not self.is_backfilled
+
+        if missing and fallback:
+            for texture_hash, paths in self._find_in_versions(missing).items():
+                output[texture_hash] = paths
+        return output
+
+    def _find_in_versions(self, texture_hashes):
+        keys = [
+            "data.sourceHashes.{}".format(texture_hash)
+            for texture_hash in texture_hashes
+        ]
+        projection = {key: True for key in keys}
+        versions = self.database[self.project_name].find(
+            {
+                "type": "version",
+                "$or": [{key: {"$exists": True}} for key in keys]
+            },
+            projection
+        )
+
+        output = collections.defaultdict(list)
+        for version in versions:
+            source_hashes = version["data"]["sourceHashes"]
+            self.register(source_hashes, version["_id"])
+            for texture_hash, path in source_hashes.items():
+                if path not in output[texture_hash]:
+                    output[texture_hash].append(path)
+        return dict(output)
+
+    def backfill(self):
+        """Register source hashes of all versions of project.
+
+        Returns:
+            int: Number of processed versions.
+        """
+        versions = self.database[self.project_name].find(
+            {"type": "version", "data.sourceHashes": {"$exists": True}},
+            {"data.sourceHashes": True}
+        )
+        count = 0
+        for version in versions:
+            source_hashes = version["data"].get("sourceHashes")
+            if source_hashes:
+                self.register(source_hashes, version["_id"])
+                count += 1
+
+        self.collection.update_one(
+            {"project": self.project_name, "hash": None},
+            {"$set": {"backfilled": datetime.datetime.utcnow()}},
+            upsert=True
+        )
+        self._is_backfilled = True
+        return count
+
+
+class ContainerVersionResolver(object):
+    """Batch resolver of versions of loaded containers.
+
+    Resolves representation ids of containers to their version and to the
+    latest version of their subset. Any number of representations is
+    resolved with three queries - representations, versions and
+    aggregation of highest version name per subset. Results are cached for
+    `ttl` seconds so repeated inventory checks don't query database again.
+
+    Resolved information is a dictionary:
+        {
+            "version_id": <ObjectId of version>,
+            "subset_id": <ObjectId of subset>,
+            "version": <version name, None for master version>,
+            "latest": <highest version name of subset>,
+            "is_latest": <bool>
+        }
+
+    Args:
+        ttl (float): Seconds for which resolved information is valid.
+        database (pymongo.database.Database): Avalon database.
+    """
+
+    def __init__(self, ttl=10.0, database=None):
+        self.ttl = ttl
+        self._database = database
+        self._lock = threading.Lock()
+        # {(project name, id type, id string): (expiration time, info)}
+        self._cache = {}
+
+    @property
+    def database(self):
+        if self._database is None:
+            self._database = get_avalon_database()
+        return self._database
+
+    def resolve(self, representation_ids, project_name=None):
+        """Version information of representations.
+
+        Args:
+            representation_ids (list): Ids of representations (str or
+                ObjectId).
+            project_name (str): Name of project. Session project is used
+                if not entered.
+
+        Returns:
+            dict: Information by representation id as string. Value is
+                `None` for representations missing in database.
+        """
+        project_name = project_name or io.Session["AVALON_PROJECT"]
+        output, missing = self._from_cache(
+            project_name, "representation", representation_ids
+        )
+        if not missing:
+            return output
+
+        repre_docs = self.database[project_name].find(
+            {
+                "type": "representation",
+                "_id": {"$in": list(missing.values())}
+            },
+            {"parent": True}
+        )
+        version_id_by_repre_id = {
+            str(repre_doc["_id"]): repre_doc["parent"]
+            for repre_doc in repre_docs
+        }
+        infos_by_version_id = self.resolve_versions(
+            version_id_by_repre_id.values(), project_name
+        )
+
+        resolved = {}
+        for repre_id in missing:
+            version_id = version_id_by_repre_id.get(repre_id)
+            info = None
+            if version_id is not None:
+                info = infos_by_version_id.get(str(version_id))
+            resolved[repre_id] = info
+
+        self._store(project_name, "representation", resolved)
+        output.update(resolved)
+        return output
+
+    def resolve_versions(self, version_ids, project_name=None):
+        """Version information of versions or master versions.
+
+        Args:
+            version_ids (list): Ids of versions (str or ObjectId).
+            project_name (str): Name of project.
+
+        Returns:
+            dict: Information by version id as string. Value is `None` for
+                versions missing in database.
+        """
+        project_name = project_name or io.Session["AVALON_PROJECT"]
+        output, missing = self._from_cache(
+            project_name, "version", version_ids
+        )
+        if not missing:
+            return output
+
+        collection = self.database[project_name]
+        version_docs = list(collection.find(
+            {
+                "type": {"$in": ["version", "master_version"]},
+                "_id": {"$in": list(missing.values())}
+            },
+            {"name": True, "parent": True, "type": True}
+        ))
+        subset_ids = list({doc["parent"] for doc in version_docs})
+        latest_by_subset_id = {}
+        if subset_ids:
+            latest_by_subset_id = {
+                doc["_id"]: doc["latest"]
+                for doc in collection.aggregate([
+                    {"$match": {
+                        "type": "version",
+                        "parent": {"$in": subset_ids}
+                    }},
+                    {"$group": {
+                        "_id": "$parent",
+                        "latest": {"$max": "$name"}
+                    }}
+                ])
+            }
+
+        resolved = {version_id: None for version_id in missing}
+        for version_doc in version_docs:
+            subset_id = version_doc["parent"]
+            latest = latest_by_subset_id.get(subset_id)
+            is_master = version_doc["type"] == "master_version"
+            name = None if is_master else version_doc["name"]
+            resolved[str(version_doc["_id"])] = {
+                "version_id": version_doc["_id"],
+                "subset_id": subset_id,
+                "version": name,
+                "latest": latest,
+                # Master version always points to the latest version
+                "is_latest": is_master or name == latest
+            }
+
+        self._store(project_name, "version", resolved)
+        output.update(resolved)
+        return output
+
+    def outdated(self, representation_ids, project_name=None):
+        """Ids of representations which are not of the latest version.
+
+        Representations missing in database are not considered outdated.
+
+        Returns:
+            set: Ids of outdated representations as strings.
+        """
+        return {
+            repre_id
+            for repre_id, info in self.resolve(
+                representation_ids, project_name
+            ).items()
+            if info and not info["is_latest"]
+        }
+
+    def invalidate(self, project_name=None):
+        """Clear cached information of project or of all projects."""
+        with self._lock:
+            if project_name is None:
+                self._cache.clear()
+                return
+            for key in list(self._cache.keys()):
+                if key[0] == project_name:
+                    self._cache.pop(key, None)
+
+    def _from_cache(self, project_name, id_type, ids):
+        output = {}
+        missing = {}
+        now = time.time()
+        with self._lock:
+            for _id in ids:
+                str_id = str(_id)
+                if str_id in output or str_id in missing:
+                    continue
+
+                cached = self._cache.get((project_name, id_type, str_id))
+                if cached is not None and cached[0] > now:
+                    output[str_id] = cached[1]
+                    continue
+
+                try:
+                    missing[str_id] = io.ObjectId(str_id)
+                except Exception:
+                    # Invalid id can't be in database
+                    output[str_id] = None
+        return output, missing
+
+    def _store(self, project_name, id_type, infos):
+        expiration = time.time() + self.ttl
+        with self._lock:
+            for str_id, info in infos.items():
+                self._cache[(project_name, id_type, str_id)] = (
+                    expiration, info
+                )
+
+
+_container_resolver = None
+
+
+def get_container_resolver():
+    """Global container version resolver.
+
+    Cache time of resolved versions can be changed with environment
+    "PYPE_CONTAINER_RESOLVER_TTL" (seconds).
+    """
+    global _container_resolver
+    if _container_resolver is None:
+        _container_resolver = ContainerVersionResolver(
+            float(os.environ.get("PYPE_CONTAINER_RESOLVER_TTL") or 10.0)
+        )
+    return _container_resolver
+
+
+def get_outdated_containers(containers=None):
+    """Containers which are not of the latest version.
+
+    All containers are resolved at once with `ContainerVersionResolver`.
+
+    Args:
+        containers (list): Containers to check. Containers of registered
+            host are used if not entered.
+
+    Returns:
+        list: Outdated containers.
+    """
+    if containers is None:
+        containers = avalon.api.registered_host().ls()
+    containers = list(containers)
+
+    infos = get_container_resolver().resolve(
+        container["representation"] for container in containers
+    )
+    outdated = []
+    for container in containers:
+        info = infos.get(str(container["representation"]))
+        if info is None:
+            log.debug("Container '{}' has an invalid representation, it is"
+                      " missing in the database".format(
+                          container.get("objectName")
+                      ))
+        elif not info["is_latest"]:
+            outdated.append(container)
+    return outdated
+
+
+def list_directory(directory):
+    """Names of files in directory.
+
+    Uses `os.scandir` (or `scandir` module) which knows type of entry
+    without additional stat call on most platforms. Without scandir
+    `os.listdir` is used and subdirectories are not filtered out to avoid
+    stat call per file.
+
+    Raises:
+        OSError: When directory does not exist or can't be listed.
+    """
+    if _scandir is None:
+        return os.listdir(directory)
+
+    output = []
+    for entry in _scandir(directory):
+        try:
+            if entry.is_file():
+                output.append(entry.name)
+        except OSError:
+            continue
+    return output
+
+
+def scan_directory(directory):
+    """Files of directory with their size and modification time.
+
+    Uses `os.scandir` (or `scandir` module) so stat data comes with the
+    listing where platform allows it.
+
+    Args:
+        directory (str): Path to directory.
+
+    Returns:
+        dict: Tuple of size and modification time by file name.
+
+    Raises:
+        OSError: When directory does not exist or can't be listed.
+    """
+    output = {}
+    if _scandir is None:
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                # File was removed in the meantime
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                output[name] = (file_stat.st_size, file_stat.st_mtime)
+        return output
+
+    for entry in _scandir(directory):
+        try:
+            if not entry.is_file():
+                continue
+            file_stat = entry.stat()
+        except OSError:
+            continue
+        output[entry.name] = (file_stat.st_size, file_stat.st_mtime)
+    return output
+
+
+def frame_ranges(frames):
+    """Continuous ranges of frames.
+
+    Args:
+        frames (iterable): Frame numbers.
+
+    Returns:
+        list: Tuples of first and last frame of each range.
+    """
+    ranges = []
+    for frame in sorted(set(frames)):
+        if ranges and frame == ranges[-1][1] + 1:
+            ranges[-1][1] = frame
+        else:
+            ranges.append([frame, frame])
+    return [tuple(frame_range) for frame_range in ranges]
+
+
+def describe_collection(collection):
+    """Frame information of clique collection.
+
+    Returns:
+        dict: Head, tail, padding, frames, first and last frame, missing
+            frames ("holes") and continuous ranges of frames.
+    """
+    frames = sorted(collection.indexes)
+    holes = []
+    if frames:
+        holes = sorted(
+            set(range(frames[0], frames[-1] + 1)) - set(frames)
+        )
+    return {
+        "collection": collection,
+        "head": collection.head,
+        "tail": collection.tail,
+        "padding": collection.padding,
+        "frames": frames,
+        "frameStart": frames[0] if frames else None,
+        "frameEnd": frames[-1] if frames else None,
+        "holes": holes,
+        "ranges": frame_ranges(frames)
+    }
+
+
+class SequenceScanner(object):
+    """Cached directory listings and frame sequence assembling.
+
+    Each directory is listed only once and the listing is cached until the
+    directory is invalidated. Stat data of files are collected only when
+    requested with `entries`. Code which writes into a directory (renders,
+    integration) should invalidate it so following readers list it again.
+
+    Scanner shared by plugins of pyblish context is available with
+    `get_sequence_scanner(context)`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._listings = {}
+        self._entries = {}
+
+    @staticmethod
+    def _key(directory):
+        return os.path.normcase(os.path.normpath(os.path.abspath(directory)))
+
+    def _cached(self, cache, directory, func):
+        key = self._key(directory)
+        with self._lock:
+            value = cache.get(key)
+        if value is None:
+            value = func(directory)
+            with self._lock:
+                cache[key] = value
+        return value
+
+    def entries(self, directory):
+        """Cached files of directory with size and modification time.
+
+        Returns:
+            dict: Tuple of size and modification time by file name.
+
+        Raises:
+            OSError: When directory does not exist or can't be listed.
+        """
+        return self._cached(self._entries, directory, scan_directory)
+
+    def files(self, directory, extensions=None):
+        """Sorted file names of directory.
+
+        Args:
+            directory (str): Path to directory.
+            extensions (list): Filter files by extensions (with dot).
+        """
+        names = self._cached(self._listings, directory, list_directory)
+        if extensions:
+            extensions = tuple(ext.lower() for ext in extensions)
+            names = [
+                name for name in names
+                if name.lower().endswith(extensions)
+            ]
+        return sorted(names)
+
+    def paths(self, directory, extensions=None):
+        """Sorted full paths of files in directory."""
+        return [
+            os.path.normpath(os.path.join(directory, name))
+            for name in self.files(directory, extensions)
+        ]
+
+    def assemble(self, directory, extensions=None, **kwargs):
+        """Assemble files of directory into collections with clique.
+
+        Collections are assembled from cached listing on each call so
+        they can be modified by caller.
+
+        Args:
+            directory (str): Path to directory.
+            extensions (list): Filter files by extensions (with dot).
+            kwargs: Passed to `clique.assemble` (e.g. "patterns" or
+                "minimum_items").
+
+        Returns:
+            tuple: Collections and remainder.
+        """
+        return clique.assemble(self.files(directory, extensions), **kwargs)
+
+    def sequences(self, directory, extensions=None, **kwargs):
+        """Collections of directory described by `describe_collection`.
+
+        Returns:
+            list: Information about frames, holes and ranges of each
+                collection.
+        """
+        collections, _ = self.assemble(directory, extensions, **kwargs)
+        return [describe_collection(collection) for collection in collections]
+
+    def invalidate(self, directories=None):
+        """Drop cached listings of directories or all listings.
+
+        Args:
+            directories (str, list): Directory or directories.
+        """
+        with self._lock:
+            if directories is None:
+                self._listings.clear()
+                self._entries.clear()
+                return
+
+            if isinstance(directories, six.string_types):
+                directories = [directories]
+            for directory in directories:
+                key = self._key(directory)
+                self._listings.pop(key, None)
+                self._entries.pop(key, None)
+
+
+def get_sequence_scanner(context=None):
+    """Sequence scanner shared by plugins of pyblish context.
+
+    Scanner is stored in context data under "sequenceScanner" so listings
+    are cached for lifetime of the context. New scanner is returned when
+    context is not entered.
+
+    Args:
+        context (pyblish.api.Context): Publish context.
+    """
+    if context is None:
+        return SequenceScanner()
+
+    scanner = context.data.get("sequenceScanner")
+    if scanner is None:
+        scanner = SequenceScanner()
+        context.data["sequenceScanner"] = scanner
+    return scanner
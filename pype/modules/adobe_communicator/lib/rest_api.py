@@ -3,7 +3,7 @@ import sys
 import copy
 from pype.modules.rest_api import RestApi, route, abort, CallbackResult
 from .io_nonsingleton import DbConnector
-from pype.api import config, execute, Logger
+from pype.api import get_presets, execute, Logger
 
 log = Logger().get_logger("AdobeCommunicator")
 
@@ -27,7 +27,7 @@ class AdobeRestApi(RestApi):
     @route("/presets/<project_name>", "/adobe")
     def get_presets(self, request):
         project_name = request.url_data["project_name"]
-        return CallbackResult(data=config.get_presets(project_name))
+        return CallbackResult(data=get_presets(project_name))
 
     @route("/publish", "/adobe", "POST")
     def publish(self, request):
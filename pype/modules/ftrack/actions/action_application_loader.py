@@ -3,7 +3,7 @@ import toml
 import time
 from pype.modules.ftrack.lib import AppAction
 from avalon import lib
-from pype.api import Logger, config
+from pype.api import Logger, get_presets
 
 log = Logger().get_logger(__name__)
 
@@ -49,7 +49,7 @@ def registerApp(app, session, plugins_presets):
 
 def register(session, plugins_presets={}):
     app_usages = (
-        config.get_presets()
+        get_presets()
         .get("global", {})
         .get("applications")
     ) or {}
@@ -8,7 +8,7 @@ from pype.modules.ftrack.lib import BaseAction, statics_icon
 from pype.modules.ftrack.lib.avalon_sync import (
     CUST_ATTR_ID_KEY, CUST_ATTR_GROUP, default_custom_attributes_definition
 )
-from pype.api import config
+from pype.api import get_presets
 
 """
 This action creates/updates custom attributes.
@@ -210,7 +210,7 @@ class CustomAttributes(BaseAction):
 
         self.groups = {}
 
-        self.presets = config.get_presets()
+        self.presets = get_presets()
         self.attrs_presets = self.prepare_attribute_pressets()
 
     def prepare_attribute_pressets(self):
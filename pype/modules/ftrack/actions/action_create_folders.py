@@ -1,7 +1,7 @@
 import os
 from pype.modules.ftrack.lib import BaseAction, statics_icon
 from avalon import lib as avalonlib
-from pype.api import config, Anatomy
+from pype.api import get_presets, Anatomy
 
 
 class CreateFolders(BaseAction):
@@ -106,7 +106,7 @@ class CreateFolders(BaseAction):
             publish_template = publish_template[key]
         publish_has_apps = "{app" in publish_template
 
-        presets = config.get_presets()
+        presets = get_presets()
         app_presets = presets.get("tools", {}).get("sw_folders")
         cached_apps = {}
 
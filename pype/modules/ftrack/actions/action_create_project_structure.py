@@ -2,7 +2,7 @@ import os
 import re
 
 from pype.modules.ftrack.lib import BaseAction, statics_icon
-from pype.api import config, Anatomy
+from pype.api import get_presets, Anatomy
 
 
 class CreateProjectFolders(BaseAction):
@@ -72,7 +72,7 @@ class CreateProjectFolders(BaseAction):
         entity = entities[0]
         project = self.get_project_from_entity(entity)
         project_folder_presets = (
-            config.get_presets()
+            get_presets()
             .get("tools", {})
             .get("project_folder_structure")
         )
@@ -1,6 +1,9 @@
 import os
+import json
+import time
+import errno
 import collections
-import uuid
+from multiprocessing.pool import ThreadPool
 
 import clique
 from pymongo import UpdateOne
@@ -12,6 +15,79 @@ from pype.api import Anatomy
 import avalon.pipeline
 
 
+class DiskUsageIndex(object):
+    """Files and their sizes under directories.
+
+    Directories are scanned with `os.scandir` only once and the index is
+    used both for calculation of size and for deletion of files.
+    """
+
+    def __init__(self):
+        self.created = time.time()
+        self.files_by_dir = {}
+        self.subdirs_by_dir = {}
+
+    def add_dir(self, dir_path):
+        """Scan directory and all its subdirectories."""
+        stack = [dir_path]
+        while stack:
+            path = stack.pop()
+            if path in self.files_by_dir:
+                continue
+
+            try:
+                entries = list(os.scandir(path))
+            except OSError:
+                continue
+
+            files = {}
+            subdirs = []
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                else:
+                    files[entry.name] = entry.stat(
+                        follow_symlinks=False
+                    ).st_size
+
+            self.files_by_dir[path] = files
+            self.subdirs_by_dir[path] = subdirs
+            stack.extend(subdirs)
+
+    def dir_exists(self, dir_path):
+        return dir_path in self.files_by_dir
+
+    def file_names(self, dir_path):
+        return list(self.files_by_dir.get(dir_path) or [])
+
+    def file_size(self, file_path):
+        """Size of file or `None` if file was not found."""
+        dir_path, file_name = os.path.split(file_path)
+        return (self.files_by_dir.get(dir_path) or {}).get(file_name)
+
+    def tree(self, dir_path):
+        """All files with sizes and directories under directory.
+
+        Returns:
+            tuple: Dictionary with size by file path and list of
+                subdirectories where deeper directories are first.
+        """
+        file_sizes = {}
+        dir_paths = []
+        stack = [dir_path]
+        while stack:
+            path = stack.pop()
+            for file_name, size in self.files_by_dir.get(path, {}).items():
+                file_sizes[os.path.join(path, file_name)] = size
+
+            subdirs = self.subdirs_by_dir.get(path) or []
+            dir_paths.extend(subdirs)
+            stack.extend(subdirs)
+
+        dir_paths.sort(key=lambda path: path.count(os.path.sep), reverse=True)
+        return file_sizes, dir_paths
+
+
 class DeleteOldVersions(BaseAction):
 
     identifier = "delete.old.versions"
@@ -30,6 +106,17 @@ class DeleteOldVersions(BaseAction):
     splitter_item = {"type": "label", "value": "---"}
     sequence_splitter = "__sequence_splitter__"
 
+    # Preset attributes
+    delete_workers = 8
+    bulk_write_batch_size = 1000
+    # Disk usage index is reused by repeated size calculations when it's not
+    # older than this (seconds), deletion always scans disk again
+    disk_index_ttl = 600
+    job_update_interval = 5.0
+
+    _disk_index = None
+    _disk_index_key = None
+
     def discover(self, session, entities, event):
         ''' Validation '''
         selection = event["data"].get("selection") or []
@@ -311,27 +398,18 @@ class DeleteOldVersions(BaseAction):
                 continue
 
             dir_path = os.path.dirname(file_path)
-            dir_id = None
-            for _dir_id, _dir_path in dir_paths.items():
-                if _dir_path == dir_path:
-                    dir_id = _dir_id
-                    break
-
-            if dir_id is None:
-                dir_id = uuid.uuid4()
-                dir_paths[dir_id] = dir_path
+            dir_paths[dir_path] = dir_path
+            file_paths_by_dir[dir_path].append([file_path, seq_path])
 
-            file_paths_by_dir[dir_id].append([file_path, seq_path])
+        disk_index = self.get_disk_index(
+            project_name, dir_paths.values(), use_cached=only_calculate
+        )
 
-        dir_ids_to_pop = []
-        for dir_id, dir_path in dir_paths.items():
-            if os.path.exists(dir_path):
+        # Pop dirs from both dictionaries
+        for dir_id in tuple(dir_paths.keys()):
+            if disk_index.dir_exists(dir_paths[dir_id]):
                 continue
 
-            dir_ids_to_pop.append(dir_id)
-
-        # Pop dirs from both dictionaries
-        for dir_id in dir_ids_to_pop:
             dir_paths.pop(dir_id)
             paths = file_paths_by_dir.pop(dir_id)
             # TODO report of missing directories?
@@ -342,29 +420,29 @@ class DeleteOldVersions(BaseAction):
                 "Folder does not exist. Deleting it's files skipped: {}"
             ).format(paths_msg))
 
+        if force_to_remove:
+            file_sizes, subdir_paths = self.whole_dir_paths_files(
+                disk_index, dir_paths.values()
+            )
+        else:
+            subdir_paths = []
+            file_sizes = self.only_repre_files(
+                disk_index, dir_paths, file_paths_by_dir
+            )
+
         # Size of files.
-        size = 0
+        size = sum(file_sizes.values())
 
         if only_calculate:
-            if force_to_remove:
-                size = self.delete_whole_dir_paths(
-                    dir_paths.values(), delete=False
-                )
-            else:
-                size = self.delete_only_repre_files(
-                    dir_paths, file_paths_by_dir, delete=False
-                )
-
             msg = "Total size of files: " + self.sizeof_fmt(size)
 
             self.log.warning(msg)
 
             return {"success": True, "message": msg}
 
-        if force_to_remove:
-            size = self.delete_whole_dir_paths(dir_paths.values())
-        else:
-            size = self.delete_only_repre_files(dir_paths, file_paths_by_dir)
+        # Index won't match files on disk after deletion
+        self._disk_index = None
+        self._disk_index_key = None
 
         mongo_changes_bulk = []
         for version in versions:
@@ -380,8 +458,40 @@ class DeleteOldVersions(BaseAction):
             update_data = {"$set": {"data.tags": version_tags}}
             mongo_changes_bulk.append(UpdateOne(update_query, update_data))
 
-        if mongo_changes_bulk:
-            self.dbcon.bulk_write(mongo_changes_bulk)
+        user = session.query(
+            "User where username is '{0}'".format(session.api_user)
+        ).one()
+        job = session.create("Job", {
+            "user": user,
+            "status": "running",
+            "data": json.dumps({
+                "description": "Deleting old versions."
+            })
+        })
+        session.commit()
+
+        try:
+            self.delete_files(list(file_sizes.keys()), session, job)
+            self.delete_empty_dirs(subdir_paths, dir_paths.values())
+
+            batch_size = self.bulk_write_batch_size
+            for idx in range(0, len(mongo_changes_bulk), batch_size):
+                self.dbcon.bulk_write(
+                    mongo_changes_bulk[idx:idx + batch_size], ordered=False
+                )
+
+        except Exception:
+            job["status"] = "failed"
+            session.commit()
+            raise
+
+        job["status"] = "done"
+        job["data"] = json.dumps({
+            "description": "Deleted {} files of {} old versions.".format(
+                len(file_sizes), len(versions)
+            )
+        })
+        session.commit()
 
         self.dbcon.uninstall()
 
@@ -432,63 +542,74 @@ class DeleteOldVersions(BaseAction):
 
         return {"success": True, "message": msg}
 
-    def delete_whole_dir_paths(self, dir_paths, delete=True):
-        size = 0
-
+    def get_disk_index(self, project_name, dir_paths, use_cached=True):
+        """Disk usage index of directories.
+
+        Index created by size calculation is reused when same directories
+        are processed again within `disk_index_ttl`.
+
+        Args:
+            project_name (str): Name of project.
+            dir_paths (iterable): Directories to index.
+            use_cached (bool): Previous index may be used. New index is
+                always created when `False`.
+        """
+        dir_paths = frozenset(dir_paths)
+        key = (project_name, dir_paths)
+        disk_index = self._disk_index
+        if (
+            not use_cached
+            or disk_index is None
+            or self._disk_index_key != key
+            or time.time() - disk_index.created > self.disk_index_ttl
+        ):
+            disk_index = DiskUsageIndex()
+            for dir_path in dir_paths:
+                disk_index.add_dir(dir_path)
+            self._disk_index = disk_index
+            self._disk_index_key = key
+        return disk_index
+
+    def whole_dir_paths_files(self, disk_index, dir_paths):
+        """All files under directories.
+
+        Returns:
+            tuple: Dictionary with size by file path and list of
+                subdirectories which should be removed.
+        """
+        file_sizes = {}
+        subdir_paths = []
         for dir_path in dir_paths:
-            # Delete all files and fodlers in dir path
-            for root, dirs, files in os.walk(dir_path, topdown=False):
-                for name in files:
-                    file_path = os.path.join(root, name)
-                    size += os.path.getsize(file_path)
-                    if delete:
-                        os.remove(file_path)
-                        self.log.debug("Removed file: {}".format(file_path))
-
-                for name in dirs:
-                    if delete:
-                        os.rmdir(os.path.join(root, name))
-
-            if not delete:
-                continue
-
-            # Delete even the folder and it's parents folders if they are empty
-            while True:
-                if not os.path.exists(dir_path):
-                    dir_path = os.path.dirname(dir_path)
-                    continue
-
-                if len(os.listdir(dir_path)) != 0:
-                    break
-
-                os.rmdir(os.path.join(dir_path))
-
-        return size
-
-    def delete_only_repre_files(self, dir_paths, file_paths, delete=True):
-        size = 0
-
+            _file_sizes, _subdir_paths = disk_index.tree(dir_path)
+            file_sizes.update(_file_sizes)
+            subdir_paths.extend(_subdir_paths)
+        return file_sizes, subdir_paths
+
+    def only_repre_files(self, disk_index, dir_paths, file_paths):
+        """Files of representations.
+
+        Returns:
+            dict: Size by file path.
+        """
+        file_sizes = {}
         for dir_id, dir_path in dir_paths.items():
-            dir_files = os.listdir(dir_path)
+            dir_files = disk_index.file_names(dir_path)
             collections, remainders = clique.assemble(dir_files)
             for file_path, seq_path in file_paths[dir_id]:
                 file_path_base = os.path.split(file_path)[1]
                 # Just remove file if `frame` key was not in context or
                 # filled path is in remainders (single file sequence)
                 if not seq_path or file_path_base in remainders:
-                    if not os.path.exists(file_path):
+                    size = disk_index.file_size(file_path)
+                    if size is None:
                         self.log.warning(
                             "File was not found: {}".format(file_path)
                         )
                         continue
 
-                    size += os.path.getsize(file_path)
-
-                    if delete:
-                        os.remove(file_path)
-                        self.log.debug("Removed file: {}".format(file_path))
-
-                    remainders.remove(file_path_base)
+                    file_sizes[file_path] = size
+                    if file_path_base in remainders:
+                        remainders.remove(file_path_base)
                     continue
 
                 seq_path_base = os.path.split(seq_path)[1]
@@ -505,36 +626,80 @@ class DeleteOldVersions(BaseAction):
                     # Fill full path to head
                     final_col.head = os.path.join(dir_path, final_col.head)
                     for _file_path in final_col:
-                        if os.path.exists(_file_path):
-
-                            size += os.path.getsize(_file_path)
+                        size = disk_index.file_size(_file_path)
+                        if size is not None:
+                            file_sizes[_file_path] = size
 
-                            if delete:
-                                os.remove(_file_path)
-                                self.log.debug(
-                                    "Removed file: {}".format(_file_path)
-                                )
-
-                    _seq_path = final_col.format("{head}{padding}{tail}")
-                    self.log.debug("Removed files: {}".format(_seq_path))
                     collections.remove(final_col)
+                    continue
 
-                elif os.path.exists(file_path):
-                    size += os.path.getsize(file_path)
-
-                    if delete:
-                        os.remove(file_path)
-                        self.log.debug("Removed file: {}".format(file_path))
-                else:
+                size = disk_index.file_size(file_path)
+                if size is None:
                     self.log.warning(
                         "File was not found: {}".format(file_path)
                     )
+                else:
+                    file_sizes[file_path] = size
 
-        # Delete as much as possible parent folders
-        if not delete:
-            return size
+        return file_sizes
 
-        for dir_path in dir_paths.values():
+    def delete_files(self, file_paths, session, job):
+        """Remove files using worker pool and report progress to job."""
+        def remove(file_path):
+            try:
+                os.remove(file_path)
+            except OSError as exc:
+                if exc.errno != errno.ENOENT:
+                    self.log.warning(
+                        "Couldn't remove file: {}".format(file_path),
+                        exc_info=True
+                    )
+                return False
+            return True
+
+        total = len(file_paths)
+        if not total:
+            return 0
+
+        removed = 0
+        last_update = time.time()
+        pool = ThreadPool(max(1, min(self.delete_workers, total)))
+        try:
+            for idx, success in enumerate(
+                pool.imap_unordered(remove, file_paths, chunksize=32)
+            ):
+                if success:
+                    removed += 1
+
+                now = time.time()
+                if now - last_update < self.job_update_interval:
+                    continue
+                last_update = now
+                job["data"] = json.dumps({
+                    "description": "Deleting old versions: {}/{} files".format(
+                        idx + 1, total
+                    )
+                })
+                session.commit()
+        finally:
+            pool.close()
+            pool.join()
+
+        self.log.debug("Removed {}/{} files".format(removed, total))
+        return removed
+
+    def delete_empty_dirs(self, subdir_paths, dir_paths):
+        """Remove subdirectories and empty parent folders of dir paths."""
+        for subdir_path in subdir_paths:
+            try:
+                os.rmdir(subdir_path)
+            except OSError:
+                self.log.warning(
+                    "Folder is not empty: {}".format(subdir_path)
+                )
+
+        # Delete as much as possible parent folders
+        for dir_path in dir_paths:
             while True:
                 if not os.path.exists(dir_path):
                     dir_path = os.path.dirname(dir_path)
@@ -546,8 +711,6 @@ class DeleteOldVersions(BaseAction):
                 self.log.debug("Removed folder: {}".format(dir_path))
                 os.rmdir(dir_path)
 
-        return size
-
     def path_from_represenation(self, representation, anatomy):
         try:
             template = representation["data"]["template"]
@@ -1,20 +1,190 @@
 import os
 import copy
-import shutil
+import json
+import time
+import hashlib
+import tempfile
+import queue
+import threading
 import collections
 
 import clique
+import ftrack_api
 from bson.objectid import ObjectId
 
 from avalon import pipeline
-from avalon.vendor import filelink
 
 from pype.api import Anatomy
+from pype.lib import FileTransfers, SequenceScanner, file_checksum
 from pype.modules.ftrack.lib import BaseAction, statics_icon
 from pype.modules.ftrack.lib.avalon_sync import CustAttrIdKey
 from pype.modules.ftrack.lib.io_nonsingleton import DbConnector
 
 
+class DeliveryTransfers(FileTransfers):
+    """Transfers of delivery job which can be resumed.
+
+    Destination files which already exist with same size and checksum as
+    source are skipped. Delivered files are stored to progress file so
+    restarted job with same transfers skips them without checksum
+    calculation. Progress is reported to ftrack job when set. Job is updated
+    from single reporter thread so transfer workers are not blocked by
+    ftrack server requests.
+
+    Args:
+        progress_path (str): Path to json file with delivery progress.
+        job (ftrack_api.entity.job.Job): Job where progress is reported.
+    """
+
+    report_interval = 10.0
+    save_interval = 5.0
+
+    def __init__(self, progress_path, job=None, **kwargs):
+        super(DeliveryTransfers, self).__init__(**kwargs)
+        self.progress_path = progress_path
+        self.job = job
+        self.skipped = 0
+
+        self._progress_lock = threading.Lock()
+        self._last_save = 0
+        self._delivered = self._load_progress()
+        self._job_descriptions = queue.Queue()
+
+    def process(self):
+        reporter = None
+        if self.job is not None:
+            reporter = threading.Thread(target=self._job_reporter)
+            reporter.daemon = True
+            reporter.start()
+
+        try:
+            return super(DeliveryTransfers, self).process()
+        finally:
+            if reporter is not None:
+                self._job_descriptions.put(None)
+                reporter.join()
+
+    def _job_reporter(self):
+        is_running = True
+        while is_running:
+            descriptions = [self._job_descriptions.get()]
+            # Only the latest progress is worth to send
+            while True:
+                try:
+                    descriptions.append(self._job_descriptions.get_nowait())
+                except queue.Empty:
+                    break
+
+            if None in descriptions:
+                is_running = False
+                descriptions = descriptions[:descriptions.index(None)]
+
+            if not descriptions:
+                continue
+
+            try:
+                self.job["data"] = json.dumps({
+                    "description": descriptions[-1]
+                })
+                self.job.session.commit()
+            except Exception:
+                self.log.warning("Couldn't update job status", exc_info=True)
+                self.job.session.rollback()
+
+    def _load_progress(self):
+        if not os.path.exists(self.progress_path):
+            return {}
+        try:
+            with open(self.progress_path, "r") as stream:
+                delivered = json.load(stream)
+        except Exception:
+            self.log.warning(
+                "Couldn't load delivery progress \"{}\"".format(
+                    self.progress_path
+                ),
+                exc_info=True
+            )
+            return {}
+
+        self.log.info(
+            "Resuming delivery with {} delivered files".format(len(delivered))
+        )
+        return delivered
+
+    def save_progress(self, force=False):
+        with self._progress_lock:
+            now = time.time()
+            if not force and now - self._last_save < self.save_interval:
+                return
+            self._last_save = now
+            delivered = dict(self._delivered)
+
+        dirpath = os.path.dirname(self.progress_path)
+        if not os.path.exists(dirpath):
+            os.makedirs(dirpath)
+        with open(self.progress_path, "w") as stream:
+            json.dump(delivered, stream)
+
+    def remove_progress(self):
+        if os.path.exists(self.progress_path):
+            os.remove(self.progress_path)
+
+    def is_delivered(self, src, dst):
+        """Destination file has same content as source file."""
+        if not os.path.exists(dst):
+            return False
+
+        src_stat = os.stat(src)
+        if os.path.getsize(dst) != src_stat.st_size:
+            return False
+
+        if self._delivered.get(dst) == [src_stat.st_size, src_stat.st_mtime]:
+            return True
+
+        if os.path.samefile(src, dst):
+            return True
+
+        return file_checksum(src) == file_checksum(dst)
+
+    def _transfer_with_retry(self, src, dst, mode):
+        if self.is_delivered(src, dst):
+            with self._progress_lock:
+                self.skipped += 1
+            size = 0
+        else:
+            size = super(DeliveryTransfers, self)._transfer_with_retry(
+                src, dst, mode
+            )
+
+        src_stat = os.stat(src)
+        with self._progress_lock:
+            self._delivered[dst] = [src_stat.st_size, src_stat.st_mtime]
+        self.save_progress()
+        return size
+
+    def _hardlink(self, src, dst):
+        if os.path.exists(dst):
+            os.remove(dst)
+        try:
+            return super(DeliveryTransfers, self)._hardlink(src, dst)
+        except OSError:
+            return self._copy(src, dst)
+
+    def _log_progress(self, report, total, seconds):
+        super(DeliveryTransfers, self)._log_progress(report, total, seconds)
+        if self.job is None:
+            return
+
+        mb_per_sec = 0.0
+        if seconds > 0:
+            mb_per_sec = report["bytes"] / (1024.0 * 1024.0) / seconds
+        description = (
+            "Delivery: {}/{} files ({} already delivered), {:.1f} MB/s"
+        ).format(report["files"], total, self.skipped, mb_per_sec)
+        # Called by transfer workers, job is updated by reporter thread
+        self._job_descriptions.put(description)
+
+
 class Delivery(BaseAction):
 
     identifier = "delivery.action"
@@ -25,6 +195,11 @@ class Delivery(BaseAction):
 
     db_con = DbConnector()
 
+    # Preset attributes
+    transfer_workers = 8
+    # One of "size", "checksum" or `None`
+    transfer_verify = "size"
+
     def discover(self, session, entities, event):
         for entity in entities:
             if entity.entity_type.lower() == "assetversion":
@@ -203,6 +378,8 @@ class Delivery(BaseAction):
             return
 
         self.report_items = collections.defaultdict(list)
+        # Representations of one version are usually in the same directory
+        self.sequence_scanner = SequenceScanner()
 
         values = event["data"]["values"]
         skipped = values.pop("__skipped__")
@@ -304,6 +481,7 @@ class Delivery(BaseAction):
                 for name in root_names:
                     format_dict["root"][name] = location_path
 
+        transfers = []
         for repre in repres_to_deliver:
             # Get destination repre path
             anatomy_data = copy.deepcopy(repre["context"])
@@ -359,17 +537,144 @@ class Delivery(BaseAction):
             )
 
             if not frame:
-                self.process_single_file(*args)
+                transfers.extend(self.process_single_file(*args))
             else:
-                self.process_sequence(*args)
+                transfers.extend(self.process_sequence(*args))
 
         self.db_con.uninstall()
 
-        return self.report()
+        if not transfers:
+            return self.report()
+
+        user = session.query(
+            "User where username is '{0}'".format(session.api_user)
+        ).one()
+        job = session.create("Job", {
+            "user": user,
+            "status": "running",
+            "data": json.dumps({
+                "description": "Delivery: {} files".format(len(transfers))
+            })
+        })
+        session.commit()
+
+        thread = threading.Thread(
+            target=self.deliver,
+            args=(transfers, job["id"], session)
+        )
+        thread.daemon = True
+        try:
+            thread.start()
+        except Exception:
+            job["status"] = "failed"
+            session.commit()
+            raise
+
+        return self.report(
+            "Delivery of {} files started".format(len(transfers))
+        )
+
+    def progress_path(self, transfers):
+        """Path to progress file of delivery with entered transfers.
+
+        Same transfers lead to same path so restarted delivery continues
+        where previous ended. Directory can be changed with environment
+        "PYPE_DELIVERY_PROGRESS_DIR".
+        """
+        dirpath = os.environ.get("PYPE_DELIVERY_PROGRESS_DIR") or (
+            os.path.join(tempfile.gettempdir(), "pype_delivery")
+        )
+        content = json.dumps(sorted(transfers)).encode("utf-8")
+        filename = "{}.json".format(hashlib.sha1(content).hexdigest())
+        return os.path.join(dirpath, filename)
+
+    def deliver(self, transfers, job_id, session):
+        """Transfer files and report progress to ftrack job.
+
+        Runs in separated thread with own ftrack session so action handler
+        is not blocked by delivery.
+
+        Args:
+            transfers (list): Tuples with source and destination path.
+            job_id (str): Id of ftrack job where progress is reported.
+            session (ftrack_api.Session): Session of action handler used for
+                credentials.
+        """
+        job_session = None
+        job = None
+        delivery_transfers = None
+        status = "failed"
+        description = "Delivery failed"
+        try:
+            job_session = ftrack_api.Session(
+                server_url=session.server_url,
+                api_key=session.api_key,
+                api_user=session.api_user,
+                auto_connect_event_hub=False
+            )
+            job = job_session.get("Job", job_id)
+            delivery_transfers = DeliveryTransfers(
+                self.progress_path(transfers),
+                job,
+                workers=self.transfer_workers,
+                verify=self.transfer_verify,
+                log=self.log
+            )
+            for src, dst in transfers:
+                delivery_transfers.add(src, dst, "hardlink")
+
+            report = delivery_transfers.process()
+            delivery_transfers.remove_progress()
+
+            status = "done"
+            description = (
+                "Delivery: {} files delivered ({} already delivered)"
+                " in {:.1f}s"
+            ).format(
+                len(transfers),
+                delivery_transfers.skipped,
+                report["seconds"]
+            )
+
+        except Exception as exc:
+            self.log.warning("Delivery failed", exc_info=True)
+            description = "Delivery failed: {}".format(str(exc))
+            if delivery_transfers is not None:
+                try:
+                    delivery_transfers.save_progress(force=True)
+                except Exception:
+                    self.log.warning(
+                        "Couldn't save delivery progress", exc_info=True
+                    )
+
+        finally:
+            self._finish_job(job_id, job, status, description, session)
+            if job_session is not None:
+                job_session.close()
+
+    def _finish_job(self, job_id, job, status, description, session):
+        """Set final status of delivery job.
+
+        Session of action handler is used when job session couldn't be
+        created.
+        """
+        try:
+            if job is None:
+                job = session.get("Job", job_id)
+            job["status"] = status
+            job["data"] = json.dumps({"description": description})
+            job.session.commit()
+        except Exception:
+            self.log.warning("Couldn't update job status", exc_info=True)
 
     def process_single_file(
         self, repre_path, anatomy, anatomy_name, anatomy_data, format_dict
     ):
+        """Transfer of single file representation.
+
+        Returns:
+            list: Tuples with source and destination path.
+        """
         anatomy_filled = anatomy.format(anatomy_data)
         if format_dict:
             template_result = anatomy_filled["delivery"][anatomy_name]
@@ -377,15 +682,16 @@ class Delivery(BaseAction):
         else:
             delivery_path = anatomy_filled["delivery"][anatomy_name]
 
-        delivery_folder = os.path.dirname(delivery_path)
-        if not os.path.exists(delivery_folder):
-            os.makedirs(delivery_folder)
-
-        self.copy_file(repre_path, delivery_path)
+        return [(repre_path, str(delivery_path))]
 
     def process_sequence(
         self, repre_path, anatomy, anatomy_name, anatomy_data, format_dict
     ):
+        """Transfers of each frame of sequence representation.
+
+        Returns:
+            list: Tuples with source and destination path.
+        """
         dir_path, file_name = os.path.split(str(repre_path))
 
         base_name, ext = os.path.splitext(file_name)
@@ -400,9 +706,9 @@ class Delivery(BaseAction):
             msg = "Source file was not found"
             self.report_items[msg].append(repre_path)
             self.log.warning("{} <{}>".format(msg, repre_path))
-            return
+            return []
 
-        src_collections, remainder = clique.assemble(os.listdir(dir_path))
+        src_collections, remainder = self.sequence_scanner.assemble(dir_path)
         src_collection = None
         for col in src_collections:
             if col.tail != ext:
@@ -420,7 +726,7 @@ class Delivery(BaseAction):
             msg = "Source collection of files was not found"
             self.report_items[msg].append(repre_path)
             self.log.warning("{} <{}>".format(msg, repre_path))
-            return
+            return []
 
         frame_indicator = "@####@"
 
@@ -433,7 +739,6 @@ class Delivery(BaseAction):
         else:
             delivery_path = anatomy_filled["delivery"][anatomy_name]
 
-        delivery_folder = os.path.dirname(delivery_path)
         dst_head, dst_tail = delivery_path.split(frame_indicator)
         dst_padding = src_collection.padding
         dst_collection = clique.Collection(
@@ -442,9 +747,7 @@ class Delivery(BaseAction):
             padding=dst_padding
         )
 
-        if not os.path.exists(delivery_folder):
-            os.makedirs(delivery_folder)
-
+        transfers = []
         src_head = src_collection.head
         src_tail = src_collection.tail
         for index in src_collection.indexes:
@@ -457,7 +760,9 @@ class Delivery(BaseAction):
             dst_padding = dst_collection.format("{padding}") % index
             dst = "{}{}{}".format(dst_head, dst_padding, dst_tail)
 
-            self.copy_file(src, dst)
+            transfers.append((src, dst))
+
+        return transfers
 
     def path_from_represenation(self, representation, anatomy):
         try:
@@ -479,19 +784,7 @@ class Delivery(BaseAction):
 
         return os.path.normpath(path)
 
-    def copy_file(self, src_path, dst_path):
-        if os.path.exists(dst_path):
-            return
-        try:
-            filelink.create(
-                src_path,
-                dst_path,
-                filelink.HARDLINK
-            )
-        except OSError:
-            shutil.copyfile(src_path, dst_path)
-
-    def report(self):
+    def report(self, message="Delivery Finished"):
         items = []
         title = "Delivery report"
         for msg, _items in self.report_items.items():
@@ -519,7 +812,7 @@ class Delivery(BaseAction):
         if not items:
             return {
                 "success": True,
-                "message": "Delivery Finished"
+                "message": message
             }
 
         return {
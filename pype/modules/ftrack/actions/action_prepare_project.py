@@ -2,7 +2,7 @@ import os
 import json
 
 from pype.modules.ftrack.lib import BaseAction, statics_icon
-from pype.api import config, Anatomy, project_overrides_dir_path
+from pype.api import get_presets, Anatomy, project_overrides_dir_path
 from pype.modules.ftrack.lib.avalon_sync import get_pype_attr
 
 
@@ -46,7 +46,7 @@ class PrepareProject(BaseAction):
         project_name = entities[0]["full_name"]
 
         project_defaults = (
-            config.get_presets(project_name)
+            get_presets(project_name)
             .get("ftrack", {})
             .get("project_defaults", {})
         )
@@ -3,7 +3,7 @@ import subprocess
 import traceback
 import json
 
-from pype.api import config
+from pype.api import get_presets
 from pype.modules.ftrack.lib import BaseAction, statics_icon
 import ftrack_api
 from avalon import io, api
@@ -11,7 +11,7 @@ from avalon import io, api
 
 class RVAction(BaseAction):
     """ Launch RV action """
-    ignore_me = "rv" not in config.get_presets()
+    ignore_me = "rv" not in get_presets()
     identifier = "rv.launch.action"
     label = "rv"
     description = "rv Launcher"
@@ -38,8 +38,8 @@ class RVAction(BaseAction):
             )
         else:
             # if not, fallback to config file location
-            if "rv" in config.get_presets():
-                self.config_data = config.get_presets()['rv']['config']
+            if "rv" in get_presets():
+                self.config_data = get_presets()['rv']['config']
                 self.set_rv_path()
 
         if self.rv_path is None:
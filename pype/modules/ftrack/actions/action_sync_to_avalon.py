@@ -43,6 +43,8 @@ class SyncToAvalonLocal(BaseAction):
     #: roles that are allowed to register this action
     role_list = ["Pypeclub"]
     icon = statics_icon("ftrack", "action_icons", "PypeAdmin.svg")
+    #: Synchronize only entities changed since last synchronization
+    incremental_sync = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -67,7 +69,9 @@ class SyncToAvalonLocal(BaseAction):
             ft_project_name = in_entities[0]["project"]["full_name"]
 
         try:
-            output = self.entities_factory.launch_setup(ft_project_name)
+            output = self.entities_factory.launch_setup(
+                ft_project_name, self.incremental_sync
+            )
             if output is not None:
                 return output
 
@@ -77,7 +81,17 @@ class SyncToAvalonLocal(BaseAction):
             time_2 = time.time()
 
             # This must happen before all filtering!!!
-            self.entities_factory.prepare_avalon_entities(ft_project_name)
+            needs_full_sync = self.entities_factory.prepare_avalon_entities(
+                ft_project_name
+            )
+            if needs_full_sync:
+                # Incremental changes can't be used, start over with full
+                # synchronization
+                output = self.entities_factory.launch_setup(ft_project_name)
+                if output is not None:
+                    return output
+                self.entities_factory.set_cutom_attributes()
+                self.entities_factory.prepare_avalon_entities(ft_project_name)
             time_3 = time.time()
 
             self.entities_factory.filter_by_ignore_sync()
@@ -36,6 +36,8 @@ class SyncToAvalonServer(BaseAction):
     variant = "- Sync To Avalon (Server)"
     #: Action description.
     description = "Send data from Ftrack to Avalon"
+    #: Synchronize only entities changed since last synchronization
+    incremental_sync = False
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -92,7 +94,9 @@ class SyncToAvalonServer(BaseAction):
             ft_project_name = in_entities[0]["project"]["full_name"]
 
         try:
-            output = self.entities_factory.launch_setup(ft_project_name)
+            output = self.entities_factory.launch_setup(
+                ft_project_name, self.incremental_sync
+            )
             if output is not None:
                 return output
 
@@ -102,7 +106,17 @@ class SyncToAvalonServer(BaseAction):
             time_2 = time.time()
 
             # This must happen before all filtering!!!
-            self.entities_factory.prepare_avalon_entities(ft_project_name)
+            needs_full_sync = self.entities_factory.prepare_avalon_entities(
+                ft_project_name
+            )
+            if needs_full_sync:
+                # Incremental changes can't be used, start over with full
+                # synchronization
+                output = self.entities_factory.launch_setup(ft_project_name)
+                if output is not None:
+                    return output
+                self.entities_factory.set_cutom_attributes()
+                self.entities_factory.prepare_avalon_entities(ft_project_name)
             time_3 = time.time()
 
             self.entities_factory.filter_by_ignore_sync()
@@ -47,6 +47,11 @@ class SyncToAvalonEvent(BaseEvent):
     created_entities = []
     report_splitter = {"type": "label", "value": "---"}
 
+    # Number of projects with cached avalon documents
+    cache_max_projects = 5
+    # Seconds after which cached avalon documents are reloaded
+    cache_ttl = 10 * 60
+
     def __init__(self, session, plugins_presets={}):
         '''Expects a ftrack_api.Session instance'''
         # Debug settings
@@ -62,6 +67,11 @@ class SyncToAvalonEvent(BaseEvent):
         self.set_process_session(session)
         super().__init__(session, plugins_presets)
 
+        # Avalon documents cached across events
+        self.entity_cache = avalon_sync.AvalonEntityCache(
+            self.cache_max_projects, self.cache_ttl
+        )
+
     def debug_logs(self):
         """This is debug method for printing small debugs messages. """
         now_datetime = datetime.datetime.now()
@@ -109,14 +119,22 @@ class SyncToAvalonEvent(BaseEvent):
         return self._avalon_cust_attrs
 
     @property
-    def avalon_entities(self):
-        if self._avalon_ents is None:
+    def project_cache(self):
+        if self._project_cache is None:
             self.dbcon.install()
             self.dbcon.Session["AVALON_PROJECT"] = (
                 self.cur_project["full_name"]
             )
-            avalon_project = self.dbcon.find_one({"type": "project"})
-            avalon_entities = list(self.dbcon.find({"type": "asset"}))
+            self._project_cache = self.entity_cache.get(
+                self.dbcon, self.cur_project["full_name"]
+            )
+        return self._project_cache
+
+    @property
+    def avalon_entities(self):
+        if self._avalon_ents is None:
+            avalon_project = self.project_cache["project"]
+            avalon_entities = list(self.project_cache["assets"].values())
             self._avalon_ents = (avalon_project, avalon_entities)
         return self._avalon_ents
 
@@ -170,27 +188,19 @@ class SyncToAvalonEvent(BaseEvent):
     @property
     def avalon_subsets_by_parents(self):
         if self._avalon_subsets_by_parents is None:
-            self._avalon_subsets_by_parents = collections.defaultdict(list)
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
-            )
-            for subset in self.dbcon.find({"type": "subset"}):
-                self._avalon_subsets_by_parents[subset["parent"]].append(
-                    subset
+            self._avalon_subsets_by_parents = (
+                self.entity_cache.subsets_by_parent(
+                    self.dbcon, self.cur_project["full_name"]
                 )
+            )
         return self._avalon_subsets_by_parents
 
     @property
     def avalon_archived_by_id(self):
         if self._avalon_archived_by_id is None:
-            self._avalon_archived_by_id = {}
-            self.dbcon.install()
-            self.dbcon.Session["AVALON_PROJECT"] = (
-                self.cur_project["full_name"]
+            self._avalon_archived_by_id = dict(
+                self.project_cache["archived"]
             )
-            for asset in self.dbcon.find({"type": "archived_asset"}):
-                self._avalon_archived_by_id[asset["_id"]] = asset
         return self._avalon_archived_by_id
 
     @property
@@ -225,6 +235,41 @@ class SyncToAvalonEvent(BaseEvent):
             )
         return self._avalon_custom_attributes
 
+    def copy_cached_entity(self, entity):
+        """Replace avalon document in cached lookups with its copy.
+
+        Documents are shared with entity cache and must be copied before
+        they're modified.
+
+        Returns:
+            dict: Copy of document which can be modified.
+        """
+        entity_copy = copy.deepcopy(entity)
+        if self._avalon_ents is not None:
+            project, ents = self._avalon_ents
+            for idx, ent in enumerate(ents):
+                if ent is entity:
+                    ents[idx] = entity_copy
+
+        lookups = [
+            self._avalon_ents_by_id,
+            self._avalon_ents_by_name,
+            self._avalon_ents_by_ftrack_id
+        ]
+        for lookup in lookups:
+            if lookup is None:
+                continue
+            for key, ent in lookup.items():
+                if ent is entity:
+                    lookup[key] = entity_copy
+
+        if self._avalon_ents_by_parent_id is not None:
+            for children in self._avalon_ents_by_parent_id.values():
+                for idx, ent in enumerate(children):
+                    if ent is entity:
+                        children[idx] = entity_copy
+        return entity_copy
+
     def remove_cached_by_key(self, key, values):
         if self._avalon_ents is None:
             return
@@ -347,7 +392,7 @@ class SyncToAvalonEvent(BaseEvent):
                 if entity_id in unchangeable_ids:
                     _subset_ids = [
                         str(sub["_id"]) for sub in
-                        self.avalon_subsets_by_parents[entity_id]
+                        self.avalon_subsets_by_parents.get(entity_id) or []
                     ]
                     joined_subset_ids = "| ".join(_subset_ids)
                     self.log.warning((
@@ -373,6 +418,10 @@ class SyncToAvalonEvent(BaseEvent):
 
         self._avalon_cust_attrs = None
 
+        self._project_cache = None
+        # Ids of avalon documents changed during processing
+        self.touched_mongo_ids = set()
+
         self._avalon_ents = None
         self._avalon_ents_by_id = None
         self._avalon_ents_by_parent_id = None
@@ -709,6 +758,12 @@ class SyncToAvalonEvent(BaseEvent):
             self.report_items["error"][msg].append((
                 str(traceback.format_exc()).replace("\n", "<br>")
             ).replace(" ", "&nbsp;"))
+            # Cached documents may not match database after failure
+            self.entity_cache.invalidate(ft_project["full_name"])
+            self.mark_project_changed()
+
+        else:
+            self.update_cached_entities()
 
         self.report()
         return True
@@ -734,7 +789,7 @@ class SyncToAvalonEvent(BaseEvent):
 
                 mongo_id = avalon_ent["_id"]
                 if mongo_id not in self.task_changes_by_avalon_id:
-                    self.task_changes_by_avalon_id[mongo_id] = (
+                    self.task_changes_by_avalon_id[mongo_id] = list(
                         avalon_ent["data"]["tasks"]
                     )
 
@@ -764,6 +819,10 @@ class SyncToAvalonEvent(BaseEvent):
                 {"_id": {"$in": removable_ids}, "type": "asset"},
                 {"$set": {"type": "archived_asset"}}
             )
+            self.touched_mongo_ids.update(removable_ids)
+            self.entity_cache.evict(
+                self.cur_project["full_name"], removable_ids
+            )
             self.remove_cached_by_key("id", removable_ids)
 
         if recreate_ents:
@@ -834,6 +893,7 @@ class SyncToAvalonEvent(BaseEvent):
                     continue
 
                 new_entity_id = new_entity["id"]
+                avalon_entity = self.copy_cached_entity(avalon_entity)
                 avalon_entity["data"]["ftrackId"] = new_entity_id
 
                 for key, val in avalon_entity["data"].items():
@@ -1156,6 +1216,7 @@ class SyncToAvalonEvent(BaseEvent):
             self.dbcon.insert_one(final_entity)
             # TODO logging
             self.log.debug("Entity was synchronized <{}>".format(ent_path))
+        self.touched_mongo_ids.add(mongo_id)
 
         mongo_id_str = str(mongo_id)
         if mongo_id_str != ftrack_ent["custom_attributes"][CUST_ATTR_ID_KEY]:
@@ -1354,7 +1415,10 @@ class SyncToAvalonEvent(BaseEvent):
             # if avalon does not have same name then can be changed
             same_name_avalon_ent = self.avalon_ents_by_name.get(new_name)
             if not same_name_avalon_ent:
-                old_val = self._avalon_ents_by_name.pop(old_name)
+                old_val = self.copy_cached_entity(
+                    self._avalon_ents_by_name[old_name]
+                )
+                self._avalon_ents_by_name.pop(old_name)
                 old_val["name"] = new_name
                 self._avalon_ents_by_name[new_name] = old_val
                 self.updates[mongo_id] = {"name": new_name}
@@ -1410,7 +1474,7 @@ class SyncToAvalonEvent(BaseEvent):
 
             mongo_id = avalon_ent["_id"]
             if mongo_id not in self.task_changes_by_avalon_id:
-                self.task_changes_by_avalon_id[mongo_id] = (
+                self.task_changes_by_avalon_id[mongo_id] = list(
                     avalon_ent["data"]["tasks"]
                 )
 
@@ -1513,7 +1577,11 @@ class SyncToAvalonEvent(BaseEvent):
                             "data.entityType": entity_type
                         }
                     })
+                    self.touched_mongo_ids.add(avalon_ent_by_name["_id"])
 
+                    avalon_ent_by_name = self.copy_cached_entity(
+                        avalon_ent_by_name
+                    )
                     avalon_ent_by_name["data"]["ftrackId"] = ftrack_id
                     avalon_ent_by_name["data"]["entityType"] = entity_type
 
@@ -1662,7 +1730,7 @@ class SyncToAvalonEvent(BaseEvent):
 
             mongo_id = avalon_ent["_id"]
             if mongo_id not in self.task_changes_by_avalon_id:
-                self.task_changes_by_avalon_id[mongo_id] = (
+                self.task_changes_by_avalon_id[mongo_id] = list(
                     avalon_ent["data"]["tasks"]
                 )
 
@@ -2279,8 +2347,50 @@ class SyncToAvalonEvent(BaseEvent):
             return
 
         self.dbcon.bulk_write(mongo_changes_bulk)
+        self.touched_mongo_ids.update(self.updates.keys())
         self.updates = collections.defaultdict(dict)
 
+    def mark_project_changed(self):
+        """Notify other caches about changes of failed event."""
+        if not self.touched_mongo_ids:
+            return
+
+        try:
+            self.entity_cache.mark_changed(
+                self.dbcon,
+                self.cur_project["id"],
+                self.cur_project["full_name"]
+            )
+        except Exception:
+            self.log.warning(
+                "Marking of changed avalon project failed.", exc_info=True
+            )
+
+    def update_cached_entities(self):
+        """Reload documents changed by this event in entity cache."""
+        if self._project_cache is None:
+            return
+
+        project_name = self.cur_project["full_name"]
+        mongo_ids = set(self.touched_mongo_ids)
+        # Task lists of documents are changed in database too
+        mongo_ids.update(self.task_changes_by_avalon_id.keys())
+        if not mongo_ids:
+            return
+
+        try:
+            self.entity_cache.update_entities(
+                self.dbcon, project_name, mongo_ids
+            )
+            self.entity_cache.mark_changed(
+                self.dbcon, self.cur_project["id"], project_name
+            )
+        except Exception:
+            self.log.warning(
+                "Update of cached avalon entities failed.", exc_info=True
+            )
+            self.entity_cache.invalidate(project_name)
+
     @property
     def duplicated_report(self):
         if not self.duplicated:
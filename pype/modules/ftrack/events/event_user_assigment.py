@@ -8,7 +8,7 @@ from pype.modules.ftrack.lib.io_nonsingleton import DbConnector
 
 from bson.objectid import ObjectId
 
-from pype.api import config, Anatomy
+from pype.api import get_presets, Anatomy
 
 
 class UserAssigmentEvent(BaseEvent):
@@ -174,7 +174,7 @@ class UserAssigmentEvent(BaseEvent):
 
     def launch(self, session, event):
         # load shell scripts presets
-        presets = config.get_presets()['ftrack'].get("user_assigment_event")
+        presets = get_presets()['ftrack'].get("user_assigment_event")
         if not presets:
             return
         for entity in event.get('data', {}).get('entities', []):
@@ -1,5 +1,5 @@
 from pype.modules.ftrack import BaseEvent
-from pype.api import config
+from pype.lib import get_ftrack_config_presets
 
 
 class VersionToTaskStatus(BaseEvent):
@@ -50,10 +50,7 @@ class VersionToTaskStatus(BaseEvent):
 
             # Load status mapping from presets
             status_mapping = (
-                config.get_presets()
-                .get("ftrack", {})
-                .get("ftrack_config", {})
-                .get("status_version_to_task")
+                get_ftrack_config_presets().get("status_version_to_task")
             ) or self.default_status_mapping
 
             # Skip if mapping is empty
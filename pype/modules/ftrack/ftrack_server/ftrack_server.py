@@ -6,7 +6,7 @@ import ftrack_api
 import time
 import logging
 import inspect
-from pype.api import Logger, config
+from pype.api import Logger, get_presets
 
 
 log = Logger().get_logger(__name__)
@@ -109,7 +109,7 @@ class FtrackServer:
         key = "user"
         if self.server_type.lower() == "event":
             key = "server"
-        plugins_presets = config.get_presets().get(
+        plugins_presets = get_presets().get(
             "ftrack", {}
         ).get("plugins", {}).get(key, {})
 
@@ -1,5 +1,6 @@
 import os
 import sys
+import copy
 import logging
 import getpass
 import atexit
@@ -7,8 +8,10 @@ import tempfile
 import threading
 import datetime
 import time
+import zlib
 import queue
 import pymongo
+from pymongo import UpdateOne
 
 import requests
 import ftrack_api
@@ -82,6 +85,569 @@ def check_ftrack_url(url, log_errors=True):
     return url
 
 
+def create_event_indexes(dbcon):
+    """Create indexes used by queries of event storer and processor."""
+    dbcon.create_index([
+        ("pype_data.is_processed", pymongo.ASCENDING),
+        ("pype_data.stored", pymongo.ASCENDING)
+    ])
+    dbcon.create_index([("id", pymongo.ASCENDING)])
+
+
+class BulkWriteBuffer(object):
+    """Write-behind buffer grouping Mongo write operations to bulk writes.
+
+    Operations are written with ordered bulk writes when buffer reaches
+    `max_size` or when `flush_interval` has passed, so they're stored in
+    the same order as they were added. Write of a batch stops on first
+    failed operation, that operation is retried (e.g. duplicate key error
+    caused by concurrent upserts passes on retry) and then are written the
+    operations after it. Operation which fails `max_retries` times is
+    dropped and logged. Buffer must be flushed on shutdown with `stop`
+    (registered to `atexit` on first `start`).
+
+    Buffer is failing when Mongo did not respond to `max_failed_flushes`
+    flushes in a row or when it contains `max_buffer_size` operations.
+    Owner of the buffer should check `is_failing` and stop adding
+    operations in that case.
+
+    Args:
+        dbcon (CustomDbConnector): Connection with active collection.
+        max_size (int): Number of operations which trigger flush.
+        flush_interval (float): Maximum time in seconds operation stays
+            in buffer.
+        log (logging.Logger): Logger for errors.
+        max_retries (int): How many times is failed operation retried.
+        max_buffer_size (int): Number of buffered operations when buffer
+            is failing.
+        max_failed_flushes (int): Number of flushes in a row failed
+            with `AutoReconnect` when buffer is failing.
+    """
+
+    duplicate_key_error_code = 11000
+
+    def __init__(
+        self, dbcon, max_size=500, flush_interval=0.5, log=None,
+        max_retries=3, max_buffer_size=10000, max_failed_flushes=10
+    ):
+        self.dbcon = dbcon
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self.max_buffer_size = max_buffer_size
+        self.max_failed_flushes = max_failed_flushes
+        self.log = log or logging.getLogger(self.__class__.__name__)
+
+        # Items are tuples of operation and number of failed attempts
+        self._operations = []
+        self._failed_flushes = 0
+        self._lock = threading.Lock()
+        # Only one flush can write at the same time
+        self._flush_lock = threading.Lock()
+        self._flush_event = threading.Event()
+        self._thread = None
+        self._is_running = False
+        self._atexit_registered = False
+
+    def __len__(self):
+        return len(self._operations)
+
+    @property
+    def is_failing(self):
+        """Mongo is not responding or buffer is full."""
+        return (
+            self._failed_flushes >= self.max_failed_flushes
+            or len(self._operations) >= self.max_buffer_size
+        )
+
+    def start(self):
+        """Start thread flushing buffer in intervals."""
+        if self._thread is not None:
+            return
+        self._is_running = True
+        self._thread = threading.Thread(target=self._flush_loop)
+        self._thread.daemon = True
+        self._thread.start()
+        if not self._atexit_registered:
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+    def stop(self):
+        """Stop flushing thread and flush remaining operations."""
+        self._is_running = False
+        self._flush_event.set()
+        if (
+            self._thread is not None
+            and self._thread is not threading.current_thread()
+        ):
+            self._thread.join()
+        self._thread = None
+        self.flush()
+
+    def add(self, operation):
+        """Add pymongo write operation (e.g. `ReplaceOne`) to buffer."""
+        with self._lock:
+            self._operations.append((operation, 0))
+            is_full = len(self._operations) >= self.max_size
+
+        if is_full:
+            self._flush_event.set()
+
+    def flush(self):
+        """Write all buffered operations.
+
+        Raises:
+            pymongo.errors.AutoReconnect: When Mongo is not responding.
+                Operations are kept in buffer in that case.
+        """
+        with self._flush_lock:
+            with self._lock:
+                items, self._operations = self._operations, []
+
+            while items:
+                try:
+                    self.dbcon.bulk_write(
+                        [operation for operation, _ in items], ordered=True
+                    )
+                    items = []
+
+                except pymongo.errors.AutoReconnect:
+                    # Return not written operations to buffer
+                    with self._lock:
+                        self._operations = items + self._operations
+                    self._failed_flushes += 1
+                    raise
+
+                except pymongo.errors.BulkWriteError as exc:
+                    items = self._process_write_errors(items, exc.details)
+
+            self._failed_flushes = 0
+
+    def _process_write_errors(self, items, details):
+        """Process errors of ordered bulk write.
+
+        Returns:
+            list: Items which were not written and should be retried.
+        """
+        if details.get("writeConcernErrors"):
+            self.log.warning("Write concern errors: {}".format(
+                details["writeConcernErrors"]
+            ))
+
+        write_errors = details.get("writeErrors")
+        if not write_errors:
+            return []
+
+        # Ordered write stops on first error
+        error = write_errors[0]
+        index = error["index"]
+        operation, attempts = items[index]
+        attempts += 1
+        remaining = items[index + 1:]
+        if attempts <= self.max_retries:
+            return [(operation, attempts)] + remaining
+
+        if error.get("code") == self.duplicate_key_error_code:
+            self.log.warning("Skipped duplicated write operation: {}".format(
+                error.get("errmsg")
+            ))
+        else:
+            self.log.error((
+                "Write operation failed {} times and was skipped: {}"
+            ).format(attempts, error))
+        return remaining
+
+    def _flush_loop(self):
+        while self._is_running:
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except pymongo.errors.AutoReconnect:
+                self.log.error((
+                    "Mongo server \"{}\" is not responding."
+                ).format(os.environ.get("AVALON_MONGO")))
+            except Exception:
+                self.log.error("Flush of write buffer failed", exc_info=True)
+
+
+def get_event_project_id(event):
+    """Return id of project which entities in ftrack.update event belong to.
+
+    Returns:
+        str/None: Project id of first entity with project in parents.
+    """
+    for entity_info in (event.get("data") or {}).get("entities") or []:
+        if entity_info.get("entityType") == "show":
+            return entity_info.get("entityId")
+
+        for parent in entity_info.get("parents") or []:
+            if parent.get("entityType") == "show":
+                return parent.get("entityId")
+    return None
+
+
+def _event_user_id(event):
+    user = (event.get("source") or {}).get("user") or {}
+    return user.get("id")
+
+
+def _entity_info_key(ent_info):
+    entity_id = ent_info.get("entityId")
+    if isinstance(entity_id, list):
+        entity_id = tuple(entity_id)
+    return (ent_info.get("entityType"), entity_id)
+
+
+def _merge_update_info(merged_info, ent_info):
+    """Merge changes of update entity info into previous update info.
+
+    Value before first change and value after last change are kept.
+    """
+    keys = merged_info.get("keys") or []
+    for key in ent_info.get("keys") or []:
+        if key not in keys:
+            keys.append(key)
+    merged_info["keys"] = keys
+
+    changes = merged_info.get("changes") or {}
+    for key, change in (ent_info.get("changes") or {}).items():
+        if key not in changes or not isinstance(change, dict):
+            changes[key] = copy.deepcopy(change)
+            continue
+        merged_change = changes[key]
+        if isinstance(merged_change, dict) and "new" in change:
+            merged_change["new"] = copy.deepcopy(change["new"])
+        else:
+            changes[key] = copy.deepcopy(change)
+    merged_info["changes"] = changes
+
+
+def coalesce_events(events):
+    """Merge consecutive ftrack.update events of the same project and user.
+
+    Entity infos of events are concatenated in order. Updates of the same
+    entity are merged into one entity info. A new merged event is started
+    when entity which is already in merged event is added, moved or
+    removed, so these actions are processed in causal order. A new merged
+    event is also started when event of the project comes from another user
+    so source of merged event matches all its changes.
+
+    Args:
+        events (list): Events in order as they were received.
+
+    Returns:
+        list: Tuples with event to handle and list of source events.
+    """
+    batches = []
+    open_batches = {}
+    for event in events:
+        entities_info = (event.get("data") or {}).get("entities") or []
+        project_id = get_event_project_id(event)
+        user_id = _event_user_id(event)
+
+        batch = open_batches.get(project_id)
+        if batch is not None and batch["user_id"] != user_id:
+            batch = None
+
+        if batch is not None:
+            for ent_info in entities_info:
+                if (
+                    ent_info.get("action") != "update"
+                    and _entity_info_key(ent_info) in batch["keys"]
+                ):
+                    batch = None
+                    break
+
+        if batch is None:
+            batch = {
+                "user_id": user_id,
+                "entities": [],
+                "updates": {},
+                "keys": set(),
+                "events": []
+            }
+            batches.append(batch)
+            open_batches[project_id] = batch
+
+        batch["events"].append(event)
+        for ent_info in entities_info:
+            key = _entity_info_key(ent_info)
+            batch["keys"].add(key)
+            if ent_info.get("action") != "update":
+                batch["entities"].append(copy.deepcopy(ent_info))
+                continue
+
+            merged_info = batch["updates"].get(key)
+            if merged_info is None:
+                merged_info = copy.deepcopy(ent_info)
+                batch["updates"][key] = merged_info
+                batch["entities"].append(merged_info)
+            else:
+                _merge_update_info(merged_info, ent_info)
+
+    output = []
+    for batch in batches:
+        source_events = batch["events"]
+        if len(source_events) == 1:
+            output.append((source_events[0], source_events))
+            continue
+
+        # Last event is used as base of merged event, all source events
+        # have the same user
+        event_data = copy.deepcopy(source_events[-1]._data)
+        event_data["data"]["entities"] = batch["entities"]
+        output.append(
+            (ftrack_api.event.base.Event(**event_data), source_events)
+        )
+    return output
+
+
+class HandlerLatency(object):
+    """Thread safe statistics of event handlers processing time."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {}
+
+    def wrap(self, name, callback):
+        """Wrap callback to measure processing time under `name`."""
+        def timed_callback(event):
+            start = time.time()
+            try:
+                return callback(event)
+            finally:
+                self.add(name, time.time() - start)
+        return timed_callback
+
+    def add(self, name, duration):
+        with self._lock:
+            count, total, maximum = self._data.get(name, (0, 0.0, 0.0))
+            self._data[name] = (
+                count + 1, total + duration, max(maximum, duration)
+            )
+
+    def items(self):
+        """Statistics by handler name as (count, average, maximum)."""
+        with self._lock:
+            return [
+                (name, (count, total / count, maximum))
+                for name, (count, total, maximum) in sorted(
+                    self._data.items()
+                )
+            ]
+
+
+class EventDispatcher(object):
+    """Run event handlers of ftrack.update events on worker threads.
+
+    Events are partitioned by project id so events of one project are
+    processed in order on the same worker and events of different projects
+    are processed in parallel. Events without project are processed by
+    the first worker. Each worker has its own session (ftrack
+    sessions are not thread safe) where are registered all event handlers
+    with `register_handlers` callback.
+
+    Events received by worker within `coalesce_window` are merged with
+    `coalesce_events` so bulk changes of the same entities are handled in
+    one pass.
+
+    Args:
+        workers (int): Number of worker threads.
+        register_handlers (callable): Register handlers to session passed
+            as argument.
+        on_processed (callable): Called with event when event was handled.
+        log (logging.Logger): Logger.
+        coalesce_window (float): Seconds to wait for more events before
+            handling. Events are not merged when set to `0`.
+    """
+
+    topics = ("ftrack.update", )
+    # Max number of events merged into one
+    coalesce_max_events = 100
+
+    def __init__(
+        self, workers, register_handlers, on_processed=None, log=None,
+        coalesce_window=0.0
+    ):
+        self.workers = max(int(workers), 1)
+        self.register_handlers = register_handlers
+        self.on_processed = on_processed
+        self.log = log or logging.getLogger(self.__class__.__name__)
+        self.coalesce_window = max(float(coalesce_window), 0.0)
+        self.latency = HandlerLatency()
+
+        self._coalesced_lock = threading.Lock()
+        self._coalesced_count = 0
+
+        self._queues = []
+        self._threads = []
+        self._sessions = []
+
+    def start(self):
+        """Create worker sessions, register handlers and start workers."""
+        for idx in range(self.workers):
+            session = SocketSession(
+                auto_connect_event_hub=True,
+                Eventhub=WorkerEventHub,
+                plugin_paths=[]
+            )
+            self.register_handlers(session)
+            for subscriber in session.event_hub._subscribers:
+                subscriber.callback = self.latency.wrap(
+                    self._callback_name(subscriber.callback),
+                    subscriber.callback
+                )
+
+            event_queue = queue.Queue()
+            thread = threading.Thread(
+                target=self._worker_loop, args=(session, event_queue)
+            )
+            thread.daemon = True
+            thread.start()
+
+            self._sessions.append(session)
+            self._queues.append(event_queue)
+            self._threads.append(thread)
+
+        self.log.debug(
+            "Event dispatcher started with {} workers.".format(self.workers)
+        )
+
+    def stop(self):
+        """Process already queued events and stop workers."""
+        for event_queue in self._queues:
+            event_queue.put(None)
+
+        for thread in self._threads:
+            thread.join()
+
+        for session in self._sessions:
+            try:
+                session.close()
+            except Exception:
+                pass
+
+        self._queues = []
+        self._threads = []
+        self._sessions = []
+
+    def dispatch(self, event):
+        """Queue event to worker of event's project.
+
+        Returns:
+            bool: Event was queued. Event must be handled by caller if is
+                not dispatched.
+        """
+        if not self._queues or event["topic"] not in self.topics:
+            return False
+
+        # Events without project have fixed partition so they keep order
+        # with other dispatched events
+        idx = 0
+        project_id = get_event_project_id(event)
+        if project_id is not None:
+            idx = zlib.crc32(project_id.encode("utf-8")) % len(self._queues)
+        self._queues[idx].put(event)
+        return True
+
+    def queue_depth(self):
+        return sum(event_queue.qsize() for event_queue in self._queues)
+
+    def status_info(self):
+        """Information shown in event server status."""
+        info = {
+            "Workers": len(self._threads),
+            "Queued events": self.queue_depth(),
+            "Coalesced events": self._coalesced_count
+        }
+        for name, (count, average, maximum) in self.latency.items():
+            info[name] = "{} events | avg {:.2f}s | max {:.2f}s".format(
+                count, average, maximum
+            )
+        return info
+
+    @staticmethod
+    def _callback_name(callback):
+        handler = getattr(callback, "__self__", None)
+        if handler is not None:
+            return handler.__class__.__name__
+        return getattr(callback, "__name__", str(callback))
+
+    def _collect_events(self, event_queue, event):
+        """Collect events received within coalesce window.
+
+        Returns:
+            tuple: Collected events and if stop was requested.
+        """
+        events = [event]
+        if not self.coalesce_window:
+            return events, False
+
+        deadline = time.time() + self.coalesce_window
+        while len(events) < self.coalesce_max_events:
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                break
+            try:
+                event = event_queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if event is None:
+                return events, True
+            events.append(event)
+        return events, False
+
+    def _worker_loop(self, session, event_queue):
+        while True:
+            event = event_queue.get()
+            if event is None:
+                break
+
+            events, stop = self._collect_events(event_queue, event)
+            if len(events) > 1:
+                handle_items = coalesce_events(events)
+                coalesced = len(events) - len(handle_items)
+                if coalesced:
+                    with self._coalesced_lock:
+                        self._coalesced_count += coalesced
+                    self.log.debug("Coalesced {} events into {}.".format(
+                        len(events), len(handle_items)
+                    ))
+            else:
+                handle_items = [(event, events)]
+
+            for handle_event, source_events in handle_items:
+                self._handle_event(session, handle_event, source_events)
+
+            if stop:
+                break
+
+    def _handle_event(self, session, event, source_events):
+        try:
+            session.event_hub._handle(event)
+        except Exception:
+            self.log.error(
+                "Handling of event {} failed.".format(event["id"]),
+                exc_info=True
+            )
+
+        if self.on_processed is None:
+            return
+
+        for source_event in source_events:
+            try:
+                self.on_processed(source_event)
+            except Exception:
+                self.log.error(
+                    "Event {} can't be set as processed.".format(
+                        source_event["id"]
+                    ),
+                    exc_info=True
+                )
+
+
 class SocketBaseEventHub(ftrack_api.event.hub.EventHub):
 
     hearbeat_msg = b"hearbeat"
@@ -158,6 +724,26 @@ class ProcessEventHub(SocketBaseEventHub):
     is_table_created = False
     pypelog = Logger().get_logger("Session Processor")
 
+    # Processed events older than this number of days are removed
+    processed_events_retention_days = 3
+    # Interval in seconds of removing old processed events
+    purge_interval = 60 * 60
+    # Timeout in seconds of waiting for change stream notification
+    change_stream_timeout = 1.0
+    # Safety reload of events in seconds when change streams are used
+    reload_interval = 10.0
+    # Sleep in seconds between queries when change streams are not available
+    poll_interval = 0.5
+    # Events are stored with write-behind buffer so they may become visible
+    # after later stored events. Incremental loads query also events stored
+    # this number of seconds before last loaded event.
+    stored_rewind = 10.0
+    # Interval in seconds of loading all not processed events (e.g. events
+    # delayed in storer's buffer while Mongo was not responding)
+    full_load_interval = 60.0
+    # Seconds for which ids of loaded events are kept to skip duplicates
+    loaded_ids_retention = 60 * 60
+
     def __init__(self, *args, **kwargs):
         self.dbcon = CustomDbConnector(
             self.uri,
@@ -165,12 +751,31 @@ class ProcessEventHub(SocketBaseEventHub):
             self.port,
             self.table_name
         )
+        # Stored date of last loaded event
+        self._last_stored = None
+        # Load time by id of loaded events
+        self._loaded_ids = {}
+        self._last_full_load = None
+
+        self._change_stream = None
+        self._change_stream_supported = True
+        self._purge_thread = None
+        # Write-behind buffer of processed flags
+        self._processed_buffer = None
+        # Optional dispatcher of events to worker threads
+        self.dispatcher = None
         super(ProcessEventHub, self).__init__(*args, **kwargs)
 
     def prepare_dbcon(self):
         try:
             self.dbcon.install()
             self.dbcon._database.list_collection_names()
+            create_event_indexes(self.dbcon)
+            if self._processed_buffer is None:
+                self._processed_buffer = BulkWriteBuffer(
+                    self.dbcon, log=self.pypelog
+                )
+            self._processed_buffer.start()
         except pymongo.errors.AutoReconnect:
             self.pypelog.error(
                 "Mongo server \"{}\" is not responding, exiting.".format(
@@ -191,24 +796,48 @@ class ProcessEventHub(SocketBaseEventHub):
     def wait(self, duration=None):
         """Overriden wait
 
-        Event are loaded from Mongo DB when queue is empty. Handled event is
-        set as processed in Mongo DB.
+        Event are loaded from Mongo DB when queue is empty (see
+        `load_events`). Mongo change streams are
+        used to get notification about newly stored events, when they are
+        not available (Mongo is not a replica set) are new events polled.
+        Handled event is set as processed in Mongo DB.
         """
         started = time.time()
         self.prepare_dbcon()
+        self.start_purge_thread()
+
+        last_load = None
         while True:
             try:
                 event = self._event_queue.get(timeout=0.1)
             except queue.Empty:
-                if not self.load_events():
-                    time.sleep(0.5)
+                if self.load_events():
+                    last_load = time.time()
+                    continue
+
+                # Wait for notification about new events
+                while True:
+                    if self.wait_for_stored_events():
+                        break
+
+                    if (
+                        last_load is None
+                        or (time.time() - last_load) > self.reload_interval
+                    ):
+                        break
+
+                    if duration is not None:
+                        if (time.time() - started) > duration:
+                            break
+                last_load = time.time()
             else:
                 try:
-                    self._handle(event)
-                    self.dbcon.update_one(
-                        {"id": event["id"]},
-                        {"$set": {"pype_data.is_processed": True}}
-                    )
+                    if (
+                        self.dispatcher is None
+                        or not self.dispatcher.dispatch(event)
+                    ):
+                        self._handle(event)
+                        self.mark_processed(event)
                 except pymongo.errors.AutoReconnect:
                     self.pypelog.error((
                         "Mongo server \"{}\" is not responding, exiting."
@@ -222,22 +851,134 @@ class ProcessEventHub(SocketBaseEventHub):
                 if (time.time() - started) > duration:
                     break
 
-    def load_events(self):
-        """Load not processed events sorted by stored date"""
-        ago_date = datetime.datetime.now() - datetime.timedelta(days=3)
+        # Make sure all dispatched events are handled and processed flags
+        # are stored
+        if self.dispatcher is not None:
+            self.dispatcher.stop()
+        self._processed_buffer.stop()
+
+    def mark_processed(self, event):
+        """Set event as processed in Mongo DB."""
+        self._processed_buffer.add(UpdateOne(
+            {"id": event["id"]},
+            {"$set": {"pype_data.is_processed": True}}
+        ))
+
+    def wait_for_stored_events(self):
+        """Block until new event is stored or timeout has passed.
+
+        Returns:
+            bool: New event was stored. Always `True` when change streams are
+                not available and `poll_interval` has passed.
+        """
+        if self._change_stream is None and self._change_stream_supported:
+            try:
+                self._change_stream = self.dbcon.watch(
+                    [{"$match": {
+                        "operationType": {"$in": ["insert", "replace"]}
+                    }}],
+                    max_await_time_ms=int(self.change_stream_timeout * 1000)
+                )
+                self.pypelog.debug("Watching stored events.")
+
+            except pymongo.errors.PyMongoError:
+                self._change_stream_supported = False
+                self.pypelog.info((
+                    "Mongo change streams are not available."
+                    " Stored events will be polled."
+                ))
+
+        if self._change_stream is None:
+            time.sleep(self.poll_interval)
+            return True
+
+        try:
+            return self._change_stream.try_next() is not None
+
+        except pymongo.errors.PyMongoError:
+            self.pypelog.warning(
+                "Change stream failed. Reopening.", exc_info=True
+            )
+            try:
+                self._change_stream.close()
+            except pymongo.errors.PyMongoError:
+                pass
+            self._change_stream = None
+            return True
+
+    def start_purge_thread(self):
+        """Start thread removing old processed events."""
+        if self._purge_thread is not None:
+            return
+
+        self._purge_thread = threading.Thread(target=self._purge_loop)
+        self._purge_thread.daemon = True
+        self._purge_thread.start()
+
+    def _purge_loop(self):
+        while True:
+            try:
+                self.purge_processed_events()
+            except Exception:
+                self.pypelog.warning(
+                    "Removing of old processed events failed.", exc_info=True
+                )
+            time.sleep(self.purge_interval)
+
+    def purge_processed_events(self):
+        """Remove processed events older than retention days."""
+        ago_date = datetime.datetime.now() - datetime.timedelta(
+            days=self.processed_events_retention_days
+        )
         self.dbcon.delete_many({
             "pype_data.stored": {"$lte": ago_date},
             "pype_data.is_processed": True
         })
 
-        not_processed_events = self.dbcon.find(
-            {"pype_data.is_processed": False}
-        ).sort(
+    def load_events(self):
+        """Load not processed events sorted by stored date.
+
+        Only events stored after previously loaded events (minus
+        `stored_rewind`) are queried. All not processed events are queried
+        in `full_load_interval`. Already loaded events are skipped.
+        """
+        now = time.time()
+        query = {"pype_data.is_processed": False}
+        is_full_load = (
+            self._last_stored is None
+            or self._last_full_load is None
+            or now - self._last_full_load >= self.full_load_interval
+        )
+        if is_full_load:
+            self._last_full_load = now
+            retention_limit = now - self.loaded_ids_retention
+            self._loaded_ids = {
+                event_id: loaded
+                for event_id, loaded in self._loaded_ids.items()
+                if loaded >= retention_limit
+            }
+        else:
+            query["pype_data.stored"] = {
+                "$gte": self._last_stored - datetime.timedelta(
+                    seconds=self.stored_rewind
+                )
+            }
+
+        not_processed_events = self.dbcon.find(query).sort(
             [("pype_data.stored", pymongo.ASCENDING)]
         )
 
         found = False
         for event_data in not_processed_events:
+            stored = event_data["pype_data"]["stored"]
+            if self._last_stored is None or stored > self._last_stored:
+                self._last_stored = stored
+
+            event_id = event_data.get("id")
+            if event_id in self._loaded_ids:
+                continue
+            self._loaded_ids[event_id] = now
+
             new_event_data = {
                 k: v for k, v in event_data.items()
                 if k not in ["_id", "pype_data"]
@@ -264,6 +1005,28 @@ class ProcessEventHub(SocketBaseEventHub):
         return super()._handle_packet(code, packet_identifier, path, data)
 
 
+class WorkerEventHub(ftrack_api.event.hub.EventHub):
+    """Event hub of EventDispatcher worker sessions.
+
+    Received events are skipped as events are dispatched to workers from
+    processor's session. Hub is connected to be able publish events.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.pop("sock", None)
+        super(WorkerEventHub, self).__init__(*args, **kwargs)
+
+    def _handle_packet(self, code, packet_identifier, path, data):
+        """Override `_handle_packet` which skip events"""
+        code_name = self._code_name_mapping[code]
+        if code_name == "event":
+            return
+
+        return super(WorkerEventHub, self)._handle_packet(
+            code, packet_identifier, path, data
+        )
+
+
 class SocketSession(ftrack_api.session.Session):
     '''An isolated session for interaction with an ftrack server.'''
     def __init__(
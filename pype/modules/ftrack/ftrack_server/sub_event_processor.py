@@ -6,10 +6,10 @@ import datetime
 
 from ftrack_server import FtrackServer
 from pype.modules.ftrack.ftrack_server.lib import (
-    SocketSession, ProcessEventHub, TOPIC_STATUS_SERVER
+    SocketSession, ProcessEventHub, EventDispatcher, TOPIC_STATUS_SERVER
 )
 import ftrack_api
-from pype.api import Logger, config
+from pype.api import Logger, get_presets
 
 log = Logger().get_logger("Event processor")
 
@@ -32,12 +32,17 @@ def send_status(event):
     if not session:
         return
 
+    status_info = {
+        "created_at": subprocess_started.strftime("%Y.%m.%d %H:%M:%S")
+    }
+    dispatcher = session.event_hub.dispatcher
+    if dispatcher is not None:
+        status_info.update(dispatcher.status_info())
+
     new_event_data = {
         "subprocess_id": subprocess_id,
         "source": "processor",
-        "status_info": {
-            "created_at": subprocess_started.strftime("%Y.%m.%d %H:%M:%S")
-        }
+        "status_info": status_info
     }
 
     new_event = ftrack_api.event.base.Event(
@@ -58,7 +63,7 @@ def register(session):
 def clockify_module_registration():
     module_name = "Clockify"
 
-    menu_items = config.get_presets()["tray"]["menu_items"]
+    menu_items = get_presets()["tray"]["menu_items"]
     if not menu_items["item_usage"][module_name]:
         return
 
@@ -91,6 +96,43 @@ def clockify_module_registration():
     return True
 
 
+def start_dispatcher(session):
+    """Start dispatcher of ftrack.update events to worker threads.
+
+    Dispatcher is disabled by default. Number of workers is set with
+    "PYPE_FTRACK_EVENT_WORKERS" environment, each worker has its own ftrack
+    session with all event handlers registered. Events are processed only
+    in main thread when not set or set to `0`. Events
+    received within "PYPE_FTRACK_EVENT_COALESCE_WINDOW" seconds are merged,
+    merging is disabled when set to `0`.
+    """
+    workers = int(os.environ.get("PYPE_FTRACK_EVENT_WORKERS") or 0)
+    coalesce_window = float(
+        os.environ.get("PYPE_FTRACK_EVENT_COALESCE_WINDOW") or 0.5
+    )
+    if workers < 1:
+        return
+
+    paths_str = os.environ.get("FTRACK_EVENTS_PATH")
+    if not paths_str:
+        return
+
+    def register_handlers(worker_session):
+        server = FtrackServer("event")
+        server.session = worker_session
+        server.set_files(paths_str.split(os.pathsep))
+
+    dispatcher = EventDispatcher(
+        workers,
+        register_handlers,
+        on_processed=session.event_hub.mark_processed,
+        log=log,
+        coalesce_window=coalesce_window
+    )
+    dispatcher.start()
+    session.event_hub.dispatcher = dispatcher
+
+
 def main(args):
     port = int(args[-1])
     # Create a TCP/IP socket
@@ -113,6 +155,7 @@ def main(args):
         )
         register(session)
         SessionFactory.session = session
+        start_dispatcher(session)
 
         server = FtrackServer("event")
         log.debug("Launched Ftrack Event processor")
@@ -12,7 +12,7 @@ from pype.modules.ftrack.ftrack_server.lib import (
     SocketSession, StatusEventHub,
     TOPIC_STATUS_SERVER, TOPIC_STATUS_SERVER_RESULT
 )
-from pype.api import Logger, config
+from pype.api import Logger, get_presets
 
 log = Logger().get_logger("Event storer")
 action_identifier = (
@@ -28,7 +28,7 @@ action_data = {
         os.environ.get(
             "PYPE_STATICS_SERVER",
             "http://localhost:{}".format(
-                config.get_presets().get("services", {}).get(
+                get_presets().get("services", {}).get(
                     "rest_api", {}
                 ).get("default_port", 8021)
             )
@@ -4,12 +4,13 @@ import datetime
 import signal
 import socket
 import pymongo
+from pymongo import ReplaceOne
 
 import ftrack_api
 from ftrack_server import FtrackServer
 from pype.modules.ftrack.ftrack_server.lib import (
-    SocketSession, StorerEventHub,
-    get_ftrack_event_mongo_info,
+    SocketSession, StorerEventHub, BulkWriteBuffer,
+    get_ftrack_event_mongo_info, create_event_indexes,
     TOPIC_STATUS_SERVER, TOPIC_STATUS_SERVER_RESULT
 )
 from pype.modules.ftrack.lib.custom_db_connector import CustomDbConnector
@@ -25,6 +26,8 @@ class SessionFactory:
 
 uri, port, database, table_name = get_ftrack_event_mongo_info()
 dbcon = CustomDbConnector(uri, database, port, table_name)
+# Stored events are written in batches
+write_buffer = BulkWriteBuffer(dbcon, log=log)
 
 # ignore_topics = ["ftrack.meta.connected"]
 ignore_topics = []
@@ -34,6 +37,8 @@ def install_db():
     try:
         dbcon.install()
         dbcon._database.list_collection_names()
+        create_event_indexes(dbcon)
+        write_buffer.start()
     except pymongo.errors.AutoReconnect:
         log.error("Mongo server \"{}\" is not responding, exiting.".format(
             os.environ["AVALON_MONGO"]
@@ -45,6 +50,13 @@ def launch(event):
     if event.get("topic") in ignore_topics:
         return
 
+    # Exit so the server restarts the storer when Mongo is back
+    if write_buffer.is_failing:
+        log.error("Mongo server \"{}\" is not responding, exiting.".format(
+            os.environ["AVALON_MONGO"]
+        ))
+        sys.exit(0)
+
     event_data = event._data
     event_id = event["id"]
 
@@ -53,22 +65,8 @@ def launch(event):
         "is_processed": False
     }
 
-    try:
-        # dbcon.insert_one(event_data)
-        dbcon.replace_one({"id": event_id}, event_data, upsert=True)
-        log.debug("Event: {} stored".format(event_id))
-
-    except pymongo.errors.AutoReconnect:
-        log.error("Mongo server \"{}\" is not responding, exiting.".format(
-            os.environ["AVALON_MONGO"]
-        ))
-        sys.exit(0)
-
-    except Exception as exc:
-        log.error(
-            "Event: {} failed to store".format(event_id),
-            exc_info=True
-        )
+    write_buffer.add(ReplaceOne({"id": event_id}, event_data, upsert=True))
+    log.debug("Event: {} added to write buffer".format(event_id))
 
 
 def trigger_sync(event):
@@ -85,6 +83,9 @@ def trigger_sync(event):
     if not projects:
         return True
 
+    # Make sure all received events are stored
+    write_buffer.flush()
+
     query = {
         "pype_data.is_processed": False,
         "topic": "ftrack.action.launch",
@@ -204,6 +205,12 @@ def main(args):
         sock.sendall(b"MongoError")
 
     finally:
+        try:
+            write_buffer.stop()
+        except pymongo.errors.AutoReconnect:
+            log.error("Mongo server \"{}\" is not responding.".format(
+                os.environ["AVALON_MONGO"]
+            ))
         log.debug("First closing socket")
         sock.close()
         return 1
@@ -213,6 +220,7 @@ if __name__ == "__main__":
     # Register interupt signal
     def signal_handler(sig, frame):
         print("You pressed Ctrl+C. Process ended.")
+        write_buffer.stop()
         sys.exit(0)
 
     signal.signal(signal.SIGINT, signal_handler)
@@ -4,8 +4,12 @@ import queue
 import json
 import collections
 import copy
+import time
+import hashlib
+import datetime
 
 from pype.modules.ftrack.lib.io_nonsingleton import DbConnector
+from pype.modules.ftrack.lib.custom_db_connector import CustomDbConnector
 
 import avalon
 import avalon.api
@@ -14,6 +18,7 @@ from pype.api import Logger, Anatomy
 
 from bson.objectid import ObjectId
 from bson.errors import InvalidId
+import pymongo
 from pymongo import UpdateOne
 import ftrack_api
 
@@ -239,6 +244,230 @@ def get_hierarchical_attributes(session, entity, attr_names, attr_defaults={}):
     return hier_values
 
 
+class AvalonEntityCache(object):
+    """Cache of avalon project documents kept across synchronizations.
+
+    Assets and archived assets of project are queried once and kept in
+    memory. Cached project is revalidated with project document of sync
+    state collection which holds watermark of last ftrack synchronization
+    and counter of changes. Writers of asset documents bump the counter with
+    `mark_changed`. Project is reloaded when any of them changed or if it is
+    older than `ttl`. Subsets are loaded lazily and then only subsets
+    created since last check are queried.
+
+    Documents returned by `get` and `subsets_by_parent` are shared with the
+    cache and must not be modified, copy document before it's changed.
+    Documents changed by the cache owner must be passed to
+    `update_entities` (removed or archived documents to `evict`) so cached
+    documents match database.
+
+    Args:
+        max_projects (int): Max number of cached projects.
+        ttl (float): Seconds after which project documents are reloaded.
+    """
+
+    # Seconds subtracted from time of last subset check (clock skew)
+    subset_check_margin = 60
+
+    def __init__(self, max_projects=5, ttl=600):
+        self.max_projects = max_projects
+        self.ttl = ttl
+        self._projects = collections.OrderedDict()
+
+    def get(self, dbcon, project_name):
+        """Cached documents of project.
+
+        Args:
+            dbcon (DbConnector): Connection with `project_name` set as
+                active project.
+            project_name (str): Name of avalon project.
+
+        Returns:
+            dict: Cached "project" document, "assets" and "archived" assets
+                by their ids. Returned data must not be modified.
+        """
+        item = self._get_item(dbcon, project_name)
+        return {
+            "project": item["project"],
+            "assets": item["assets"],
+            "archived": item["archived"]
+        }
+
+    def _get_item(self, dbcon, project_name):
+        token = self.validation_token(dbcon)
+        item = self._projects.pop(project_name, None)
+        if (
+            item is None
+            or item["token"] != token
+            or time.time() - item["loaded"] > self.ttl
+        ):
+            item = self._load(dbcon, token)
+
+        self._projects[project_name] = item
+        while len(self._projects) > self.max_projects:
+            self._projects.popitem(last=False)
+        return item
+
+    def invalidate(self, project_name=None):
+        """Remove cached documents of project or of all projects."""
+        if project_name is None:
+            self._projects.clear()
+        else:
+            self._projects.pop(project_name, None)
+
+    def validation_token(self, dbcon):
+        """Values which change when other process changes assets."""
+        state_col = dbcon[SyncEntitiesFactory.sync_state_collection]
+        sync_state = state_col.find_one(
+            {
+                "type": "project",
+                "project_name": dbcon.Session["AVALON_PROJECT"]
+            },
+            {"watermark": True, "changes": True}
+        )
+        return self._token_from_state(sync_state)
+
+    @staticmethod
+    def _token_from_state(sync_state):
+        sync_state = sync_state or {}
+        return (sync_state.get("watermark"), sync_state.get("changes") or 0)
+
+    def mark_changed(self, dbcon, ft_project_id, project_name):
+        """Bump counter of changes so other caches reload the project.
+
+        Must be called after asset documents of project were changed.
+        Cached project of this cache stays valid only if nobody else changed
+        the project since it was validated, changed documents must be
+        already passed to `update_entities`.
+
+        Args:
+            dbcon (DbConnector): Connection with `project_name` set as
+                active project.
+            ft_project_id (str): Id of ftrack project.
+            project_name (str): Name of avalon project.
+        """
+        state_col = dbcon[SyncEntitiesFactory.sync_state_collection]
+        sync_state = state_col.find_one_and_update(
+            {"type": "project", "project_id": ft_project_id},
+            {
+                "$set": {"project_name": project_name},
+                "$inc": {"changes": 1}
+            },
+            projection={"watermark": True, "changes": True},
+            upsert=True,
+            return_document=pymongo.ReturnDocument.AFTER
+        )
+        token = self._token_from_state(sync_state)
+
+        item = self._projects.get(project_name)
+        if item is None:
+            return
+
+        watermark, changes = token
+        if item["token"] == (watermark, changes - 1):
+            item["token"] = token
+        else:
+            self.invalidate(project_name)
+
+    def subsets_by_parent(self, dbcon, project_name):
+        """Subsets by their parent ids, subsets are loaded incrementally.
+
+        Args:
+            dbcon (DbConnector): Connection with `project_name` set as
+                active project.
+            project_name (str): Name of avalon project.
+
+        Returns:
+            collections.defaultdict: Cached subsets by parent id. Returned
+                data must not be modified.
+        """
+        item = self._projects.get(project_name)
+        if item is None:
+            item = self._get_item(dbcon, project_name)
+
+        check_time = datetime.datetime.utcnow()
+        if item["subsets_by_parent"] is None:
+            item["subsets_by_parent"] = collections.defaultdict(list)
+            query = {"type": "subset"}
+        else:
+            since = item["subsets_checked"] - datetime.timedelta(
+                seconds=self.subset_check_margin
+            )
+            query = {
+                "type": "subset",
+                "_id": {"$gte": ObjectId.from_datetime(since)}
+            }
+
+        for subset in dbcon.find(query, {"parent": True}):
+            if subset["_id"] in item["subset_ids"]:
+                continue
+            item["subset_ids"].add(subset["_id"])
+            item["subsets_by_parent"][subset["parent"]].append(subset)
+        item["subsets_checked"] = check_time
+        return item["subsets_by_parent"]
+
+    def evict(self, project_name, mongo_ids):
+        """Remove documents from cache (e.g. removed or archived assets).
+
+        Args:
+            project_name (str): Name of avalon project.
+            mongo_ids (iterable): Ids of removed documents.
+        """
+        item = self._projects.get(project_name)
+        if item is None:
+            return
+
+        for mongo_id in mongo_ids:
+            item["assets"].pop(mongo_id, None)
+            item["archived"].pop(mongo_id, None)
+
+    def update_entities(self, dbcon, project_name, mongo_ids):
+        """Reload passed documents in cache after they were changed.
+
+        Args:
+            dbcon (DbConnector): Connection with `project_name` set as
+                active project.
+            project_name (str): Name of avalon project.
+            mongo_ids (iterable): Ids of changed documents.
+        """
+        item = self._projects.get(project_name)
+        if item is None:
+            return
+
+        mongo_ids = set(mongo_ids)
+        if mongo_ids:
+            for mongo_id in mongo_ids:
+                item["assets"].pop(mongo_id, None)
+                item["archived"].pop(mongo_id, None)
+
+            for doc in dbcon.find({"_id": {"$in": list(mongo_ids)}}):
+                if doc["type"] == "project":
+                    item["project"] = doc
+                else:
+                    self._store_asset(item, doc)
+
+    def _load(self, dbcon, token):
+        item = {
+            "token": token,
+            "loaded": time.time(),
+            "project": dbcon.find_one({"type": "project"}),
+            "assets": collections.OrderedDict(),
+            "archived": {},
+            "subsets_by_parent": None,
+            "subset_ids": set(),
+            "subsets_checked": None
+        }
+        for doc in dbcon.find({"type": {"$in": ["asset", "archived_asset"]}}):
+            self._store_asset(item, doc)
+        return item
+
+    def _store_asset(self, item, doc):
+        if doc["type"] == "asset":
+            item["assets"][doc["_id"]] = doc
+        elif doc["type"] == "archived_asset":
+            item["archived"][doc["_id"]] = doc
+
+
 class SyncEntitiesFactory:
     dbcon = DbConnector()
 
@@ -251,18 +480,46 @@ class SyncEntitiesFactory:
         "select id, name, parent_id, link"
         " from TypedContext where project_id is \"{}\""
     )
+    incremental_entities_query = (
+        "select id, name, parent_id, link"
+        " from TypedContext where project_id is \"{}\""
+        " and (id in ({}) or ancestors any (id in ({})))"
+    )
+    context_entities_query = (
+        "select id, name, parent_id, link"
+        " from TypedContext where id in ({})"
+    )
     ignore_custom_attr_key = "avalon_ignore_sync"
     ignore_entity_types = ["milestone"]
 
     report_splitter = {"type": "label", "value": "---"}
 
+    # Collection in avalon database where state of synchronization is stored
+    sync_state_collection = "ftrack_sync_state"
+    # Full synchronization is used if last one is older than this (days)
+    full_sync_interval_days = 7
+    # Full synchronization is used if more entities were changed
+    incremental_max_changes = 1000
+    # Seconds subtracted from watermark to cover clock skew between machines
+    watermark_margin = 60
+    # Max number of ids in one ftrack query
+    query_chunk_size = 100
+
     def __init__(self, log_obj, session):
         self.log = log_obj
         self._server_url = session.server_url
         self._api_key = session.api_key
         self._api_user = session.api_user
 
-    def launch_setup(self, project_full_name):
+    def launch_setup(self, project_full_name, incremental=False):
+        """Prepare ftrack entities for synchronization.
+
+        Args:
+            project_full_name (str): Full name of synchronized project.
+            incremental (bool): Query only entities changed since last
+                synchronization. Full synchronization is used when there is
+                not enough information about changes.
+        """
         try:
             self.session.close()
         except Exception:
@@ -317,6 +574,14 @@ class SyncEntitiesFactory:
         self.update_ftrack_ids = None
         self.deleted_entities = None
 
+        self.incremental = False
+        # Parents of changed entities which are used only as context
+        self.context_ftrack_ids = set()
+        self.removed_ftrack_ids = set()
+        self.removed_mongo_ids = set()
+        self.stored_hashes = {}
+        self.sync_started = datetime.datetime.utcnow()
+
         # Get Ftrack project
         ft_project = self.session.query(
             self.project_query.format(project_full_name)
@@ -363,10 +628,17 @@ class SyncEntitiesFactory:
                 "message": "Synchronization failed"
             }
 
-        # Find all entities in project
-        all_project_entities = self.session.query(
-            self.entities_query.format(ft_project_id)
-        ).all()
+        all_project_entities = None
+        if incremental:
+            all_project_entities = self.query_incremental_entities(
+                ft_project_id, project_full_name
+            )
+
+        if all_project_entities is None:
+            # Find all entities in project
+            all_project_entities = self.session.query(
+                self.entities_query.format(ft_project_id)
+            ).all()
 
         # Store entities by `id` and `parent_id`
         entities_dict = collections.defaultdict(lambda: {
@@ -414,6 +686,330 @@ class SyncEntitiesFactory:
         self.ft_project_id = ft_project_id
         self.entities_dict = entities_dict
 
+    @property
+    def sync_state_col(self):
+        return self.dbcon[self.sync_state_collection]
+
+    def join_query_keys(self, keys):
+        return ", ".join(["\"{}\"".format(key) for key in keys])
+
+    def query_by_chunks(self, query, ids, *args):
+        """Query entities by ids split into chunks to keep queries short."""
+        ids = list(ids)
+        output = []
+        for idx in range(0, len(ids), self.query_chunk_size):
+            joined_ids = self.join_query_keys(
+                ids[idx:idx + self.query_chunk_size]
+            )
+            format_args = list(args)
+            format_args.extend([joined_ids] * query.count("({})"))
+            output.extend(self.session.query(
+                query.format(*format_args)
+            ).all())
+        return output
+
+    def query_incremental_entities(self, ft_project_id, project_name):
+        """Query only entities changed since last synchronization.
+
+        Changed entities are queried with all their children. Their parents
+        are queried too but are used only as context for hierarchy and
+        hierarchical attributes and are not synchronized.
+
+        Returns:
+            list/None: Queried entities or None if full synchronization
+                must be used.
+        """
+        self.dbcon.install()
+        self.dbcon.Session["AVALON_PROJECT"] = project_name
+
+        state = self.sync_state_col.find_one({
+            "type": "project",
+            "project_id": ft_project_id
+        })
+        if not state or not state.get("watermark"):
+            self.log.info((
+                "Project was not synchronized with state of synchronization."
+                " Using full synchronization."
+            ))
+            return None
+
+        last_full_sync = state.get("last_full_sync")
+        full_sync_interval = datetime.timedelta(
+            days=self.full_sync_interval_days
+        )
+        if (
+            not last_full_sync
+            or self.sync_started - last_full_sync > full_sync_interval
+        ):
+            self.log.info((
+                "Last full synchronization is older than {} days."
+                " Using full synchronization."
+            ).format(self.full_sync_interval_days))
+            return None
+
+        changes = self.query_changed_entity_ids(
+            ft_project_id, state["watermark"]
+        )
+        if changes is None:
+            return None
+
+        changed_ids, removed_ids, removed_parent_ids = changes
+        if ft_project_id in changed_ids:
+            # Hierarchical values of project may affect all entities
+            self.log.info(
+                "Project entity was changed. Using full synchronization."
+            )
+            return None
+
+        changes_count = len(changed_ids) + len(removed_ids)
+        if changes_count > self.incremental_max_changes:
+            self.log.info((
+                "Too many changed entities ({}). Using full synchronization."
+            ).format(changes_count))
+            return None
+
+        entities = self.query_by_chunks(
+            self.incremental_entities_query, changed_ids, ft_project_id
+        )
+        found_ids = set(entity["id"] for entity in entities)
+
+        # Query parents of changed and removed entities which are missing
+        # - first item of link is project and last is entity itself
+        context_ids = set()
+        missing_ids = set(removed_parent_ids)
+        queried_entities = entities
+        while True:
+            for entity in queried_entities:
+                for link in entity["link"][1:-1]:
+                    missing_ids.add(link["id"])
+
+            missing_ids -= found_ids
+            missing_ids -= context_ids
+            missing_ids.discard(ft_project_id)
+            if not missing_ids:
+                break
+
+            queried_entities = self.query_by_chunks(
+                self.context_entities_query, missing_ids
+            )
+            entities.extend(queried_entities)
+            context_ids |= missing_ids
+            missing_ids = set()
+
+        context_ids.add(ft_project_id)
+
+        self.incremental = True
+        self.context_ftrack_ids = context_ids
+        self.removed_ftrack_ids = removed_ids
+        self.stored_hashes = {
+            item["ftrack_id"]: item
+            for item in self.sync_state_col.find({
+                "type": "entity",
+                "project_id": ft_project_id,
+                "ftrack_id": {"$in": list(found_ids)}
+            })
+        }
+        self.log.debug((
+            "Incremental synchronization: Changed <{}> | Removed <{}>"
+            " | Queried <{}>"
+        ).format(len(changed_ids), len(removed_ids), len(entities)))
+        return entities
+
+    def query_changed_entity_ids(self, ft_project_id, since):
+        """Collect ids of project entities changed since passed date.
+
+        Events stored by event server are used as log of changes.
+
+        Args:
+            ft_project_id (str): Id of ftrack project.
+            since (datetime.datetime): Date of last synchronization.
+
+        Returns:
+            tuple/None: Sets of changed entity ids, removed entity ids and
+                parent ids of removed entities or None if stored events
+                don't cover whole period.
+        """
+        # Import here to avoid circular import
+        from pype.modules.ftrack.ftrack_server.lib import (
+            get_ftrack_event_mongo_info
+        )
+
+        since = since - datetime.timedelta(seconds=self.watermark_margin)
+        uri, port, database, table_name = get_ftrack_event_mongo_info()
+        dbcon = CustomDbConnector(uri, database, port, table_name)
+        try:
+            dbcon.install()
+            oldest_event = dbcon.find_one(
+                {}, sort=[("pype_data.stored", pymongo.ASCENDING)]
+            )
+            if (
+                not oldest_event
+                or oldest_event["pype_data"]["stored"] > since
+            ):
+                self.log.info((
+                    "Stored events don't cover period since last"
+                    " synchronization. Using full synchronization."
+                ))
+                return None
+
+            events = dbcon.find(
+                {
+                    "topic": "ftrack.update",
+                    "pype_data.stored": {"$gte": since},
+                    "$or": [
+                        {"data.entities.entityId": ft_project_id},
+                        {"data.entities.parents.entityId": ft_project_id}
+                    ]
+                },
+                projection={"data.entities": True}
+            )
+            changed_ids = set()
+            removed_ids = set()
+            removed_parent_ids = set()
+            for event_data in events:
+                entities_info = event_data.get("data", {}).get("entities")
+                for ent_info in entities_info or []:
+                    if ent_info.get("entityType") not in ("show", "task"):
+                        continue
+
+                    ftrack_id = ent_info.get("entityId")
+                    if isinstance(ftrack_id, list):
+                        ftrack_id = ftrack_id[0] if ftrack_id else None
+                    if not ftrack_id:
+                        continue
+
+                    parent_id = None
+                    for parent in ent_info.get("parents") or []:
+                        _parent_id = parent.get("entityId")
+                        if _parent_id and _parent_id != ftrack_id:
+                            parent_id = _parent_id
+                            break
+
+                    entity_type = (ent_info.get("entity_type") or "").lower()
+                    if entity_type == "task":
+                        # Tasks are stored on their parent
+                        if parent_id:
+                            changed_ids.add(parent_id)
+                        continue
+
+                    if ent_info.get("action") == "remove":
+                        removed_ids.add(ftrack_id)
+                        if parent_id:
+                            removed_parent_ids.add(parent_id)
+                    else:
+                        changed_ids.add(ftrack_id)
+
+        except pymongo.errors.PyMongoError:
+            self.log.warning(
+                "Stored events can't be queried. Using full synchronization.",
+                exc_info=True
+            )
+            return None
+
+        finally:
+            dbcon.uninstall()
+
+        changed_ids -= removed_ids
+        removed_parent_ids -= removed_ids
+        return changed_ids, removed_ids, removed_parent_ids
+
+    def entity_content_hash(self, entity_dict):
+        """Hash of synchronized data of ftrack entity."""
+        content = {
+            "final_entity": entity_dict.get("final_entity"),
+            "parent_id": entity_dict.get("parent_id"),
+            "mongo_id": entity_dict["avalon_attrs"].get(CUST_ATTR_ID_KEY)
+        }
+        return hashlib.sha1(
+            json.dumps(content, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def filter_unchanged_by_hash(self):
+        """Skip entities which did not change since last synchronization."""
+        unchanged_ids = []
+        for ftrack_id in self.update_ftrack_ids:
+            if ftrack_id in self.context_ftrack_ids:
+                unchanged_ids.append(ftrack_id)
+                continue
+
+            stored = self.stored_hashes.get(ftrack_id)
+            if not stored:
+                continue
+
+            if (
+                stored["hash"] == self.entities_dict[ftrack_id].get(
+                    "content_hash"
+                )
+                and stored["mongo_id"] == str(
+                    self.ftrack_avalon_mapper[ftrack_id]
+                )
+            ):
+                unchanged_ids.append(ftrack_id)
+
+        for ftrack_id in unchanged_ids:
+            self.update_ftrack_ids.remove(ftrack_id)
+
+        self.log.debug("Unchanged entities <{}>".format(len(unchanged_ids)))
+
+    def store_sync_state(self):
+        """Store watermark and content hashes of synchronized entities."""
+        mongo_changes_bulk = []
+        for ftrack_id, entity_dict in self.entities_dict.items():
+            if ftrack_id in self.context_ftrack_ids:
+                continue
+
+            content_hash = entity_dict.get("content_hash")
+            mongo_id = self.ftrack_avalon_mapper.get(ftrack_id)
+            if not content_hash or not mongo_id:
+                continue
+
+            mongo_changes_bulk.append(UpdateOne(
+                {
+                    "type": "entity",
+                    "project_id": self.ft_project_id,
+                    "ftrack_id": ftrack_id
+                },
+                {"$set": {
+                    "mongo_id": str(mongo_id),
+                    "hash": content_hash,
+                    "synced": self.sync_started
+                }},
+                upsert=True
+            ))
+
+        state_col = self.sync_state_col
+        state_col.create_index([("project_id", 1), ("ftrack_id", 1)])
+        # Used by validation of `AvalonEntityCache`
+        state_col.create_index([("type", 1), ("project_name", 1)])
+        if mongo_changes_bulk:
+            state_col.bulk_write(mongo_changes_bulk)
+
+        project_state = {
+            "watermark": self.sync_started,
+            "project_name": self.entities_dict[self.ft_project_id]["name"]
+        }
+        if self.incremental:
+            if self.removed_ftrack_ids:
+                state_col.delete_many({
+                    "type": "entity",
+                    "project_id": self.ft_project_id,
+                    "ftrack_id": {"$in": list(self.removed_ftrack_ids)}
+                })
+        else:
+            project_state["last_full_sync"] = self.sync_started
+            state_col.delete_many({
+                "type": "entity",
+                "project_id": self.ft_project_id,
+                "synced": {"$lt": self.sync_started}
+            })
+
+        # Changes counter invalidates caches of avalon documents
+        state_col.update_one(
+            {"type": "project", "project_id": self.ft_project_id},
+            {"$set": project_state, "$inc": {"changes": 1}},
+            upsert=True
+        )
+
     @property
     def avalon_ents_by_id(self):
         if self._avalon_ents_by_id is None:
@@ -1041,6 +1637,11 @@ class SyncEntitiesFactory:
             for id in not_set_ids:
                 self.entities_dict.pop(id)
 
+        for entity_dict in self.entities_dict.values():
+            entity_dict["content_hash"] = self.entity_content_hash(
+                entity_dict
+            )
+
     def get_ent_path(self, ftrack_id):
         ent_path = self._ent_paths_by_ftrack_id.get(ftrack_id)
         if not ent_path:
@@ -1053,6 +1654,13 @@ class SyncEntitiesFactory:
         return ent_path
 
     def prepare_avalon_entities(self, ft_project_name):
+        """Separate entities to Create, Update and Deleted groups.
+
+        Returns:
+            bool: Incremental synchronization can't be used. Caller must
+                run full synchronization setup (`launch_setup` without
+                incremental) and prepare entities again.
+        """
         self.log.debug((
             "* Preparing avalon entities "
             "(separate to Create, Update and Deleted groups)"
@@ -1061,7 +1669,10 @@ class SyncEntitiesFactory:
         self.dbcon.install()
         self.dbcon.Session["AVALON_PROJECT"] = ft_project_name
         avalon_project = self.dbcon.find_one({"type": "project"})
-        avalon_entities = self.dbcon.find({"type": "asset"})
+        if self.incremental:
+            avalon_entities = self.query_incremental_avalon_entities()
+        else:
+            avalon_entities = self.dbcon.find({"type": "asset"})
         self.avalon_project = avalon_project
         self.avalon_entities = avalon_entities
 
@@ -1070,6 +1681,7 @@ class SyncEntitiesFactory:
         create_ftrack_ids = []
         update_ftrack_ids = []
 
+        matched_by_name = {}
         same_mongo_id = []
         all_mongo_ids = {}
         for ftrack_id, entity_dict in self.entities_dict.items():
@@ -1164,6 +1776,7 @@ class SyncEntitiesFactory:
             if not mongo_id:
                 mongo_id = self.avalon_ents_by_name.get(entity_dict["name"])
                 if mongo_id:
+                    matched_by_name[ftrack_id] = mongo_id
                     self.log.debug(
                         "Existing (by matching name) <{}>".format(ent_path)
                     )
@@ -1181,10 +1794,24 @@ class SyncEntitiesFactory:
             self.log.debug("New <{}>".format(ent_path))
             create_ftrack_ids.append(ftrack_id)
 
+        if self.incremental:
+            reason = self.check_incremental_integrity(
+                ftrack_avalon_mapper, create_ftrack_ids, matched_by_name
+            )
+            if reason:
+                self.log.info((
+                    "Incremental synchronization can't be used ({})."
+                    " Using full synchronization."
+                ).format(reason))
+                return True
+
         deleted_entities = []
         for mongo_id in self.avalon_ents_by_id:
             if mongo_id in avalon_ftrack_mapper:
                 continue
+            # Only entities removed in ftrack are known in incremental mode
+            if self.incremental and mongo_id not in self.removed_mongo_ids:
+                continue
             deleted_entities.append(mongo_id)
 
             av_ent = self.avalon_ents_by_id[mongo_id]
@@ -1206,6 +1833,105 @@ class SyncEntitiesFactory:
             len(update_ftrack_ids),
             len(deleted_entities)
         ))
+        return False
+
+    def query_incremental_avalon_entities(self):
+        """Query avalon assets related to entities of incremental sync.
+
+        Assets are queried by ftrack id, mongo id stored on ftrack entities
+        and by name. Assets of removed ftrack entities are queried with all
+        their children.
+        """
+        ftrack_ids = list(self.entities_dict.keys())
+        ftrack_ids.extend(self.removed_ftrack_ids)
+        mongo_ids = []
+        names = []
+        for entity_dict in self.entities_dict.values():
+            if entity_dict.get("name"):
+                names.append(entity_dict["name"])
+            mongo_id = entity_dict["avalon_attrs"].get(CUST_ATTR_ID_KEY)
+            if not mongo_id:
+                continue
+            try:
+                mongo_ids.append(ObjectId(mongo_id))
+            except InvalidId:
+                pass
+
+        avalon_entities = list(self.dbcon.find({
+            "type": "asset",
+            "$or": [
+                {"data.ftrackId": {"$in": ftrack_ids}},
+                {"_id": {"$in": mongo_ids}},
+                {"name": {"$in": names}}
+            ]
+        }))
+
+        removed_names = []
+        for entity in avalon_entities:
+            ftrack_id = entity.get("data", {}).get("ftrackId")
+            if ftrack_id in self.removed_ftrack_ids:
+                removed_names.append(entity["name"])
+                self.removed_mongo_ids.add(str(entity["_id"]))
+
+        if removed_names:
+            queried_ids = set(entity["_id"] for entity in avalon_entities)
+            for entity in self.dbcon.find({
+                "type": "asset",
+                "data.parents": {"$in": removed_names}
+            }):
+                self.removed_mongo_ids.add(str(entity["_id"]))
+                if entity["_id"] not in queried_ids:
+                    avalon_entities.append(entity)
+
+        return avalon_entities
+
+    def check_incremental_integrity(
+        self, ftrack_avalon_mapper, create_ftrack_ids, matched_by_name
+    ):
+        """Check if changes can be synchronized incrementally.
+
+        Returns:
+            str/None: Reason why full synchronization must be used.
+        """
+        for ftrack_id in self.context_ftrack_ids:
+            if ftrack_id in create_ftrack_ids:
+                return "parent is not synchronized <{}>".format(
+                    self.get_ent_path(ftrack_id)
+                )
+
+        for ftrack_id, mongo_id in matched_by_name.items():
+            av_ftrack_id = self.avalon_ents_by_id[mongo_id]["data"].get(
+                "ftrackId"
+            )
+            if (
+                av_ftrack_id
+                and av_ftrack_id != ftrack_id
+                and av_ftrack_id not in self.removed_ftrack_ids
+            ):
+                return "name is used by different entity <{}>".format(
+                    self.get_ent_path(ftrack_id)
+                )
+
+        for ftrack_id, mongo_id in ftrack_avalon_mapper.items():
+            if ftrack_id == self.ft_project_id:
+                continue
+
+            parent_id = self.entities_dict[ftrack_id]["parent_id"]
+            expected_parent = None
+            if parent_id != self.ft_project_id:
+                expected_parent = ftrack_avalon_mapper.get(parent_id)
+
+            avalon_parent = self.avalon_ents_by_id[mongo_id]["data"].get(
+                "visualParent"
+            )
+            if avalon_parent is not None:
+                avalon_parent = str(avalon_parent)
+
+            if avalon_parent != expected_parent:
+                return "hierarchy was changed <{}>".format(
+                    self.get_ent_path(ftrack_id)
+                )
+        return None
 
     def filter_with_children(self, ftrack_id):
         if ftrack_id not in self.entities_dict:
@@ -1565,6 +2291,9 @@ class SyncEntitiesFactory:
             elif ftrack_id in self.update_ftrack_ids:
                 self.update_ftrack_ids.remove(ftrack_id)
 
+        if self.incremental:
+            self.filter_unchanged_by_hash()
+
         self.log.debug("* Processing entities for archivation")
         self.delete_entities()
 
@@ -1587,6 +2316,13 @@ class SyncEntitiesFactory:
         self.update_entities()
         self.session.commit()
 
+        try:
+            self.store_sync_state()
+        except pymongo.errors.PyMongoError:
+            self.log.warning(
+                "Storing of synchronization state failed.", exc_info=True
+            )
+
     def create_avalon_entity(self, ftrack_id):
         if ftrack_id == self.ft_project_id:
             self.create_avalon_project()
@@ -1,16 +1,88 @@
 import os
 import sys
 import copy
+import time
 import platform
+import collections
 import avalon.lib
 import acre
 import getpass
 from pype import lib as pypelib
-from pype.api import config, Anatomy
-from .ftrack_action_handler import BaseAction
-from avalon.api import (
-    last_workfile, HOST_WORKFILE_EXTENSIONS, should_start_last_workfile
+from pype.api import Anatomy
+from pype.lib import (
+    get_ftrack_config_presets, get_presets_cache, get_last_workfile
 )
+from .ftrack_action_handler import BaseAction
+from avalon.api import HOST_WORKFILE_EXTENSIONS, should_start_last_workfile
+
+
+class LaunchContextCache(object):
+    """Cache of launch contexts shared by application actions.
+
+    Launch context contains data which are expensive to compute for each
+    launch (anatomy, filled work directory and environments of tools).
+    Contexts are stored by key which contains project, asset, task,
+    application and tools so change of asset document or presets leads to
+    new key. Items are also invalidated after `ttl` seconds.
+
+    Args:
+        max_items (int): Max number of stored contexts.
+        ttl (int): Seconds after which is context computed again.
+    """
+
+    def __init__(self, max_items=50, ttl=600):
+        self.max_items = max_items
+        self.ttl = ttl
+        self._items = collections.OrderedDict()
+
+    @staticmethod
+    def tools_signature():
+        """Modification times of tool environment files used by acre."""
+        tools_dir = os.environ.get("TOOL_ENV")
+        if not tools_dir or not os.path.isdir(tools_dir):
+            return None
+
+        signature = []
+        for entry in os.scandir(tools_dir):
+            if entry.is_file():
+                stat = entry.stat()
+                signature.append((entry.name, stat.st_mtime, stat.st_size))
+        return tuple(sorted(signature))
+
+    def key(self, project_name, asset_doc, task_name, app_name):
+        asset_data = asset_doc.get("data") or {}
+        return (
+            project_name,
+            asset_doc["name"],
+            task_name,
+            app_name,
+            tuple(asset_data.get("parents") or []),
+            tuple(asset_data.get("tools_env") or []),
+            get_presets_cache().signature(project_name),
+            self.tools_signature()
+        )
+
+    def get(self, key):
+        item = self._items.get(key)
+        if item is None:
+            return None
+
+        created, context = item
+        if time.time() - created > self.ttl:
+            self._items.pop(key)
+            return None
+
+        self._items.move_to_end(key)
+        return context
+
+    def set(self, key, context):
+        self._items[key] = (time.time(), context)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
 
 
 class AppAction(BaseAction):
@@ -28,6 +100,7 @@ class AppAction(BaseAction):
 
     type = "Application"
     preactions = ["start.timer"]
+    launch_context_cache = LaunchContextCache()
 
     def __init__(
         self, session, label, name, executable, variant=None,
@@ -133,6 +206,53 @@ class AppAction(BaseAction):
 
         return self._handle_result(response)
 
+    def compute_launch_context(self, entity, asset_document, host_name):
+        """Compute data needed for launch of application in task context.
+
+        Args:
+            entity (ftrack_api.Entity): Task entity.
+            asset_document (dict): Avalon asset document of task's parent.
+            host_name (str): Name of host of application.
+
+        Returns:
+            dict: Anatomy, work directory, hierarchy, template fill data and
+                computed environments of application tools.
+        """
+        project_name = entity["project"]["full_name"]
+
+        hierarchy = ""
+        asset_doc_parents = asset_document["data"].get("parents")
+        if asset_doc_parents:
+            hierarchy = os.path.join(*asset_doc_parents)
+
+        data = {
+            "project": {
+                "name": project_name,
+                "code": entity["project"]["name"]
+            },
+            "task": entity["name"],
+            "asset": asset_document["name"],
+            "app": host_name,
+            "hierarchy": hierarchy
+        }
+
+        anatomy = Anatomy(project_name)
+        anatomy_filled = anatomy.format(data)
+        workdir = os.path.normpath(anatomy_filled["work"]["folder"])
+
+        # collect all the 'environment' attributes from asset
+        tools_attr = [host_name, self.identifier]
+        tools_attr.extend(asset_document["data"].get("tools_env") or [])
+        tools_env = acre.compute(acre.get_tools(tools_attr))
+
+        return {
+            "anatomy": anatomy,
+            "workdir": workdir,
+            "hierarchy": hierarchy,
+            "data": data,
+            "tools_env": tools_env
+        }
+
     def launch(self, session, entities, event):
         """Callback method for the custom action.
 
@@ -162,43 +282,39 @@ class AppAction(BaseAction):
         database = pypelib.get_avalon_database()
 
         asset_name = entity["parent"]["name"]
-        asset_document = database[project_name].find_one({
-            "type": "asset",
-            "name": asset_name
-        })
-
-        hierarchy = ""
-        asset_doc_parents = asset_document["data"].get("parents")
-        if asset_doc_parents:
-            hierarchy = os.path.join(*asset_doc_parents)
+        asset_document = database[project_name].find_one(
+            {"type": "asset", "name": asset_name},
+            {"name": True, "data.parents": True, "data.tools_env": True}
+        )
 
         application = avalon.lib.get_application(self.identifier)
         host_name = application["application_dir"]
-        data = {
-            "project": {
-                "name": entity["project"]["full_name"],
-                "code": entity["project"]["name"]
-            },
-            "task": task_name,
-            "asset": asset_name,
-            "app": host_name,
-            "hierarchy": hierarchy
-        }
 
-        try:
-            anatomy = Anatomy(project_name)
-            anatomy_filled = anatomy.format(data)
-            workdir = os.path.normpath(anatomy_filled["work"]["folder"])
+        cache_key = self.launch_context_cache.key(
+            project_name, asset_document, task_name, self.identifier
+        )
+        launch_context = self.launch_context_cache.get(cache_key)
+        if launch_context is None:
+            try:
+                launch_context = self.compute_launch_context(
+                    entity, asset_document, host_name
+                )
 
-        except Exception as exc:
-            msg = "Error in anatomy.format: {}".format(
-                str(exc)
-            )
-            self.log.error(msg, exc_info=True)
-            return {
-                "success": False,
-                "message": msg
-            }
+            except Exception as exc:
+                msg = "Failed to prepare launch context: {}".format(
+                    str(exc)
+                )
+                self.log.error(msg, exc_info=True)
+                return {
+                    "success": False,
+                    "message": msg
+                }
+            self.launch_context_cache.set(cache_key, launch_context)
+
+        anatomy = launch_context["anatomy"]
+        workdir = launch_context["workdir"]
+        hierarchy = launch_context["hierarchy"]
+        data = copy.deepcopy(launch_context["data"])
 
         try:
             os.makedirs(workdir)
@@ -216,7 +332,7 @@ class AppAction(BaseAction):
                 "ext": extensions[0]
             })
 
-            last_workfile_path = last_workfile(
+            last_workfile_path = get_last_workfile(
                 workdir, file_template, data, extensions, True
             )
 
@@ -249,19 +365,10 @@ class AppAction(BaseAction):
 
         prep_env.update(anatomy.roots_obj.root_environments())
 
-        # collect all parents from the task
-        parents = []
-        for item in entity['link']:
-            parents.append(session.get(item['type'], item['id']))
-
-        # collect all the 'environment' attributes from parents
-        tools_attr = [prep_env["AVALON_APP"], prep_env["AVALON_APP_NAME"]]
-        tools_env = asset_document["data"].get("tools_env") or []
-        tools_attr.extend(tools_env)
-
-        tools_env = acre.get_tools(tools_attr)
-        env = acre.compute(tools_env)
-        env = acre.merge(env, current_env=dict(prep_env))
+        env = acre.merge(
+            copy.deepcopy(launch_context["tools_env"]),
+            current_env=dict(prep_env)
+        )
 
         # Get path to execute
         st_temp_path = os.environ["PYPE_CONFIG"]
@@ -355,7 +462,7 @@ class AppAction(BaseAction):
             )
 
         # Change status of task to In progress
-        presets = config.get_presets()["ftrack"]["ftrack_config"]
+        presets = get_ftrack_config_presets()
 
         if "status_update" in presets:
             statuses = presets["status_update"]
@@ -1,14 +1,124 @@
 import os
 import re
-import json
+import collections
 import clique
-import subprocess
 from pype.api import config
 import pype.lib
 from . import QtWidgets, QtCore
 from . import DropEmpty, ComponentsList, ComponentItem
 
 
+class DropScanThread(QtCore.QThread):
+    """Scan dropped paths and prepare data of components in background.
+
+    Folders are scanned with `os.scandir` one by one and components found in
+    each folder are emitted right after the folder is processed so they can
+    be shown before whole scan finishes. Files are probed concurrently with
+    cached `pype.lib.ffprobe_streams_batch`.
+
+    Args:
+        drop_frame (DropDataFrame): Frame which prepares component data.
+        paths (list): Dropped file and folder paths.
+    """
+
+    signal_data = QtCore.Signal(object)
+    signal_progress = QtCore.Signal(int, int)
+
+    def __init__(self, drop_frame, paths):
+        super(DropScanThread, self).__init__()
+        self.drop_frame = drop_frame
+        self.paths = paths
+        self.scanned_dirs = 0
+        self.found_items = 0
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        files_by_dir = collections.defaultdict(list)
+        dir_paths = collections.deque()
+        for path in self.paths:
+            path = os.path.normpath(path)
+            if os.path.isfile(path):
+                files_by_dir[os.path.dirname(path)].append(path)
+            elif os.path.isdir(path):
+                dir_paths.append(path)
+            else:
+                print('Invalid path: "{}"'.format(path))
+
+        for file_paths in files_by_dir.values():
+            if self._cancelled:
+                return
+            self._process_files(file_paths)
+
+        while dir_paths and not self._cancelled:
+            dir_path = dir_paths.popleft()
+            file_paths = []
+            try:
+                for entry in os.scandir(dir_path):
+                    if entry.is_dir():
+                        dir_paths.append(entry.path)
+                    elif entry.is_file():
+                        file_paths.append(entry.path)
+            except OSError:
+                print('Invalid path: "{}"'.format(dir_path))
+                continue
+
+            self.scanned_dirs += 1
+            self._process_files(file_paths)
+
+    def _process_files(self, file_paths):
+        frame = self.drop_frame
+        collectionable_paths = []
+        non_collectionable_paths = []
+        for path in sorted(file_paths):
+            ext = os.path.splitext(path)[1]
+            if ext in frame.image_extensions:
+                collectionable_paths.append(path)
+            else:
+                non_collectionable_paths.append(path)
+
+        _collections, remainders = clique.assemble(collectionable_paths)
+        non_collectionable_paths.extend(remainders)
+
+        items = [
+            frame.collection_data(collection)
+            for collection in _collections
+        ]
+        for remainder in non_collectionable_paths:
+            items.append(frame.remainder_data(remainder))
+
+        probe_paths = [
+            data["files"][0]
+            for data in items
+            if frame.should_probe(data)
+        ]
+        probed_streams = {}
+        if probe_paths and not self._cancelled:
+            probed_streams = pype.lib.ffprobe_streams_batch(probe_paths)
+
+        for data in items:
+            if self._cancelled:
+                return
+
+            probe_data = None
+            if frame.should_probe(data):
+                streams = probed_streams.get(data["files"][0])
+                if not streams:
+                    print('Failed on ffprobe: "{}"'.format(data["files"][0]))
+                probe_data = streams[0] if streams else {}
+
+            data.update(frame.get_file_data(data, probe_data))
+            self.found_items += 1
+            self.signal_data.emit(data)
+
+        self.signal_progress.emit(self.scanned_dirs, self.found_items)
+
+
 class DropDataFrame(QtWidgets.QFrame):
     image_extensions = [
         ".ani", ".anim", ".apng", ".art", ".bmp", ".bpg", ".bsave", ".cal",
@@ -60,6 +170,20 @@ class DropDataFrame(QtWidgets.QFrame):
 
         layout.addWidget(self.drop_widget)
 
+        scan_widget = QtWidgets.QWidget(self)
+        scan_layout = QtWidgets.QHBoxLayout(scan_widget)
+        scan_layout.setContentsMargins(0, 0, 0, 0)
+        self.scan_label = QtWidgets.QLabel(scan_widget)
+        btn_cancel_scan = QtWidgets.QPushButton("Cancel", scan_widget)
+        btn_cancel_scan.clicked.connect(self.cancel_scan)
+        scan_layout.addWidget(self.scan_label, 1)
+        scan_layout.addWidget(btn_cancel_scan)
+        scan_widget.setVisible(False)
+        layout.addWidget(scan_widget)
+        self.scan_widget = scan_widget
+
+        self._scan_threads = []
+
         self._refresh_view()
 
     def dragEnterEvent(self, event):
@@ -168,46 +292,62 @@ class DropDataFrame(QtWidgets.QFrame):
         self.components_list.setVisible(not _bool)
         self.drop_widget.setVisible(_bool)
 
-        self.parent_widget.set_valid_components(not _bool)
+        # Publishing is not possible until all dropped paths are scanned
+        self.parent_widget.set_valid_components(
+            not _bool and not self._scan_threads
+        )
 
     def _process_paths(self, in_paths):
-        self.parent_widget.working_start()
-        paths = self._get_all_paths(in_paths)
-        collectionable_paths = []
-        non_collectionable_paths = []
-        for path in in_paths:
-            ext = os.path.splitext(path)[1]
-            if ext in self.image_extensions:
-                collectionable_paths.append(path)
-            else:
-                non_collectionable_paths.append(path)
+        """Scan paths in background thread.
+
+        Found components are added to view during the scan.
+        """
+        thread = DropScanThread(self, in_paths)
+        thread.signal_data.connect(self._process_data)
+        thread.signal_progress.connect(self._on_scan_progress)
+        thread.finished.connect(lambda: self._on_scan_finished(thread))
+        self._scan_threads.append(thread)
+
+        self.scan_label.setText("Scanning...")
+        self.scan_widget.setVisible(True)
+        self._refresh_view()
+        thread.start()
 
-        collections, remainders = clique.assemble(collectionable_paths)
-        non_collectionable_paths.extend(remainders)
-        for collection in collections:
-            self._process_collection(collection)
+    def cancel_scan(self):
+        for thread in self._scan_threads:
+            thread.cancel()
+        self.scan_label.setText("Cancelling...")
 
-        for remainder in non_collectionable_paths:
-            self._process_remainder(remainder)
-        self.parent_widget.working_stop()
+    def _on_scan_progress(self, scanned_dirs, found_items):
+        if any(thread.is_cancelled() for thread in self._scan_threads):
+            return
+        self.scan_label.setText(
+            "Scanning... {} folders, {} components".format(
+                scanned_dirs, found_items
+            )
+        )
 
-    def _get_all_paths(self, paths):
-        output_paths = []
-        for path in paths:
-            path = os.path.normpath(path)
-            if os.path.isfile(path):
-                output_paths.append(path)
-            elif os.path.isdir(path):
-                s_paths = []
-                for s_item in os.listdir(path):
-                    s_path = os.path.sep.join([path, s_item])
-                    s_paths.append(s_path)
-                output_paths.extend(self._get_all_paths(s_paths))
-            else:
-                print('Invalid path: "{}"'.format(path))
-        return output_paths
+    def _on_scan_finished(self, thread):
+        # Make sure thread is not running before reference is removed
+        thread.wait()
+        if thread in self._scan_threads:
+            self._scan_threads.remove(thread)
+
+        if not self._scan_threads:
+            self.scan_widget.setVisible(False)
+        self._refresh_view()
 
     def _process_collection(self, collection):
+        data = self.collection_data(collection)
+        data.update(self.get_file_data(data))
+        self._process_data(data)
+
+    def _process_remainder(self, remainder):
+        data = self.remainder_data(remainder)
+        data.update(self.get_file_data(data))
+        self._process_data(data)
+
+    def collection_data(self, collection):
         file_base = os.path.basename(collection.head)
         folder_path = os.path.dirname(collection.head)
         if file_base[-1] in ['.', '_']:
@@ -238,9 +378,9 @@ class DropDataFrame(QtWidgets.QFrame):
             'actions': actions
         }
 
-        self._process_data(data)
+        return data
 
-    def _process_remainder(self, remainder):
+    def remainder_data(self, remainder):
         filename = os.path.basename(remainder)
         folder_path = os.path.dirname(remainder)
         file_base, file_ext = os.path.splitext(filename)
@@ -262,30 +402,21 @@ class DropDataFrame(QtWidgets.QFrame):
             'actions': actions
         }
 
-        self._process_data(data)
+        return data
 
     def load_data_with_probe(self, filepath):
-        ffprobe_path = pype.lib.get_ffmpeg_tool_path("ffprobe")
-        args = [
-            ffprobe_path,
-            '-v', 'quiet',
-            '-print_format', 'json',
-            '-show_format',
-            '-show_streams', filepath
-        ]
-        ffprobe_p = subprocess.Popen(
-            ' '.join(args),
-            stdout=subprocess.PIPE,
-            shell=True
-        )
-        ffprobe_output = ffprobe_p.communicate()[0]
-        if ffprobe_p.returncode != 0:
+        try:
+            return pype.lib.ffprobe_streams(filepath)[0]
+        except RuntimeError:
             raise RuntimeError(
                 'Failed on ffprobe: check if ffprobe path is set in PATH env'
             )
-        return json.loads(ffprobe_output)['streams'][0]
 
-    def get_file_data(self, data):
+    def should_probe(self, data):
+        ext = data['ext'].lower()
+        return ext in self.image_extensions or ext in self.video_extensions
+
+    def get_file_data(self, data, probe_data=None):
         filepath = data['files'][0]
         ext = data['ext'].lower()
         output = {}
@@ -294,8 +425,9 @@ class DropDataFrame(QtWidgets.QFrame):
         if 'file_info' in data:
             file_info = data['file_info']
 
-        if ext in self.image_extensions or ext in self.video_extensions:
-            probe_data = self.load_data_with_probe(filepath)
+        if self.should_probe(data):
+            if probe_data is None:
+                probe_data = self.load_data_with_probe(filepath)
             if 'fps' not in data:
                 # default value
                 fps = 25
@@ -324,10 +456,6 @@ class DropDataFrame(QtWidgets.QFrame):
 
     def _process_data(self, data):
         ext = data['ext']
-        # load file data info
-        file_data = self.get_file_data(data)
-        for key, value in file_data.items():
-            data[key] = value
 
         icon = 'default'
         for ico, exts in self.extensions.items():
@@ -8,7 +8,7 @@ from . import QtWidgets, QtCore
 from . import HelpRole, FamilyRole, ExistsRole, PluginRole, PluginKeyRole
 from . import FamilyDescriptionWidget
 
-from pype.api import config
+from pype.api import get_presets
 
 
 class FamilyWidget(QtWidgets.QWidget):
@@ -313,7 +313,7 @@ class FamilyWidget(QtWidgets.QWidget):
 
     def refresh(self):
         has_families = False
-        presets = config.get_presets().get('standalone_publish', {})
+        presets = get_presets().get('standalone_publish', {})
 
         for key, creator in presets.get('families', {}).items():
             creator = namedtuple("Creator", creator.keys())(*creator.values())
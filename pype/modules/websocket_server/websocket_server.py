@@ -1,4 +1,4 @@
-from pype.api import config, Logger
+from pype.api import get_presets, Logger
 
 import threading
 from aiohttp import web
@@ -30,7 +30,7 @@ class WebSocketServer():
         default_port = 8099
 
         try:
-            self.presets = config.get_presets()["services"]["websocket_server"]
+            self.presets = get_presets()["services"]["websocket_server"]
         except Exception:
             self.presets = {"default_port": default_port, "exclude_ports": []}
             log.debug((
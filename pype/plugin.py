@@ -2,7 +2,7 @@ import tempfile
 import os
 import pyblish.api
 
-from pype.api import config
+from .lib import get_preset_value
 import inspect
 
 ValidatePipelineOrder = pyblish.api.ValidatorOrder + 0.05
@@ -23,9 +23,10 @@ def imprint_attributes(plugin):
     plugin_kind = file.split(os.path.sep)[-2:-1][0]
     plugin_host = file.split(os.path.sep)[-3:-2][0]
     plugin_name = type(plugin).__name__
-    try:
-        config_data = config.get_presets()['plugins'][plugin_host][plugin_kind][plugin_name]  # noqa: E501
-    except KeyError:
+    config_data = get_preset_value(
+        "plugins", plugin_host, plugin_kind, plugin_name
+    )
+    if config_data is None:
         print("preset not found")
         return
 
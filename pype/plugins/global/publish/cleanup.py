@@ -4,6 +4,7 @@ import os
 import shutil
 import pyblish.api
 import re
+from pype.lib import get_sequence_scanner
 
 
 class CleanUp(pyblish.api.InstancePlugin):
@@ -90,6 +91,11 @@ class CleanUp(pyblish.api.InstancePlugin):
         # make unique set
         transfers_dirs = set(transfers_dirs)
 
+        # Files may have been added to or removed from directories after
+        # they were listed during publishing
+        scanner = get_sequence_scanner(instance.context)
+        scanner.invalidate(transfers_dirs)
+
         self.log.debug("__ transfers_dirs: `{}`".format(transfers_dirs))
         self.log.debug("__ self.paterns: `{}`".format(self.paterns))
         if self.paterns:
@@ -98,9 +104,7 @@ class CleanUp(pyblish.api.InstancePlugin):
             for _dir in transfers_dirs:
                 if not os.path.exists(_dir):
                     continue
-                files.extend([
-                    os.path.join(_dir, f)
-                    for f in os.listdir(_dir)])
+                files.extend(scanner.paths(_dir))
 
             self.log.debug("__ files: `{}`".format(files))
 
@@ -121,6 +125,7 @@ class CleanUp(pyblish.api.InstancePlugin):
 
         # make unique set
         cleanup_dirs = set(dirnames)
+        scanner.invalidate(cleanup_dirs)
 
         # clean dirs which are empty
         for dir in cleanup_dirs:
@@ -8,7 +8,7 @@ Provides:
 """
 
 from pyblish import api
-from pype.api import config
+from pype.api import get_presets
 
 
 class CollectPresets(api.ContextPlugin):
@@ -18,7 +18,7 @@ class CollectPresets(api.ContextPlugin):
     label = "Collect Presets"
 
     def process(self, context):
-        presets = config.get_presets()
+        presets = get_presets()
         try:
             # try if it is not in projects custom directory
             # `{PYPE_PROJECT_CONFIGS}/[PROJECT_NAME]/init.json`
@@ -1,9 +1,9 @@
 import os
-import re
 import json
 import copy
 
 import pype.api
+import pype.lib
 import pyblish
 
 
@@ -29,19 +29,8 @@ class ExtractBurnin(pype.api.Extractor):
     ]
     optional = True
 
-    positions = [
-        "top_left", "top_centered", "top_right",
-        "bottom_right", "bottom_centered", "bottom_left"
-    ]
     # Default options for burnins for cases that are not set in presets.
-    default_options = {
-        "opacity": 1,
-        "x_offset": 5,
-        "y_offset": 5,
-        "bg_padding": 5,
-        "bg_opacity": 0.5,
-        "font_size": 42
-    }
+    default_options = pype.lib.DEFAULT_BURNIN_OPTIONS
 
     # Preset attributes
     profiles = None
@@ -108,20 +97,6 @@ class ExtractBurnin(pype.api.Extractor):
             ).format(host_name, family, task_name, profile))
             return
 
-        # Prepare burnin options
-        profile_options = copy.deepcopy(self.default_options)
-        for key, value in (self.options or {}).items():
-            if value is not None:
-                profile_options[key] = value
-
-        # Prepare global burnin values from presets
-        profile_burnins = {}
-        for key, value in (self.fields or {}).items():
-            key_low = key.lower()
-            if key_low in self.positions:
-                if value is not None:
-                    profile_burnins[key_low] = value
-
         # Prepare basic data for processing
         _burnin_data, _temp_data = self.prepare_basic_data(instance)
 
@@ -169,26 +144,15 @@ class ExtractBurnin(pype.api.Extractor):
                 elif "ftrackreview" in new_repre["tags"]:
                     new_repre["tags"].remove("ftrackreview")
 
-                burnin_options = copy.deepcopy(profile_options)
-                burnin_values = copy.deepcopy(profile_burnins)
-
-                # Options overrides
-                for key, value in (burnin_def.get("options") or {}).items():
-                    # Set or override value if is valid
-                    if value is not None:
-                        burnin_options[key] = value
-
-                # Burnin values overrides
-                for key, value in burnin_def.items():
-                    key_low = key.lower()
-                    if key_low in self.positions:
-                        if value is not None:
-                            # Set or override value if is valid
-                            burnin_values[key_low] = value
-
-                        elif key_low in burnin_values:
-                            # Pop key if value is set to None (null in json)
-                            burnin_values.pop(key_low)
+                # Burnin options and values with definition overrides
+                burnin_options, burnin_values = (
+                    pype.lib.prepare_burnin_options_and_values(
+                        burnin_def,
+                        self.default_options,
+                        self.options,
+                        self.fields
+                    )
+                )
 
                 # Remove "delete" tag from new representation
                 if "delete" in new_repre["tags"]:
@@ -257,72 +221,9 @@ class ExtractBurnin(pype.api.Extractor):
                 preparation.
         """
         self.log.debug("Prepring basic data for burnins")
-        context = instance.context
-
-        version = instance.data.get("version")
-        if version is None:
-            version = context.data.get("version")
-
-        frame_start = instance.data.get("frameStart")
-        if frame_start is None:
-            self.log.warning(
-                "Key \"frameStart\" is not set. Setting to \"0\"."
-            )
-            frame_start = 0
-        frame_start = int(frame_start)
-
-        frame_end = instance.data.get("frameEnd")
-        if frame_end is None:
-            self.log.warning(
-                "Key \"frameEnd\" is not set. Setting to \"1\"."
-            )
-            frame_end = 1
-        frame_end = int(frame_end)
-
-        handles = instance.data.get("handles")
-        if handles is None:
-            handles = context.data.get("handles")
-            if handles is None:
-                handles = 0
-
-        handle_start = instance.data.get("handleStart")
-        if handle_start is None:
-            handle_start = context.data.get("handleStart")
-            if handle_start is None:
-                handle_start = handles
-
-        handle_end = instance.data.get("handleEnd")
-        if handle_end is None:
-            handle_end = context.data.get("handleEnd")
-            if handle_end is None:
-                handle_end = handles
-
-        frame_start_handle = frame_start - handle_start
-        frame_end_handle = frame_end + handle_end
-
-        burnin_data = copy.deepcopy(instance.data["anatomyData"])
-
-        if "slate.farm" in instance.data["families"]:
-            frame_start_handle += 1
-
-        burnin_data.update({
-            "version": int(version),
-            "comment": context.data.get("comment") or ""
-        })
-
-        intent_label = context.data.get("intent")
-        if intent_label and isinstance(intent_label, dict):
-            intent_label = intent_label.get("label")
-
-        if intent_label:
-            burnin_data["intent"] = intent_label
-
-        temp_data = {
-            "frame_start": frame_start,
-            "frame_end": frame_end,
-            "frame_start_handle": frame_start_handle,
-            "frame_end_handle": frame_end_handle
-        }
+        burnin_data, temp_data = pype.lib.prepare_burnin_basic_data(
+            instance, self.log
+        )
 
         self.log.debug(
             "Basic burnin_data: {}".format(json.dumps(burnin_data, indent=4))
@@ -468,57 +369,20 @@ class ExtractBurnin(pype.api.Extractor):
                 data.
             temp_data (dict): Copy of basic temp data
         """
-        # Add representation name to burnin data
-        burnin_data["representation"] = repre["name"]
-
-        # no handles switch from profile tags
-        if "no-handles" in repre["tags"]:
-            burnin_frame_start = temp_data["frame_start"]
-            burnin_frame_end = temp_data["frame_end"]
-
-        else:
-            burnin_frame_start = temp_data["frame_start_handle"]
-            burnin_frame_end = temp_data["frame_end_handle"]
-
-        burnin_duration = burnin_frame_end - burnin_frame_start + 1
-
-        burnin_data.update({
-            "frame_start": burnin_frame_start,
-            "frame_end": burnin_frame_end,
-            "duration": burnin_duration,
-        })
-        temp_data["duration"] = burnin_duration
-
-        # Add values for slate frames
-        burnin_slate_frame_start = burnin_frame_start
-
-        # Move frame start by 1 frame when slate is used.
-        if (
-            "slate" in instance.data["families"]
-            and "slate-frame" in repre["tags"]
-        ):
-            burnin_slate_frame_start -= 1
-
+        pype.lib.prepare_burnin_repre_data(
+            instance, repre, burnin_data, temp_data
+        )
         self.log.debug("burnin_slate_frame_start: {}".format(
-            burnin_slate_frame_start
+            burnin_data["slate_frame_start"]
         ))
 
-        burnin_data.update({
-            "slate_frame_start": burnin_slate_frame_start,
-            "slate_frame_end": burnin_frame_end,
-            "slate_duration": (
-                burnin_frame_end - burnin_slate_frame_start + 1
-            )
-        })
-
     def find_matching_profile(self, host_name, task_name, family):
         """ Filter profiles by Host name, Task name and main Family.
 
-        Filtering keys are "hosts" (list), "tasks" (list), "families" (list).
-        If key is not find or is empty than it's expected to match.
+        Matching is done by shared `pype.lib.ProfilesMatcher` which compiles
+        profiles only once and memoizes results.
 
         Args:
-            profiles (list): Profiles definition from presets.
             host_name (str): Current running host name.
             task_name (str): Current context task name.
             family (str): Main family of current Instance.
@@ -527,113 +391,10 @@ class ExtractBurnin(pype.api.Extractor):
             dict/None: Return most matching profile or None if none of profiles
                 match at least one criteria.
         """
-
-        matching_profiles = None
-        highest_points = -1
-        for profile in self.profiles or tuple():
-            profile_points = 0
-            profile_value = []
-
-            # Host filtering
-            host_names = profile.get("hosts")
-            match = self.validate_value_by_regexes(host_name, host_names)
-            if match == -1:
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Task filtering
-            task_names = profile.get("tasks")
-            match = self.validate_value_by_regexes(task_name, task_names)
-            if match == -1:
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Family filtering
-            families = profile.get("families")
-            match = self.validate_value_by_regexes(family, families)
-            if match == -1:
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            if profile_points > highest_points:
-                matching_profiles = []
-                highest_points = profile_points
-
-            if profile_points == highest_points:
-                profile["__value__"] = profile_value
-                matching_profiles.append(profile)
-
-        if not matching_profiles:
-            return
-
-        if len(matching_profiles) == 1:
-            return matching_profiles[0]
-
-        return self.profile_exclusion(matching_profiles)
-
-    def profile_exclusion(self, matching_profiles):
-        """Find out most matching profile by host, task and family match.
-
-        Profiles are selectivelly filtered. Each profile should have
-        "__value__" key with list of booleans. Each boolean represents
-        existence of filter for specific key (host, taks, family).
-        Profiles are looped in sequence. In each sequence are split into
-        true_list and false_list. For next sequence loop are used profiles in
-        true_list if there are any profiles else false_list is used.
-
-        Filtering ends when only one profile left in true_list. Or when all
-        existence booleans loops passed, in that case first profile from left
-        profiles is returned.
-
-        Args:
-            matching_profiles (list): Profiles with same values.
-
-        Returns:
-            dict: Most matching profile.
-        """
-        self.log.info(
-            "Search for first most matching profile in match order:"
-            " Host name -> Task name -> Family."
-        )
-        # Filter all profiles with highest points value. First filter profiles
-        # with matching host if there are any then filter profiles by task
-        # name if there are any and lastly filter by family. Else use first in
-        # list.
-        idx = 0
-        final_profile = None
-        while True:
-            profiles_true = []
-            profiles_false = []
-            for profile in matching_profiles:
-                value = profile["__value__"]
-                # Just use first profile when idx is greater than values.
-                if not idx < len(value):
-                    final_profile = profile
-                    break
-
-                if value[idx]:
-                    profiles_true.append(profile)
-                else:
-                    profiles_false.append(profile)
-
-            if final_profile is not None:
-                break
-
-            if profiles_true:
-                matching_profiles = profiles_true
-            else:
-                matching_profiles = profiles_false
-
-            if len(matching_profiles) == 1:
-                final_profile = matching_profiles[0]
-                break
-            idx += 1
-
-        final_profile.pop("__value__")
-        return final_profile
+        if not self.profiles:
+            return None
+        matcher = pype.lib.get_profiles_matcher(self.profiles, self.log)
+        return matcher.find_matching_profile(host_name, task_name, family)
 
     def filter_burnins_by_families(self, profile, instance):
         """Filter outputs that are not supported for instance families.
@@ -697,49 +458,6 @@ class ExtractBurnin(pype.api.Extractor):
                 return True
         return False
 
-    def compile_list_of_regexes(self, in_list):
-        """Convert strings in entered list to compiled regex objects."""
-        regexes = []
-        if not in_list:
-            return regexes
-
-        for item in in_list:
-            if not item:
-                continue
-
-            try:
-                regexes.append(re.compile(item))
-            except TypeError:
-                self.log.warning((
-                    "Invalid type \"{}\" value \"{}\"."
-                    " Expected string based object. Skipping."
-                ).format(str(type(item)), str(item)))
-
-        return regexes
-
-    def validate_value_by_regexes(self, value, in_list):
-        """Validates in any regexe from list match entered value.
-
-        Args:
-            in_list (list): List with regexes.
-            value (str): String where regexes is checked.
-
-        Returns:
-            int: Returns `0` when list is not set or is empty. Returns `1` when
-                any regex match value and returns `-1` when none of regexes
-                match value entered.
-        """
-        if not in_list:
-            return 0
-
-        output = -1
-        regexes = self.compile_list_of_regexes(in_list)
-        for regex in regexes:
-            if re.match(regex, value):
-                output = 1
-                break
-        return output
-
     def main_family_from_instance(self, instance):
         """Returns main family of entered instance."""
         family = instance.data.get("family")
@@ -1,7 +1,11 @@
 import os
-import re
 import copy
 import json
+import time
+import tempfile
+import collections
+from multiprocessing.pool import ThreadPool
+
 import pyblish.api
 import clique
 import pype.api
@@ -42,6 +46,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
     # Preset attributes
     profiles = None
+    # Maximum number of ffmpeg processes running at once
+    max_jobs = 4
+    # Merge outputs with same input into one ffmpeg command so input
+    # is decoded only once
+    single_decode = False
 
     # Legacy attributes
     outputs = {}
@@ -113,6 +122,11 @@ class ExtractReview(pyblish.api.InstancePlugin):
             definition["filename_suffix"] = filename_suffix
             profile_outputs.append(definition)
 
+        # Representations and ffmpeg commands are collected first and
+        # ffmpeg commands are executed concurrently afterwards
+        new_repres = []
+        ffmpeg_jobs = []
+
         # Loop through representations
         for repre in tuple(instance.data["representations"]):
             tags = repre.get("tags") or []
@@ -168,15 +182,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
                 temp_data = self.prepare_temp_data(instance, repre, output_def)
 
-                ffmpeg_args = self._ffmpeg_arguments(
-                    output_def, instance, new_repre, temp_data
-                )
-                subprcs_cmd = " ".join(ffmpeg_args)
-
-                # run subprocess
-                self.log.debug("Executing: {}".format(subprcs_cmd))
-                output = pype.api.subprocess(subprcs_cmd, shell=True)
-                self.log.debug("Output: {}".format(output))
+                ffmpeg_jobs.append({
+                    "args_parts": self._ffmpeg_argument_parts(
+                        output_def, instance, new_repre, temp_data
+                    ),
+                    "output_ext_is_image": temp_data["output_ext_is_image"]
+                })
 
                 output_name = output_def["filename_suffix"]
                 if temp_data["without_handles"]:
@@ -196,11 +207,182 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 if "clean_name" in new_repre.get("tags", []):
                     new_repre.pop("outputName")
 
-                # adding representation
-                self.log.debug(
-                    "Adding new representation: {}".format(new_repre)
+                new_repres.append(new_repre)
+
+        # Run all ffmpeg commands at once
+        if self.single_decode:
+            ffmpeg_commands = self.merged_ffmpeg_commands(ffmpeg_jobs)
+        else:
+            ffmpeg_commands = [
+                " ".join(self.ffmpeg_full_args(*job["args_parts"]))
+                for job in ffmpeg_jobs
+            ]
+        self.run_ffmpeg_jobs(ffmpeg_commands)
+
+        # Add representations in order of output definitions
+        for new_repre in new_repres:
+            self.log.debug(
+                "Adding new representation: {}".format(new_repre)
+            )
+            instance.data["representations"].append(new_repre)
+
+    def merged_ffmpeg_commands(self, ffmpeg_jobs):
+        """Merge ffmpeg jobs with same input into single ffmpeg commands.
+
+        Jobs are compatible when their input arguments are the same and they
+        don't use audio inputs or audio filters. Compatible jobs are merged
+        into one command where decoded input is split with `-filter_complex`
+        into a branch per output so the input is read and decoded only once.
+
+        Args:
+            ffmpeg_jobs (list): Jobs with "args_parts" and
+                "output_ext_is_image" keys.
+
+        Returns:
+            list: Full ffmpeg commands as strings.
+        """
+        commands = []
+        groups = collections.OrderedDict()
+        for job in ffmpeg_jobs:
+            input_args, video_filters, audio_filters, output_args = (
+                job["args_parts"]
+            )
+            output_args = self.normalize_output_args(
+                video_filters, audio_filters, output_args
+            )
+            job["args_parts"] = (
+                input_args, video_filters, audio_filters, output_args
+            )
+            mergeable = (
+                not audio_filters
+                and len([arg for arg in input_args if arg.startswith("-i ")])
+                == 1
+                and not [
+                    arg for arg in output_args
+                    if arg.startswith("-filter_complex")
+                    or arg.startswith("-map")
+                ]
+            )
+            if not mergeable:
+                groups[len(groups)] = [job]
+                continue
+
+            key = tuple(input_args)
+            if key not in groups:
+                groups[key] = []
+            groups[key].append(job)
+
+        for jobs in groups.values():
+            if len(jobs) == 1:
+                commands.append(
+                    " ".join(self.ffmpeg_full_args(*jobs[0]["args_parts"]))
                 )
-                instance.data["representations"].append(new_repre)
+                continue
+
+            self.log.debug(
+                "Merging {} outputs into single ffmpeg command.".format(
+                    len(jobs)
+                )
+            )
+            commands.append(" ".join(self.ffmpeg_merged_args(jobs)))
+        return commands
+
+    def ffmpeg_merged_args(self, ffmpeg_jobs):
+        """Arguments of one ffmpeg command producing multiple outputs.
+
+        All jobs must have the same input arguments.
+        """
+        input_args = ffmpeg_jobs[0]["args_parts"][0]
+
+        branch_labels = []
+        graph_parts = []
+        outputs_args = []
+        for idx, job in enumerate(ffmpeg_jobs):
+            _, video_filters, _, output_args = job["args_parts"]
+            branch_label = "[in{}]".format(idx)
+            out_label = "[out{}]".format(idx)
+            branch_labels.append(branch_label)
+            graph_parts.append("{}{}{}".format(
+                branch_label, ",".join(video_filters) or "null", out_label
+            ))
+
+            outputs_args.append("-map \"{}\"".format(out_label))
+            # Keep audio of input video
+            if not job["output_ext_is_image"]:
+                outputs_args.append("-map \"0:a?\"")
+            outputs_args.extend(output_args)
+
+        graph_parts.insert(0, "[0:v]split={}{}".format(
+            len(ffmpeg_jobs), "".join(branch_labels)
+        ))
+
+        all_args = [self.ffmpeg_path]
+        all_args.extend(input_args)
+        all_args.append("-filter_complex \"{}\"".format(
+            ";".join(graph_parts)
+        ))
+        all_args.extend(outputs_args)
+        return all_args
+
+    def run_ffmpeg_jobs(self, ffmpeg_jobs):
+        """Execute ffmpeg commands concurrently.
+
+        Number of concurrently running commands is limited by `max_jobs`.
+
+        Args:
+            ffmpeg_jobs (list): Full ffmpeg commands as strings.
+
+        Raises:
+            ValueError: When any of commands failed. Commands run one by one
+                stop on first failure, concurrently running commands raise
+                after all of them has finished.
+        """
+        if not ffmpeg_jobs:
+            return
+
+        def run_job(subprcs_cmd):
+            start = time.time()
+            # run subprocess
+            self.log.debug("Executing: {}".format(subprcs_cmd))
+            output = pype.api.subprocess(subprcs_cmd, shell=True)
+            self.log.debug("Output: {}".format(output))
+            self.log.debug("Job finished in {:.2f}s: {}".format(
+                time.time() - start, subprcs_cmd
+            ))
+
+        def run_job_safe(subprcs_cmd):
+            try:
+                run_job(subprcs_cmd)
+            except Exception as exc:
+                return exc
+
+        def raise_failed(subprcs_cmd, exc):
+            raise ValueError("FFmpeg command failed: {}\n{}".format(
+                subprcs_cmd, exc
+            ))
+
+        max_jobs = max(int(self.max_jobs or 1), 1)
+        if max_jobs == 1 or len(ffmpeg_jobs) == 1:
+            for subprcs_cmd in ffmpeg_jobs:
+                exc = run_job_safe(subprcs_cmd)
+                if exc is not None:
+                    raise_failed(subprcs_cmd, exc)
+            return
+
+        start = time.time()
+        pool = ThreadPool(min(max_jobs, len(ffmpeg_jobs)))
+        try:
+            results = pool.map(run_job_safe, ffmpeg_jobs)
+        finally:
+            pool.close()
+            pool.join()
+
+        self.log.debug("{} ffmpeg jobs finished in {:.2f}s".format(
+            len(ffmpeg_jobs), time.time() - start
+        ))
+        for subprcs_cmd, exc in zip(ffmpeg_jobs, results):
+            if exc is not None:
+                raise_failed(subprcs_cmd, exc)
 
     def input_is_sequence(self, repre):
         """Deduce from representation data if input is sequence."""
@@ -276,6 +458,18 @@ class ExtractReview(pyblish.api.InstancePlugin):
     def _ffmpeg_arguments(self, output_def, instance, new_repre, temp_data):
         """Prepares ffmpeg arguments for expected extraction.
 
+        Returns:
+            list: Containing all arguments ready to run in subprocess.
+        """
+        return self.ffmpeg_full_args(*self._ffmpeg_argument_parts(
+            output_def, instance, new_repre, temp_data
+        ))
+
+    def _ffmpeg_argument_parts(
+        self, output_def, instance, new_repre, temp_data
+    ):
+        """Prepares parts of ffmpeg arguments for expected extraction.
+
         Prepares input and output arguments based on output definition and
         input files.
 
@@ -367,6 +561,12 @@ class ExtractReview(pyblish.api.InstancePlugin):
         lut_filters = self.lut_filters(new_repre, instance, ffmpeg_input_args)
         ffmpeg_video_filters.extend(lut_filters)
 
+        # Burnins must be added after rescaling
+        burnin_filters = self.burnin_filters(
+            output_def, instance, new_repre, temp_data
+        )
+        ffmpeg_video_filters.extend(burnin_filters)
+
         # Add argument to override output file
         ffmpeg_output_args.append("-y")
 
@@ -375,7 +575,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
             "\"{}\"".format(temp_data["full_output_path"])
         )
 
-        return self.ffmpeg_full_args(
+        return (
             ffmpeg_input_args,
             ffmpeg_video_filters,
             ffmpeg_audio_filters,
@@ -423,6 +623,33 @@ class ExtractReview(pyblish.api.InstancePlugin):
         Returns:
             list: Containing all arguments ready to run in subprocess.
         """
+        output_args = self.normalize_output_args(
+            video_filters, audio_filters, output_args
+        )
+
+        all_args = []
+        all_args.append(self.ffmpeg_path)
+        all_args.extend(input_args)
+        if video_filters:
+            all_args.append(
+                "-filter:v \"{}\"".format(",".join(video_filters))
+            )
+
+        if audio_filters:
+            all_args.append("-filter:a {}".format(",".join(audio_filters)))
+
+        all_args.extend(output_args)
+
+        return all_args
+
+    def normalize_output_args(self, video_filters, audio_filters, output_args):
+        """Move video and audio filters from output arguments to filters.
+
+        Entered `video_filters` and `audio_filters` are modified in place.
+
+        Returns:
+            list: Output arguments without filter arguments.
+        """
         output_args = self.split_ffmpeg_args(output_args)
 
         video_args_dentifiers = ["-vf", "-filter:v"]
@@ -439,19 +666,7 @@ class ExtractReview(pyblish.api.InstancePlugin):
                     output_args.remove(arg)
                     arg = arg.replace(identifier, "").strip()
                     audio_filters.append(arg)
-
-        all_args = []
-        all_args.append(self.ffmpeg_path)
-        all_args.extend(input_args)
-        if video_filters:
-            all_args.append("-filter:v {}".format(",".join(video_filters)))
-
-        if audio_filters:
-            all_args.append("-filter:a {}".format(",".join(audio_filters)))
-
-        all_args.extend(output_args)
-
-        return all_args
+        return output_args
 
     def input_output_paths(self, new_repre, output_def, temp_data):
         """Deduce input nad output file paths based on entered data.
@@ -788,6 +1003,132 @@ class ExtractReview(pyblish.api.InstancePlugin):
 
         return filters
 
+    def burnin_filters(self, output_def, instance, new_repre, temp_data):
+        """Drawtext filters of burnins defined in output definition.
+
+        Output definition may contain "burnins" with burnin values by
+        position (same as ExtractBurnin's burnin definition) and optional
+        "burnin_options". Burnins are then part of review's filter graph
+        and don't need separate encode pass in ExtractBurnin, because of
+        that is "burnin" tag removed from new representation. Burnin data,
+        options and values are prepared with the same `pype.lib` functions
+        and ExtractBurnin presets as ExtractBurnin uses.
+
+        Filters are prepared with `otio_burnin.py` script in Python 3
+        process which does not render anything.
+        """
+        filters = []
+        output_burnins = output_def.get("burnins")
+        if not output_burnins:
+            return filters
+
+        burnin_def = dict(output_burnins)
+        burnin_def["options"] = output_def.get("burnin_options")
+        burnin_presets = self.extract_burnin_presets()
+        burnin_options, burnin_values = (
+            pype.lib.prepare_burnin_options_and_values(
+                burnin_def,
+                (
+                    burnin_presets.get("default_options")
+                    or pype.lib.DEFAULT_BURNIN_OPTIONS
+                ),
+                burnin_presets.get("options"),
+                burnin_presets.get("fields")
+            )
+        )
+        burnin_data = self.prepare_burnin_data(instance, new_repre)
+
+        # Use input stream data with output resolution
+        full_input_path_single_file = temp_data["full_input_path_single_file"]
+        stream = copy.deepcopy(
+            pype.lib.ffprobe_streams(full_input_path_single_file)[0]
+        )
+        stream.update({
+            "width": new_repre["resolutionWidth"],
+            "height": new_repre["resolutionHeight"],
+            "r_frame_rate": "{}/1".format(temp_data["fps"])
+        })
+
+        filters_fd, filters_output = tempfile.mkstemp(
+            prefix="burnin_filters_", suffix=".json"
+        )
+        os.close(filters_fd)
+        script_data = {
+            "input": full_input_path_single_file,
+            "burnin_data": burnin_data,
+            "options": burnin_options,
+            "values": burnin_values,
+            "streams": [stream],
+            "filters_output": filters_output
+        }
+        self.log.debug(
+            "Burnin script data: {}".format(json.dumps(script_data, indent=4))
+        )
+        args = [
+            self.python_executable_path(),
+            self.burnin_script_path(),
+            json.dumps(script_data)
+        ]
+        try:
+            pype.api.subprocess(args)
+            with open(filters_output, "r") as stream:
+                filter_string = json.load(stream)["filters"]
+        finally:
+            if os.path.exists(filters_output):
+                os.remove(filters_output)
+
+        if filter_string:
+            filters.append(filter_string)
+
+        # Burnins are already applied
+        if "burnin" in new_repre["tags"]:
+            new_repre["tags"].remove("burnin")
+
+        self.log.info("Added burnins to ffmpeg command.")
+        return filters
+
+    def prepare_burnin_data(self, instance, new_repre):
+        """Data used for filling burnin values of new representation."""
+        burnin_data, temp_data = pype.lib.prepare_burnin_basic_data(
+            instance, self.log
+        )
+        pype.lib.prepare_burnin_repre_data(
+            instance, new_repre, burnin_data, temp_data
+        )
+
+        anatomy = instance.context.data["anatomy"]
+        burnin_data["anatomy"] = anatomy.format_all(burnin_data).get_solved()
+        return burnin_data
+
+    def extract_burnin_presets(self):
+        """Presets of ExtractBurnin plugin used for burnins of outputs.
+
+        Host presets are used before global presets same as when presets
+        are applied to plugins.
+        """
+        host_name = os.environ["AVALON_APP"]
+        for presets_host in (host_name, "global"):
+            presets = pype.lib.get_plugins_presets(presets_host, "publish")
+            burnin_presets = presets.get("ExtractBurnin")
+            if burnin_presets is not None:
+                return burnin_presets
+        return {}
+
+    def burnin_script_path(self):
+        """Returns path to python script for burnin processing."""
+        # There can be multiple paths in PYPE_MODULE_ROOT, in which case
+        # we just take first one.
+        module_path = os.environ["PYPE_MODULE_ROOT"].split(os.pathsep)[0]
+        return os.path.normpath(
+            os.path.join(module_path, "pype", "scripts", "otio_burnin.py")
+        )
+
+    def python_executable_path(self):
+        """Returns path to Python 3 executable."""
+        # There can be multiple paths in PYPE_PYTHON_EXE, in which case
+        # we just take first one.
+        return os.environ["PYPE_PYTHON_EXE"].split(os.pathsep)[0]
+
     def main_family_from_instance(self, instance):
         """Returns main family of entered instance."""
         family = instance.data.get("family")
@@ -807,118 +1148,13 @@ class ExtractReview(pyblish.api.InstancePlugin):
                 families.append(family)
         return families
 
-    def compile_list_of_regexes(self, in_list):
-        """Convert strings in entered list to compiled regex objects."""
-        regexes = []
-        if not in_list:
-            return regexes
-
-        for item in in_list:
-            if not item:
-                continue
-
-            try:
-                regexes.append(re.compile(item))
-            except TypeError:
-                self.log.warning((
-                    "Invalid type \"{}\" value \"{}\"."
-                    " Expected string based object. Skipping."
-                ).format(str(type(item)), str(item)))
-
-        return regexes
-
-    def validate_value_by_regexes(self, value, in_list):
-        """Validates in any regexe from list match entered value.
-
-        Args:
-            in_list (list): List with regexes.
-            value (str): String where regexes is checked.
-
-        Returns:
-            int: Returns `0` when list is not set or is empty. Returns `1` when
-                any regex match value and returns `-1` when none of regexes
-                match value entered.
-        """
-        if not in_list:
-            return 0
-
-        output = -1
-        regexes = self.compile_list_of_regexes(in_list)
-        for regex in regexes:
-            if re.match(regex, value):
-                output = 1
-                break
-        return output
-
-    def profile_exclusion(self, matching_profiles):
-        """Find out most matching profile byt host, task and family match.
-
-        Profiles are selectivelly filtered. Each profile should have
-        "__value__" key with list of booleans. Each boolean represents
-        existence of filter for specific key (host, taks, family).
-        Profiles are looped in sequence. In each sequence are split into
-        true_list and false_list. For next sequence loop are used profiles in
-        true_list if there are any profiles else false_list is used.
-
-        Filtering ends when only one profile left in true_list. Or when all
-        existence booleans loops passed, in that case first profile from left
-        profiles is returned.
-
-        Args:
-            matching_profiles (list): Profiles with same values.
-
-        Returns:
-            dict: Most matching profile.
-        """
-        self.log.info(
-            "Search for first most matching profile in match order:"
-            " Host name -> Task name -> Family."
-        )
-        # Filter all profiles with highest points value. First filter profiles
-        # with matching host if there are any then filter profiles by task
-        # name if there are any and lastly filter by family. Else use first in
-        # list.
-        idx = 0
-        final_profile = None
-        while True:
-            profiles_true = []
-            profiles_false = []
-            for profile in matching_profiles:
-                value = profile["__value__"]
-                # Just use first profile when idx is greater than values.
-                if not idx < len(value):
-                    final_profile = profile
-                    break
-
-                if value[idx]:
-                    profiles_true.append(profile)
-                else:
-                    profiles_false.append(profile)
-
-            if final_profile is not None:
-                break
-
-            if profiles_true:
-                matching_profiles = profiles_true
-            else:
-                matching_profiles = profiles_false
-
-            if len(matching_profiles) == 1:
-                final_profile = matching_profiles[0]
-                break
-            idx += 1
-
-        final_profile.pop("__value__")
-        return final_profile
-
     def find_matching_profile(self, host_name, task_name, family):
         """ Filter profiles by Host name, Task name and main Family.
 
-        Filtering keys are "hosts" (list), "tasks" (list), "families" (list).
-        If key is not find or is empty than it's expected to match.
+        Matching is done by shared `pype.lib.ProfilesMatcher` which compiles
+        profiles only once and memoizes results.
 
         Args:
-            profiles (list): Profiles definition from presets.
             host_name (str): Current running host name.
             task_name (str): Current context task name.
             family (str): Main family of current Instance.
@@ -927,81 +1163,10 @@ class ExtractReview(pyblish.api.InstancePlugin):
             dict/None: Return most matching profile or None if none of profiles
                 match at least one criteria.
         """
-
-        matching_profiles = None
         if not self.profiles:
-            return matching_profiles
-
-        highest_profile_points = -1
-        # Each profile get 1 point for each matching filter. Profile with most
-        # points is returnd. For cases when more than one profile will match
-        # are also stored ordered lists of matching values.
-        for profile in self.profiles:
-            profile_points = 0
-            profile_value = []
-
-            # Host filtering
-            host_names = profile.get("hosts")
-            match = self.validate_value_by_regexes(host_name, host_names)
-            if match == -1:
-                self.log.debug(
-                    "\"{}\" not found in {}".format(host_name, host_names)
-                )
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Task filtering
-            task_names = profile.get("tasks")
-            match = self.validate_value_by_regexes(task_name, task_names)
-            if match == -1:
-                self.log.debug(
-                    "\"{}\" not found in {}".format(task_name, task_names)
-                )
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            # Family filtering
-            families = profile.get("families")
-            match = self.validate_value_by_regexes(family, families)
-            if match == -1:
-                self.log.debug(
-                    "\"{}\" not found in {}".format(family, families)
-                )
-                continue
-            profile_points += match
-            profile_value.append(bool(match))
-
-            if profile_points < highest_profile_points:
-                continue
-
-            if profile_points > highest_profile_points:
-                matching_profiles = []
-                highest_profile_points = profile_points
-
-            if profile_points == highest_profile_points:
-                profile["__value__"] = profile_value
-                matching_profiles.append(profile)
-
-        if not matching_profiles:
-            self.log.warning((
-                "None of profiles match your setup."
-                " Host \"{}\" | Task: \"{}\" | Family: \"{}\""
-            ).format(host_name, task_name, family))
-            return
-
-        if len(matching_profiles) == 1:
-            # Pop temporary key `__value__`
-            matching_profiles[0].pop("__value__")
-            return matching_profiles[0]
-
-        self.log.warning((
-            "More than one profile match your setup."
-            " Host \"{}\" | Task: \"{}\" | Family: \"{}\""
-        ).format(host_name, task_name, family))
-
-        return self.profile_exclusion(matching_profiles)
+            return None
+        matcher = pype.lib.get_profiles_matcher(self.profiles, self.log)
+        return matcher.find_matching_profile(host_name, task_name, family)
 
     def families_filter_validation(self, families, output_families_filter):
         """Determines if entered families intersect with families filters.
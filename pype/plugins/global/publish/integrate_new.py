@@ -1,22 +1,17 @@
 import os
-from os.path import getsize
 import logging
-import sys
 import copy
 import clique
-import errno
-import six
 
 from pymongo import DeleteOne, InsertOne
 import pyblish.api
 from avalon import io
-from avalon.vendor import filelink
-
-# this is needed until speedcopy for linux is fixed
-if sys.platform == "win32":
-    from speedcopy import copyfile
-else:
-    from shutil import copyfile
+from pype.lib import (
+    FileTransfers,
+    TextureHashRegistry,
+    get_avalon_database,
+    get_sequence_scanner
+)
 
 log = logging.getLogger(__name__)
 
@@ -95,6 +90,13 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
     default_template_name = "publish"
     template_name_profiles = None
 
+    # File transfers - can be overridden with presets
+    # - `None` workers means number of cpu cores (max. 8)
+    # - verify can be "size", "checksum" or `None`
+    transfer_workers = None
+    transfer_verify = "size"
+    transfer_retries = 3
+
     def process(self, instance):
 
         if [ef for ef in self.exclude_families
@@ -248,6 +250,12 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         version = io.find_one({"_id": version_id})
         instance.data["versionEntity"] = version
 
+        source_hashes = version["data"].get("sourceHashes")
+        if source_hashes:
+            TextureHashRegistry(
+                io.Session["AVALON_PROJECT"], get_avalon_database()
+            ).register(source_hashes, version_id)
+
         existing_repres = list(io.find({
             "parent": version_id,
             "type": "archived_representation"
@@ -519,9 +527,17 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
             Args:
                 instance: the instance to integrate
         """
+        file_transfers = FileTransfers(
+            workers=self.transfer_workers,
+            verify=self.transfer_verify,
+            retries=self.transfer_retries,
+            log=self.log
+        )
         transfers = instance.data.get("transfers", list())
         for src, dest in transfers:
-            self.copy_file(src, dest)
+            self.log.debug("Copying file .. {} -> {}".format(src, dest))
+            file_transfers.add(src, dest)
+        file_transfers.process()
 
         # Produce hardlinked copies
         # Note: hardlink can only be produced between two files on the same
@@ -531,61 +547,15 @@ class IntegrateAssetNew(pyblish.api.InstancePlugin):
         hardlinks = instance.data.get("hardlinks", list())
         for src, dest in hardlinks:
             self.log.debug("Hardlinking file .. {} -> {}".format(src, dest))
-            self.hardlink_file(src, dest)
+            file_transfers.add(src, dest, mode="hardlink")
 
-    def copy_file(self, src, dst):
-        """ Copy given source to destination
+        file_transfers.process()
 
-        Arguments:
-            src (str): the source file which needs to be copied
-            dst (str): the destination of the sourc file
-        Returns:
-            None
-        """
-        src = os.path.normpath(src)
-        dst = os.path.normpath(dst)
-        self.log.debug("Copying file .. {} -> {}".format(src, dst))
-        dirname = os.path.dirname(dst)
-        try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                self.log.critical("An unexpected error occurred.")
-                raise
-
-        # copy file with speedcopy and check if size of files are simetrical
-        while True:
-            import shutil
-            try:
-                copyfile(src, dst)
-            except shutil.SameFileError as sfe:
-                self.log.critical("files are the same {} to {}".format(src, dst))
-                os.remove(dst)
-                try:
-                    shutil.copyfile(src, dst)
-                    self.log.debug("Copying files with shutil...")
-                except (OSError) as e:
-                    self.log.critical("Cannot copy {} to {}".format(src, dst))
-                    self.log.critical(e)
-                    six.reraise(*sys.exc_info())
-            if str(getsize(src)) in str(getsize(dst)):
-                break
-
-    def hardlink_file(self, src, dst):
-        dirname = os.path.dirname(dst)
-
-        try:
-            os.makedirs(dirname)
-        except OSError as e:
-            if e.errno == errno.EEXIST:
-                pass
-            else:
-                self.log.critical("An unexpected error occurred.")
-                raise
-
-        filelink.create(src, dst, filelink.HARDLINK)
+        # Cached listings of written directories are not valid anymore
+        get_sequence_scanner(instance.context).invalidate({
+            os.path.dirname(dest)
+            for _, dest in list(transfers) + list(hardlinks)
+        })
 
     def get_subset(self, asset, instance):
         subset_name = instance.data["subset"]
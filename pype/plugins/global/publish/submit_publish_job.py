@@ -10,6 +10,7 @@ from avalon import api, io
 from avalon.vendor import requests, clique
 
 import pyblish.api
+from pype.lib import get_latest_versions, get_sequence_scanner
 
 
 def _get_script(path):
@@ -62,22 +63,30 @@ def get_latest_version(asset_name, subset_name, family):
         "name": True,
         "data.startFrame": True,
         "data.endFrame": True,
+        "data.frameStart": True,
+        "data.frameEnd": True,
         "parent": True,
     }
 
-    version = io.find_one(
-        {"type": "version", "parent": subset["_id"], "data.families": family},
-        projection=version_projection,
-        sort=[("name", -1)],
-    )
+    version = get_latest_versions(
+        [subset["_id"]],
+        version_filter={"data.families": family},
+        projection=version_projection
+    ).get(subset["_id"])
 
     assert version, "No version found, this is a bug"
 
     return version
 
 
-def get_resources(version, extension=None):
-    """Get the files from the specific version."""
+def get_resources(version, extension=None, scanner=None):
+    """Get the files from the specific version.
+
+    Args:
+        version (dict): Version document.
+        extension (str): Name of representation.
+        scanner (SequenceScanner): Scanner used for listing of directory.
+    """
     query = {"type": "representation", "parent": version["_id"]}
     if extension:
         query["name"] = extension
@@ -87,12 +96,9 @@ def get_resources(version, extension=None):
 
     directory = api.get_representation_path(representation)
     print("Source: ", directory)
-    resources = sorted(
-        [
-            os.path.normpath(os.path.join(directory, fname))
-            for fname in os.listdir(directory)
-        ]
-    )
+    if scanner is None:
+        scanner = get_sequence_scanner()
+    resources = scanner.paths(directory)
 
     return resources
 
@@ -342,7 +348,11 @@ class ProcessSubmittedJobOnFarm(pyblish.api.InstancePlugin):
             instance.data.get("asset"),
             instance.data.get("subset"), "render")
         # get its files based on extension
-        subset_resources = get_resources(version, representation.get("ext"))
+        subset_resources = get_resources(
+            version,
+            representation.get("ext"),
+            get_sequence_scanner(instance.context)
+        )
         r_col, _ = clique.assemble(subset_resources)
 
         # if override remove all frames we are expecting to be rendered
@@ -1,8 +1,6 @@
 import os
 import uuid
 
-import clique
-
 from avalon import api, harmony
 import pype.lib
 
@@ -235,8 +233,8 @@ class ImageSequenceLoader(api.Loader):
 
     def load(self, context, name=None, namespace=None, data=None):
 
-        collections, remainder = clique.assemble(
-            os.listdir(os.path.dirname(self.fname))
+        collections, remainder = pype.lib.SequenceScanner().assemble(
+            os.path.dirname(self.fname)
         )
         files = []
         if collections:
@@ -275,8 +273,8 @@ class ImageSequenceLoader(api.Loader):
         node = harmony.find_node_by_name(container["name"], "READ")
 
         path = api.get_representation_path(representation)
-        collections, remainder = clique.assemble(
-            os.listdir(os.path.dirname(path))
+        collections, remainder = pype.lib.SequenceScanner().assemble(
+            os.path.dirname(path)
         )
         files = []
         if collections:
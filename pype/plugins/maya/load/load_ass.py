@@ -1,7 +1,7 @@
 from avalon import api
 import pype.hosts.maya.plugin
 import os
-from pype.api import config
+from pype.api import get_presets
 import clique
 
 
@@ -74,7 +74,7 @@ class AssProxyLoader(pype.hosts.maya.plugin.ReferenceLoader):
             proxyShape.dso.set(path)
             proxyShape.aiOverrideShaders.set(0)
 
-            presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+            presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
             colors = presets['plugins']['maya']['load']['colors']
 
             c = colors.get(family)
@@ -196,7 +196,7 @@ class AssStandinLoader(api.Loader):
         label = "{}:{}".format(namespace, name)
         root = pm.group(name=label, empty=True)
 
-        presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+        presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
         colors = presets['plugins']['maya']['load']['colors']
 
         c = colors.get('ass')
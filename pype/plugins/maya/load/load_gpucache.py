@@ -1,8 +1,7 @@
 from avalon import api
 import pype.hosts.maya.plugin
 import os
-from pype.api import config
-reload(config)
+from pype.api import get_presets
 
 
 class GpuCacheLoader(api.Loader):
@@ -35,7 +34,7 @@ class GpuCacheLoader(api.Loader):
         label = "{}:{}".format(namespace, name)
         root = cmds.group(name=label, empty=True)
 
-        presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+        presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
         colors = presets['plugins']['maya']['load']['colors']
         c = colors.get('model')
         if c is not None:
@@ -2,7 +2,7 @@ import pype.hosts.maya.plugin
 from avalon import api, maya
 from maya import cmds
 import os
-from pype.api import config
+from pype.api import get_presets
 
 
 class ReferenceLoader(pype.hosts.maya.plugin.ReferenceLoader):
@@ -76,7 +76,7 @@ class ReferenceLoader(pype.hosts.maya.plugin.ReferenceLoader):
 
             cmds.setAttr(groupName + ".displayHandle", 1)
 
-            presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+            presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
             colors = presets['plugins']['maya']['load']['colors']
             c = colors.get(family)
             if c is not None:
@@ -1,6 +1,6 @@
 from avalon import api
 import os
-from pype.api import config
+from pype.api import get_presets
 
 class LoadVDBtoRedShift(api.Loader):
     """Load OpenVDB in a Redshift Volume Shape"""
@@ -55,7 +55,7 @@ class LoadVDBtoRedShift(api.Loader):
         label = "{}:{}".format(namespace, name)
         root = cmds.group(name=label, empty=True)
 
-        presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+        presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
         colors = presets['plugins']['maya']['load']['colors']
 
         c = colors.get(family)
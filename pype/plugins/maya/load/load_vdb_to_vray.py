@@ -1,5 +1,5 @@
 from avalon import api
-from pype.api import config
+from pype.api import get_presets
 import os
 
 
@@ -48,7 +48,7 @@ class LoadVDBtoVRay(api.Loader):
         label = "{}:{}".format(namespace, name)
         root = cmds.group(name=label, empty=True)
 
-        presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+        presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
         colors = presets['plugins']['maya']['load']['colors']
 
         c = colors.get(family)
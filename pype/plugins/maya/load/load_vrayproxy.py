@@ -1,6 +1,6 @@
 from avalon.maya import lib
 from avalon import api
-from pype.api import config
+from pype.api import get_presets
 import os
 import maya.cmds as cmds
 
@@ -46,7 +46,7 @@ class VRayProxyLoader(api.Loader):
         if not nodes:
             return
 
-        presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+        presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
         colors = presets['plugins']['maya']['load']['colors']
 
         c = colors.get(family)
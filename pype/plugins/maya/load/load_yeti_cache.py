@@ -9,7 +9,7 @@ from maya import cmds
 from avalon import api, io
 from avalon.maya import lib as avalon_lib, pipeline
 from pype.hosts.maya import lib
-from pype.api import config
+from pype.api import get_presets
 from pprint import pprint
 
 
@@ -59,7 +59,7 @@ class YetiCacheLoader(api.Loader):
         group_name = "{}:{}".format(namespace, name)
         group_node = cmds.group(nodes, name=group_name)
 
-        presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+        presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
         colors = presets['plugins']['maya']['load']['colors']
 
         c = colors.get(family)
@@ -1,7 +1,7 @@
 import os
 from collections import defaultdict
 
-from pype.api import config
+from pype.api import get_presets
 import pype.hosts.maya.plugin
 from pype.hosts.maya import lib
 
@@ -77,7 +77,7 @@ class YetiRigLoader(pype.hosts.maya.plugin.ReferenceLoader):
 
         groupName = "{}:{}".format(namespace, name)
 
-        presets = config.get_presets(project=os.environ['AVALON_PROJECT'])
+        presets = get_presets(project_name=os.environ['AVALON_PROJECT'])
         colors = presets['plugins']['maya']['load']['colors']
 
         c = colors.get('yetiRig')
@@ -6,7 +6,7 @@ from maya import cmds
 import pyblish.api
 
 from pype.hosts.maya import lib
-from pype.lib import pairwise
+from pype.lib import pairwise, get_sequence_scanner
 
 
 SETTINGS = {"renderDensity",
@@ -25,7 +25,10 @@ class CollectYetiRig(pyblish.api.InstancePlugin):
     families = ["yetiRig"]
     hosts = ["maya"]
 
+    sequence_scanner = None
+
     def process(self, instance):
+        self.sequence_scanner = get_sequence_scanner(instance.context)
 
         assert "input_SET" in instance.data["setMembers"], (
             "Yeti Rig must have an input_SET")
@@ -282,7 +285,8 @@ class CollectYetiRig(pyblish.api.InstancePlugin):
         re_pattern = escaped.replace(pattern, "-?[0-9]+")
 
         source_dir = os.path.dirname(filepath)
-        files = [f for f in os.listdir(source_dir)
+        scanner = self.sequence_scanner or get_sequence_scanner()
+        files = [f for f in scanner.files(source_dir)
                  if re.match(re_pattern, f)]
 
         pattern = [clique.PATTERNS["frames"]]
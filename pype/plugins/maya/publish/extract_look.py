@@ -2,9 +2,16 @@ import os
 import sys
 import json
 import copy
+import time
+import uuid
+import shutil
+import hashlib
+import functools
 import tempfile
 import contextlib
 import subprocess
+import multiprocessing
+from multiprocessing.pool import ThreadPool
 from collections import OrderedDict
 
 from maya import cmds
@@ -12,9 +19,11 @@ from maya import cmds
 import pyblish.api
 import avalon.maya
 from avalon import io, api
+from avalon.vendor import filelink
 
 import pype.api
 from pype.hosts.maya import lib
+from pype.lib import TextureHashRegistry, get_avalon_database
 
 # Modes for transfer
 COPY = 1
@@ -45,11 +54,24 @@ def source_hash(filepath, *args):
 def find_paths_by_hash(texture_hash):
     # Find the texture hash key in the dictionary and all paths that
     # originate from it.
-    key = "data.sourceHashes.{0}".format(texture_hash)
-    return io.distinct(key, {"type": "version"})
+    return find_paths_by_hashes([texture_hash]).get(texture_hash) or []
 
 
-def maketx(source, destination, *args):
+def find_paths_by_hashes(texture_hashes):
+    """Published paths of multiple texture hashes with one query.
+
+    Returns:
+        dict: List of published paths by texture hash.
+    """
+    registry = TextureHashRegistry(
+        io.Session["AVALON_PROJECT"], get_avalon_database()
+    )
+    # Versions are scanned for missing hashes only until project is
+    # backfilled
+    return registry.find_paths(texture_hashes)
+
+
+def maketx(source, destination, *args, **kwargs):
     """Make .tx using maketx with some default settings.
     The settings are based on default as used in Arnold's
     txManager in the scene.
@@ -58,6 +80,8 @@ def maketx(source, destination, *args):
     Args:
         source (str): Path to source file.
         destination (str): Writing destination path.
+        threads (int): Number of threads maketx may use (keyword only).
+            All available cores are used when not entered.
     """
 
     cmd = [
@@ -72,6 +96,10 @@ def maketx(source, destination, *args):
         "--filter lanczos3",
     ]
 
+    threads = kwargs.get("threads")
+    if threads:
+        cmd.extend(["--threads", str(threads)])
+
     cmd.extend(args)
     cmd.extend(["-o", destination, source])
 
@@ -94,6 +122,260 @@ def maketx(source, destination, *args):
     return out
 
 
+class MaketxScheduler(object):
+    """Run maketx conversions concurrently with local cache of .tx files.
+
+    Conversions are cached by content address - key is made of source hash
+    and maketx arguments that change the output. Cached files are hardlinked
+    (or copied) to requested destination so repeated extractions and
+    textures shared across assets are converted only once. Least recently
+    used files are pruned from cache after each run to keep it in limits.
+
+    Args:
+        cache_dir (str): Root of .tx cache. Cache is not used when empty.
+        core_budget (int): Maximum number of cores used by all running
+            conversions. All cores are used when not entered.
+        threads_per_job (int): Threads passed to each maketx process. Unused
+            cores are spread between jobs when there is less jobs than
+            workers.
+        cache_max_size (int): Maximum size of cache in bytes. Size is not
+            limited when not entered.
+        cache_max_age (float): Cached files not used for this amount of
+            seconds are removed. Age is not limited when not entered.
+        logger (logging.Logger): Logger.
+    """
+
+    def __init__(
+        self, cache_dir=None, core_budget=None, threads_per_job=None,
+        cache_max_size=None, cache_max_age=None, logger=None
+    ):
+        cpu_count = multiprocessing.cpu_count()
+        if not core_budget or core_budget < 1:
+            core_budget = cpu_count
+        core_budget = min(core_budget, cpu_count)
+
+        if not threads_per_job or threads_per_job < 1:
+            threads_per_job = 1
+        threads_per_job = min(threads_per_job, core_budget)
+
+        self.cache_dir = cache_dir
+        self.cache_max_size = cache_max_size
+        self.cache_max_age = cache_max_age
+        self.core_budget = core_budget
+        self.threads_per_job = threads_per_job
+        self.workers = max(1, core_budget // threads_per_job)
+        self.log = logger
+        self._jobs = []
+
+    def add(self, source, destination, texture_hash, args):
+        """Schedule conversion of `source` to `destination`.
+
+        Args:
+            source (str): Path to source texture.
+            destination (str): Path where .tx file should be created.
+            texture_hash (str): Source hash of the texture.
+            args (list): Additional maketx arguments.
+        """
+        self._jobs.append((source, destination, texture_hash, list(args)))
+
+    def run(self):
+        """Process all scheduled conversions.
+
+        Returns:
+            list: Destination paths in order of scheduling.
+        """
+        jobs, self._jobs = self._jobs, []
+        if not jobs:
+            return []
+
+        # Same conversion is processed only once concurrently, duplicates
+        # are then resolved from cache
+        first_jobs = []
+        duplicates = []
+        keys = set()
+        for job in jobs:
+            key = self.cache_key(job[2], job[3])
+            if self.cache_dir and key in keys:
+                duplicates.append(job)
+            else:
+                keys.add(key)
+                first_jobs.append(job)
+
+        # Use whole core budget when there is less jobs than workers
+        workers = min(self.workers, len(first_jobs))
+        threads = max(self.threads_per_job, self.core_budget // workers)
+        if self.log:
+            self.log.info((
+                "Converting {} textures with maketx"
+                " ({} workers, {} threads each) .."
+            ).format(len(jobs), workers, threads))
+
+        process_job = functools.partial(self._process_job, threads=threads)
+        if workers == 1:
+            for job in first_jobs:
+                process_job(job)
+        else:
+            pool = ThreadPool(workers)
+            try:
+                pool.map(process_job, first_jobs)
+            finally:
+                pool.close()
+                pool.join()
+
+        for job in duplicates:
+            process_job(job)
+
+        self.prune_cache()
+
+        return [job[1] for job in jobs]
+
+    def prune_cache(self):
+        """Remove cached files exceeding age or size limit of cache.
+
+        Files are removed from least recently used. Cached files are already
+        hardlinked or copied to their destinations so removing them does not
+        affect processed conversions.
+        """
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+
+        if not self.cache_max_size and not self.cache_max_age:
+            return
+
+        now = time.time()
+        items = []
+        for root, _, filenames in os.walk(self.cache_dir):
+            for filename in filenames:
+                if not filename.endswith(".tx"):
+                    continue
+                path = os.path.join(root, filename)
+                try:
+                    file_stat = os.stat(path)
+                except OSError:
+                    continue
+                items.append((file_stat.st_mtime, file_stat.st_size, path))
+
+        # Oldest first
+        items.sort()
+        total_size = sum(item[1] for item in items)
+        removed = 0
+        for mtime, size, path in items:
+            too_old = (
+                self.cache_max_age and now - mtime > self.cache_max_age
+            )
+            too_big = (
+                self.cache_max_size and total_size > self.cache_max_size
+            )
+            if not too_old and not too_big:
+                break
+
+            # Temporary files of running conversions are removed only when
+            # they're too old
+            if path.endswith(".tmp.tx") and not too_old:
+                continue
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            removed += 1
+
+        if removed and self.log:
+            self.log.debug(
+                "Removed {} files from .tx cache {}".format(
+                    removed, self.cache_dir
+                )
+            )
+
+    def cache_key(self, texture_hash, args):
+        """Content address of converted texture."""
+        key = "|".join([texture_hash] + [arg for arg in args if arg])
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def _process_job(self, job, threads=None):
+        source, destination, texture_hash, args = job
+        dst_dir = os.path.dirname(destination)
+        if not os.path.exists(dst_dir):
+            try:
+                os.makedirs(dst_dir)
+            except OSError:
+                # Other worker may have created it in the meantime
+                if not os.path.isdir(dst_dir):
+                    raise
+
+        if not self.cache_dir:
+            self._convert(source, destination, texture_hash, args, threads)
+            return destination
+
+        key = self.cache_key(texture_hash, args)
+        cached = os.path.join(self.cache_dir, key[:2], key + ".tx")
+        if os.path.exists(cached):
+            if self.log:
+                self.log.info("Using cached .tx file for %s .." % source)
+            # Mark as recently used for cache pruning
+            try:
+                os.utime(cached, None)
+            except OSError:
+                pass
+        else:
+            self._convert_to_cache(
+                source, cached, texture_hash, args, threads
+            )
+
+        self._link_or_copy(cached, destination)
+        return destination
+
+    def _convert(self, source, destination, texture_hash, args, threads=None):
+        if self.log:
+            self.log.info("Generating .tx file for %s .." % source)
+        # Include `source-hash` as string metadata
+        maketx_args = ["-sattrib", "sourceHash", texture_hash] + list(args)
+        maketx(
+            source,
+            destination,
+            *maketx_args,
+            threads=threads or self.threads_per_job
+        )
+
+    def _convert_to_cache(
+        self, source, cached, texture_hash, args, threads=None
+    ):
+        cache_subdir = os.path.dirname(cached)
+        if not os.path.exists(cache_subdir):
+            try:
+                os.makedirs(cache_subdir)
+            except OSError:
+                if not os.path.isdir(cache_subdir):
+                    raise
+
+        # Convert to unique temporary file and rename it afterwards so
+        # other processes never use partially written file.
+        tmp_path = "{}.{}.tmp.tx".format(
+            os.path.splitext(cached)[0], uuid.uuid4().hex
+        )
+        try:
+            self._convert(source, tmp_path, texture_hash, args, threads)
+            try:
+                os.rename(tmp_path, cached)
+            except OSError:
+                # Same texture was cached by other process in the meantime
+                if not os.path.exists(cached):
+                    raise
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _link_or_copy(src, dst):
+        if os.path.exists(dst):
+            os.remove(dst)
+        try:
+            filelink.create(src, dst, filelink.HARDLINK)
+        except OSError:
+            shutil.copyfile(src, dst)
+
+
 @contextlib.contextmanager
 def no_workspace_dir():
     """Force maya to a fake temporary workspace directory.
@@ -140,6 +422,19 @@ class ExtractLook(pype.api.Extractor):
     families = ["look"]
     order = pyblish.api.ExtractorOrder + 0.2
 
+    # Maximum cores used by concurrent maketx conversions (all when 0)
+    maketx_core_budget = 0
+    # Threads of single maketx process
+    maketx_threads = 2
+    # Root of .tx cache, can be overridden with "PYPE_MAKETX_CACHE_DIR"
+    # environment. Default cache is in temp directory.
+    maketx_cache_dir = ""
+    use_maketx_cache = True
+    # Limits of .tx cache, least recently used files are removed first
+    # (not limited when 0)
+    maketx_cache_max_size = 20 * 1024 ** 3
+    maketx_cache_max_age = 30 * 24 * 60 * 60
+
     def process(self, instance):
 
         # Define extract output file path
@@ -188,7 +483,27 @@ class ExtractLook(pype.api.Extractor):
         hashes = dict()
         forceCopy = instance.data.get("forceCopy", False)
 
+        # Find already published textures for all files at once
+        hash_args = []
+        if do_maketx:
+            hash_args.append("maketx")
+        texture_hashes = {
+            filepath: source_hash(filepath, *hash_args)
+            for filepath in files_metadata
+        }
+        existing_by_hash = find_paths_by_hashes(texture_hashes.values())
+
+        scheduler = MaketxScheduler(
+            cache_dir=self.get_maketx_cache_dir(),
+            core_budget=self.maketx_core_budget,
+            threads_per_job=self.maketx_threads,
+            cache_max_size=self.maketx_cache_max_size,
+            cache_max_age=self.maketx_cache_max_age,
+            logger=self.log
+        )
+
         self.log.info(files)
+        processed = []
         for filepath in files_metadata:
 
             cspace = files_metadata[filepath]["color_space"]
@@ -203,8 +518,16 @@ class ExtractLook(pype.api.Extractor):
                 do_maketx,
                 staging=dir_path,
                 linearise=linearise,
-                force=forceCopy
+                force=forceCopy,
+                existing=existing_by_hash.get(texture_hashes[filepath]) or [],
+                scheduler=scheduler
             )
+            processed.append((source, mode, hash))
+
+        # Convert all textures that need it at once
+        scheduler.run()
+
+        for source, mode, hash in processed:
             destination = self.resource_destination(instance,
                                                     source,
                                                     do_maketx)
@@ -346,7 +669,20 @@ class ExtractLook(pype.api.Extractor):
             resources_dir, basename + ext
         )
 
-    def _process_texture(self, filepath, do_maketx, staging, linearise, force):
+    def get_maketx_cache_dir(self):
+        """Root directory of .tx cache or None if cache is disabled."""
+        if not self.use_maketx_cache:
+            return None
+        return (
+            os.environ.get("PYPE_MAKETX_CACHE_DIR")
+            or self.maketx_cache_dir
+            or os.path.join(tempfile.gettempdir(), "pype_maketx_cache")
+        )
+
+    def _process_texture(
+        self, filepath, do_maketx, staging, linearise, force, existing=None,
+        scheduler=None
+    ):
         """Process a single texture file on disk for publishing.
         This will:
             1. Check whether it's already published, if so it will do hardlink
@@ -355,7 +691,13 @@ class ExtractLook(pype.api.Extractor):
         Args:
             filepath (str): The source file path to process.
             do_maketx (bool): Whether to produce a .tx file
+            existing (list): Published paths of texture hash. Looked up in
+                database when not entered.
+            scheduler (MaketxScheduler): Conversion is only scheduled when
+                entered and converted file exists after `scheduler.run()`.
+                Texture is converted immediately otherwise.
         Returns:
+            tuple: Source path, transfer mode and texture hash.
         """
 
         fname, ext = os.path.splitext(os.path.basename(filepath))
@@ -367,11 +709,12 @@ class ExtractLook(pype.api.Extractor):
 
         # If source has been published before with the same settings,
         # then don't reprocess but hardlink from the original
-        existing = find_paths_by_hash(texture_hash)
+        if existing is None:
+            existing = find_paths_by_hash(texture_hash)
         if existing and not force:
             self.log.info("Found hash in database, preparing hardlink..")
             source = next((p for p in existing if os.path.exists(p)), None)
-            if filepath:
+            if source:
                 return source, HARDLINK, texture_hash
             else:
                 self.log.warning(
@@ -383,26 +726,24 @@ class ExtractLook(pype.api.Extractor):
             # Produce .tx file in staging if source file is not .tx
             converted = os.path.join(staging, "resources", fname + ".tx")
 
+            maketx_args = []
             if linearise:
                 self.log.info("tx: converting sRGB -> linear")
-                colorconvert = "--colorconvert sRGB linear"
-            else:
-                colorconvert = ""
-
-            # Ensure folder exists
-            if not os.path.exists(os.path.dirname(converted)):
-                os.makedirs(os.path.dirname(converted))
-
-            self.log.info("Generating .tx file for %s .." % filepath)
-            maketx(
-                filepath,
-                converted,
-                # Include `source-hash` as string metadata
-                "-sattrib",
-                "sourceHash",
-                texture_hash,
-                colorconvert,
-            )
+                maketx_args.append("--colorconvert sRGB linear")
+
+            run_now = scheduler is None
+            if run_now:
+                scheduler = MaketxScheduler(
+                    cache_dir=self.get_maketx_cache_dir(),
+                    core_budget=self.maketx_core_budget,
+                    threads_per_job=self.maketx_threads,
+                    cache_max_size=self.maketx_cache_max_size,
+                    cache_max_age=self.maketx_cache_max_age,
+                    logger=self.log
+                )
+            scheduler.add(filepath, converted, texture_hash, maketx_args)
+            if run_now:
+                scheduler.run()
 
             return converted, COPY, texture_hash
 
@@ -6,6 +6,7 @@ import capture
 
 from pype.hosts.maya import lib
 import pype.api
+from pype.lib import get_sequence_scanner
 
 from maya import cmds
 import pymel.core as pm
@@ -93,7 +94,10 @@ class ExtractPlayblast(pype.api.Extractor):
 
         self.log.info("file list  {}".format(playblast))
 
-        collected_frames = os.listdir(stagingdir)
+        # Playblast was written into directory, list it again
+        scanner = get_sequence_scanner(instance.context)
+        scanner.invalidate(stagingdir)
+        collected_frames = scanner.files(stagingdir)
         collections, remainder = clique.assemble(collected_frames)
         input_path = os.path.join(
             stagingdir, collections[0].format('{head}{padding}{tail}'))
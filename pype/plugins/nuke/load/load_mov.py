@@ -4,7 +4,7 @@ import contextlib
 
 from avalon import api, io
 from pype.hosts.nuke import presets
-from pype.api import config
+from pype.api import get_presets
 
 
 @contextlib.contextmanager
@@ -73,7 +73,7 @@ def add_review_presets_config():
         "families": list(),
         "representations": list()
     }
-    review_presets = config.get_presets()["plugins"]["global"]["publish"].get(
+    review_presets = get_presets()["plugins"]["global"]["publish"].get(
         "ExtractReview", {})
 
     outputs = review_presets.get("outputs", {})
@@ -3,6 +3,7 @@ import re
 import nuke
 import pyblish.api
 from avalon import io, api
+from pype.lib import get_sequence_scanner
 
 
 @pyblish.api.log
@@ -67,7 +68,8 @@ class CollectNukeReads(pyblish.api.InstancePlugin):
         self.log.debug('source dir: {}'.format(source_dir))
 
         if isSequence:
-            source_files = [f for f in os.listdir(source_dir)
+            scanner = get_sequence_scanner(instance.context)
+            source_files = [f for f in scanner.files(source_dir)
                             if ext in f
                             if items[0] in f]
         else:
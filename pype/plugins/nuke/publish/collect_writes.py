@@ -1,6 +1,7 @@
 import os
 import nuke
 import pyblish.api
+from pype.lib import get_sequence_scanner
 
 
 @pyblish.api.log
@@ -83,7 +84,8 @@ class CollectNukeWrites(pyblish.api.InstancePlugin):
                 }
 
             try:
-                collected_frames = [f for f in os.listdir(output_dir)
+                scanner = get_sequence_scanner(instance.context)
+                collected_frames = [f for f in scanner.files(output_dir)
                                     if ext in f]
                 if collected_frames:
                     collected_frames_len = len(collected_frames)
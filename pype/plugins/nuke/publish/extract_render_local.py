@@ -3,6 +3,7 @@ import nuke
 import os
 import pype
 import clique
+from pype.lib import get_sequence_scanner
 
 
 class NukeRenderLocal(pype.api.Extractor):
@@ -65,7 +66,10 @@ class NukeRenderLocal(pype.api.Extractor):
         if "representations" not in instance.data:
             instance.data["representations"] = []
 
-        collected_frames = os.listdir(out_dir)
+        # Rendered frames were written into directory, list it again
+        scanner = get_sequence_scanner(instance.context)
+        scanner.invalidate(out_dir)
+        collected_frames = scanner.files(out_dir)
         repre = {
             'name': ext,
             'ext': ext,
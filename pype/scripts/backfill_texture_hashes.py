@@ -0,0 +1,45 @@
+"""Register source hashes of already published textures.
+
+Fills texture hash registry (`pype.lib.TextureHashRegistry`) from
+"sourceHashes" of existing version documents so look publishing can find
+previously published textures without scanning versions.
+"""
+
+import argparse
+import logging
+
+from avalon import io
+from pype.lib import TextureHashRegistry, get_avalon_database
+
+handler = logging.basicConfig()
+log = logging.getLogger("Backfill texture hashes")
+log.setLevel(logging.INFO)
+
+
+def backfill(project_names=None):
+    io.install()
+    if not project_names:
+        project_names = [project["name"] for project in io.projects()]
+
+    for project_name in project_names:
+        registry = TextureHashRegistry(project_name, get_avalon_database())
+        count = registry.backfill()
+        log.info("Project \"{}\": registered hashes of {} versions".format(
+            project_name, count
+        ))
+
+
+def __main__():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects",
+                        nargs="*",
+                        default=[],
+                        help="Names of projects to process. All projects"
+                             " are processed when not entered.")
+
+    kwargs, args = parser.parse_known_args()
+    backfill(kwargs.projects)
+
+
+if __name__ == '__main__':
+    __main__()
@@ -4,24 +4,19 @@ import re
 import subprocess
 import json
 import opentimelineio_contrib.adapters.ffmpeg_burnins as ffmpeg_burnins
-from pype.api import Logger, config
+from pype.api import Logger
 import pype.lib
 
 log = Logger().get_logger("BurninWrapper", "burninwrap")
 
 
 ffmpeg_path = pype.lib.get_ffmpeg_tool_path("ffmpeg")
-ffprobe_path = pype.lib.get_ffmpeg_tool_path("ffprobe")
 
 
 FFMPEG = (
     '{} -loglevel panic -i %(input)s %(filters)s %(args)s%(output)s'
 ).format(ffmpeg_path)
 
-FFPROBE = (
-    '{} -v quiet -print_format json -show_format -show_streams "%(source)s"'
-).format(ffprobe_path)
-
 DRAWTEXT = (
     "drawtext=text=\\'%(text)s\\':x=%(x)s:y=%(y)s:fontcolor="
     "%(color)s@%(opacity).1f:fontsize=%(size)d:fontfile='%(font)s'"
@@ -41,15 +36,11 @@ SOURCE_TIMECODE_KEY = "{source_timecode}"
 
 def _streams(source):
     """Reimplemented from otio burnins to be able use full path to ffprobe
+    and ffprobe cache.
     :param str source: source media file
     :rtype: [{}, ...]
     """
-    command = FFPROBE % {'source': source}
-    proc = subprocess.Popen(command, shell=True, stdout=subprocess.PIPE)
-    out = proc.communicate()[0]
-    if proc.returncode != 0:
-        raise RuntimeError("Failed to run: %s" % command)
-    return json.loads(out)['streams']
+    return pype.lib.ffprobe_streams(source)
 
 
 def get_fps(str_value):
@@ -393,13 +384,80 @@ def burnins_from_data(
     }
     """
 
+    burnin = prepare_burnins(
+        input_path, data, options=options, burnin_values=burnin_values
+    )
+
+    ffmpeg_args = []
+    if codec_data:
+        # Use codec definition from method arguments
+        ffmpeg_args = codec_data
+
+    else:
+        codec_name = burnin._streams[0].get("codec_name")
+        if codec_name:
+            ffmpeg_args.append("-codec:v {}".format(codec_name))
+
+        profile_name = burnin._streams[0].get("profile")
+        if profile_name:
+            # lower profile name and repalce spaces with underscore
+            profile_name = profile_name.replace(" ", "_").lower()
+            ffmpeg_args.append("-profile:v {}".format(profile_name))
+
+        pix_fmt = burnin._streams[0].get("pix_fmt")
+        if pix_fmt:
+            ffmpeg_args.append("-pix_fmt {}".format(pix_fmt))
+
+    # Use group one (same as `-intra` argument, which is deprecated)
+    ffmpeg_args.append("-g 1")
+
+    ffmpeg_args_str = " ".join(ffmpeg_args)
+    burnin.render(
+        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
+    )
+
+
+def burnin_filters_from_data(
+    input_path, data, options=None, burnin_values=None, streams=None
+):
+    """Drawtext filters for burnins without rendering.
+
+    Filters can be used in ffmpeg filter graph of another process so
+    burnins don't need separate encode pass. Arguments are same as in
+    `burnins_from_data`.
+
+    Args:
+        streams (list): Stream data of input as ffprobe would return them.
+            Resolution of first stream must be resolution of the output
+            where filters are used. Input is probed when not entered.
+
+    Returns:
+        str: Filters joined by comma.
+    """
+    burnin = prepare_burnins(
+        input_path, data,
+        options=options, burnin_values=burnin_values, streams=streams
+    )
+    return burnin.filter_string
+
+
+def prepare_burnins(
+    input_path, data, options=None, burnin_values=None, streams=None
+):
+    """Create `ModifiedBurnins` object with burnins from data.
+
+    Arguments are described in `burnins_from_data`.
+
+    Returns:
+        ModifiedBurnins: Object with filled burnin filters.
+    """
     # Use legacy processing when options are not set
     if options is None or burnin_values is None:
-        presets = config.get_presets().get("tools", {}).get("burnins", {})
+        presets = pype.lib.get_burnin_presets()
         options = presets.get("options")
         burnin_values = presets.get("burnins") or {}
 
-    burnin = ModifiedBurnins(input_path, options_init=options)
+    burnin = ModifiedBurnins(input_path, streams, options_init=options)
 
     frame_start = data.get("frame_start")
     frame_end = data.get("frame_end")
@@ -508,37 +566,25 @@ def burnins_from_data(
         text = value.format(**data)
         burnin.add_text(text, align, frame_start, frame_end)
 
-    ffmpeg_args = []
-    if codec_data:
-        # Use codec definition from method arguments
-        ffmpeg_args = codec_data
-
-    else:
-        codec_name = burnin._streams[0].get("codec_name")
-        if codec_name:
-            ffmpeg_args.append("-codec:v {}".format(codec_name))
-
-        profile_name = burnin._streams[0].get("profile")
-        if profile_name:
-            # lower profile name and repalce spaces with underscore
-            profile_name = profile_name.replace(" ", "_").lower()
-            ffmpeg_args.append("-profile:v {}".format(profile_name))
-
-        pix_fmt = burnin._streams[0].get("pix_fmt")
-        if pix_fmt:
-            ffmpeg_args.append("-pix_fmt {}".format(pix_fmt))
-
-    # Use group one (same as `-intra` argument, which is deprecated)
-    ffmpeg_args.append("-g 1")
-
-    ffmpeg_args_str = " ".join(ffmpeg_args)
-    burnin.render(
-        output_path, args=ffmpeg_args_str, overwrite=overwrite, **data
-    )
+    return burnin
 
 
 if __name__ == "__main__":
     in_data = json.loads(sys.argv[-1])
+    # Only store filters to json file when "filters_output" is set
+    filters_output = in_data.get("filters_output")
+    if filters_output:
+        filter_string = burnin_filters_from_data(
+            in_data["input"],
+            in_data["burnin_data"],
+            options=in_data.get("options"),
+            burnin_values=in_data.get("values"),
+            streams=in_data.get("streams")
+        )
+        with open(filters_output, "w") as stream:
+            json.dump({"filters": filter_string}, stream)
+        sys.exit(0)
+
     burnins_from_data(
         in_data["input"],
         in_data["output"],
@@ -6,6 +6,16 @@ from slate_base import api
 def main(in_args=None):
     data_arg = in_args[-1]
     in_data = json.loads(data_arg)
+    if "fill_data_list" in in_data:
+        api.create_slates_batch(
+            in_data["fill_data_list"],
+            in_data.get("slate_name"),
+            in_data.get("slate_data"),
+            in_data.get("data_output_json"),
+            in_data.get("workers")
+        )
+        return
+
     api.create_slates(
         in_data["fill_data"],
         in_data.get("slate_name"),
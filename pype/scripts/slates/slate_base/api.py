@@ -11,5 +11,5 @@ from .items import (
     ItemTable,
     TableField
 )
-from .lib import create_slates
+from .lib import create_slates, create_slates_batch
 from .example import example
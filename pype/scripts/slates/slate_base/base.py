@@ -6,12 +6,18 @@ import json
 from uuid import uuid4
 
 
+_default_style = None
+
+
 def load_default_style():
-    cur_folder = os.path.dirname(os.path.abspath(__file__))
-    default_json_path = os.path.join(cur_folder, "default_style.json")
-    with open(default_json_path, "r") as _file:
-        data = _file.read()
-    return json.loads(data)
+    """Copy of default style, file is loaded only once."""
+    global _default_style
+    if _default_style is None:
+        cur_folder = os.path.dirname(os.path.abspath(__file__))
+        default_json_path = os.path.join(cur_folder, "default_style.json")
+        with open(default_json_path, "r") as _file:
+            _default_style = json.loads(_file.read())
+    return copy.deepcopy(_default_style)
 
 
 class BaseObj:
@@ -1,13 +1,39 @@
 import os
 import sys
+import json
+import tempfile
+import functools
 import collections
 
 from PIL import ImageFont
 
 
+@functools.lru_cache(maxsize=256)
+def _truetype(fontpath, font_size=None):
+    if font_size:
+        return ImageFont.truetype(fontpath, font_size)
+    return ImageFont.truetype(fontpath)
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_size(font, text, multiline=False):
+    if multiline:
+        return font.getsize_multiline(text)
+    return font.getsize(text)
+
+
 class FontFactory:
+    """Access to system fonts by family and style.
+
+    Font files are indexed once and index is stored to json file (path can
+    be set with environment "PYPE_SLATE_FONT_INDEX"). Stored index is used
+    until modification time of any font directory changes, so new processes
+    don't have to open all font files. Sized fonts and measured text
+    extents are cached.
+    """
     fonts = None
     default = None
+    index_version = 1
 
     @classmethod
     def get_font(cls, family, font_size=None, italic=False, bold=False):
@@ -30,26 +56,25 @@ class FontFactory:
         if not family_styles:
             return cls.default
 
-        font = family_styles.get(style)
-        if font:
-            if font_size:
-                font = font.font_variant(size=font_size)
-            return font
+        fontpath = family_styles.get(style)
+        if not fontpath:
+            # Use first found
+            fontpath = next(iter(family_styles.values()))
 
-        # Return first found
-        for font in family_styles:
-            if font_size:
-                font = font.font_variant(size=font_size)
-            return font
+        return _truetype(fontpath, font_size)
 
-        return cls.default
+    @staticmethod
+    def text_size(font, text):
+        """Cached `font.getsize(text)`."""
+        return _text_size(font, text)
 
-    @classmethod
-    def load_fonts(cls):
+    @staticmethod
+    def multiline_text_size(font, text):
+        """Cached `font.getsize_multiline(text)`."""
+        return _text_size(font, text, True)
 
-        cls.default = ImageFont.load_default()
-
-        available_font_ext = [".ttf", ".ttc"]
+    @classmethod
+    def font_dirs(cls):
         dirs = []
         if sys.platform == "win32":
             # check the windows font repository
@@ -75,19 +100,96 @@ class FontFactory:
                 "/System/Library/Fonts",
                 os.path.expanduser("~/Library/Fonts")
             ]
+        return dirs
 
+    @classmethod
+    def index_path(cls):
+        return os.environ.get("PYPE_SLATE_FONT_INDEX") or os.path.join(
+            tempfile.gettempdir(), "pype_slate_font_index.json"
+        )
+
+    @classmethod
+    def load_fonts(cls):
+        cls.default = ImageFont.load_default()
+
+        dirs = cls.font_dirs()
+        fonts = cls._load_index(dirs)
+        if fonts is None:
+            fonts, dir_mtimes = cls._index_fonts(dirs)
+            cls._store_index(dirs, fonts, dir_mtimes)
+
+        cls.fonts = fonts
+
+    @classmethod
+    def _index_fonts(cls, dirs):
+        available_font_ext = [".ttf", ".ttc"]
         available_fonts = collections.defaultdict(dict)
+        dir_mtimes = {}
         for directory in dirs:
             for walkroot, walkdir, walkfilenames in os.walk(directory):
+                dir_mtimes[walkroot] = os.path.getmtime(walkroot)
                 for walkfilename in walkfilenames:
                     ext = os.path.splitext(walkfilename)[1]
                     if ext.lower() not in available_font_ext:
                         continue
 
                     fontpath = os.path.join(walkroot, walkfilename)
-                    font_obj = ImageFont.truetype(fontpath)
+                    try:
+                        font_obj = ImageFont.truetype(fontpath)
+                    except (IOError, OSError):
+                        continue
                     family = font_obj.font.family.lower()
                     style = font_obj.font.style
-                    available_fonts[family][style] = font_obj
+                    available_fonts[family][style] = fontpath
+
+        return dict(available_fonts), dir_mtimes
 
-        cls.fonts = available_fonts
+    @classmethod
+    def _load_index(cls, dirs):
+        """Load stored font index if font directories were not modified."""
+        index_path = cls.index_path()
+        if not os.path.exists(index_path):
+            return None
+
+        try:
+            with open(index_path, "r") as stream:
+                data = json.load(stream)
+        except (IOError, OSError, ValueError):
+            return None
+
+        if (
+            data.get("version") != cls.index_version
+            or data.get("dirs") != dirs
+        ):
+            return None
+
+        for dirpath, mtime in data["dir_mtimes"].items():
+            try:
+                if os.path.getmtime(dirpath) != mtime:
+                    return None
+            except OSError:
+                return None
+
+        # New font directory which did not exist when index was created
+        for dirpath in dirs:
+            if dirpath not in data["dir_mtimes"] and os.path.isdir(dirpath):
+                return None
+
+        return data["fonts"]
+
+    @classmethod
+    def _store_index(cls, dirs, fonts, dir_mtimes):
+        index_path = cls.index_path()
+        data = {
+            "version": cls.index_version,
+            "dirs": dirs,
+            "dir_mtimes": dir_mtimes,
+            "fonts": fonts
+        }
+        tmp_path = "{}.{}.tmp".format(index_path, os.getpid())
+        try:
+            with open(tmp_path, "w") as stream:
+                json.dump(data, stream)
+            os.replace(tmp_path, index_path)
+        except (IOError, OSError):
+            pass
@@ -181,7 +181,7 @@ class ItemText(BaseItem):
         font = FontFactory.get_font(
             font_family, font_size, font_italic, font_bold
         )
-        width = font.getsize(self.value)[0]
+        width = FontFactory.text_size(font, self.value)[0]
         return int(width)
 
     def value_height(self):
@@ -193,7 +193,7 @@ class ItemText(BaseItem):
         font = FontFactory.get_font(
             font_family, font_size, font_italic, font_bold
         )
-        height = font.getsize(self.value)[1]
+        height = FontFactory.text_size(font, self.value)[1]
         return int(height)
 
 
@@ -361,7 +361,7 @@ class TableField(BaseItem):
         font = FontFactory.get_font(
             font_family, font_size, font_italic, font_bold
         )
-        val_width = font.getsize(value)[0]
+        val_width = FontFactory.text_size(font, value)[0]
         if val_width <= max_width:
             return value
 
@@ -393,7 +393,7 @@ class TableField(BaseItem):
                     connector = ""
 
                 _line = connector.join([line, _word])
-                _line_width = font.getsize(_line)[0]
+                _line_width = FontFactory.text_size(font, _line)[0]
                 if _line_width > max_width:
                     break
                 line = _line
@@ -412,7 +412,7 @@ class TableField(BaseItem):
                     line = ""
                     for idx, char in enumerate(words[idx]):
                         _line = line + char + self.ellide_text
-                        _line_width = font.getsize(_line)[0]
+                        _line_width = FontFactory.text_size(font, _line)[0]
                         if _line_width > max_width:
                             if idx == 0:
                                 line = _line
@@ -439,7 +439,9 @@ class TableField(BaseItem):
             return "\n".join(lines)
 
         last_line = lines[-1]
-        last_line_width = font.getsize(last_line + self.ellide_text)[0]
+        last_line_width = FontFactory.text_size(
+            font, last_line + self.ellide_text
+        )[0]
         if last_line_width <= max_width:
             lines[-1] += self.ellide_text
             return "\n".join([line for line in lines])
@@ -454,7 +456,7 @@ class TableField(BaseItem):
             line = ""
             for idx, word in enumerate(last_line_words):
                 _line = line + word + self.ellide_text
-                _line_width = font.getsize(_line)[0]
+                _line_width = FontFactory.text_size(font, _line)[0]
                 if _line_width > max_width:
                     if idx == 0:
                         line = _line
@@ -471,7 +473,7 @@ class TableField(BaseItem):
                 connector = ""
 
             _line = connector.join([line, _word + self.ellide_text])
-            _line_width = font.getsize(_line)[0]
+            _line_width = FontFactory.text_size(font, _line)[0]
 
             if _line_width <= max_width:
                 line = connector.join([line, _word])
@@ -488,7 +490,7 @@ class TableField(BaseItem):
 
             for idx, char in enumerate(_word):
                 _line = line + char + self.ellide_text
-                _line_width = font.getsize(_line)[0]
+                _line_width = FontFactory.text_size(font, _line)[0]
                 if _line_width > max_width:
                     if idx == 0:
                         line = _line
@@ -535,7 +537,7 @@ class TableField(BaseItem):
         font = FontFactory.get_font(
             font_family, font_size, font_italic, font_bold
         )
-        width = font.getsize_multiline(self.value)[0] + 1
+        width = FontFactory.multiline_text_size(font, self.value)[0] + 1
 
         min_width = self.style.get("min-height")
         if min_width and min_width > width:
@@ -559,7 +561,7 @@ class TableField(BaseItem):
         font = FontFactory.get_font(
             font_family, font_size, font_italic, font_bold
         )
-        height = font.getsize_multiline(self.value)[1] + 1
+        height = FontFactory.multiline_text_size(font, self.value)[1] + 1
 
         min_height = self.style.get("min-height")
         if min_height and min_height > height:
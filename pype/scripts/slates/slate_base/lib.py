@@ -1,11 +1,14 @@
 import os
+import re
 import json
 import logging
+import multiprocessing
 try:
     from queue import Queue
 except Exception:
     from Queue import Queue
 
+from .base import BaseObj
 from .main_frame import MainFrame
 from .layer import Layer
 from .items import (
@@ -13,7 +16,7 @@ from .items import (
 )
 
 try:
-    from pype.api.config import get_presets
+    from pype.api import get_presets
 except Exception:
     get_presets = dict
 
@@ -23,16 +26,11 @@ log = logging.getLogger(__name__)
 RequiredSlateKeys = ["width", "height", "destination_path"]
 
 
-# TODO proper documentation
-def create_slates(
-    fill_data, slate_name=None, slate_data=None, data_output_json=None
-):
-    """Implmentation for command line executing.
+def get_slate_data(slate_name=None, slate_data=None):
+    """Slate layout data entered directly or found in presets by name.
 
-    Data for slates are by defaule taken from presets. That requires to enter,
-    `slate_name`. If `slate_data` are entered then they are used.
-
-    `data_output` should be path to json file where data will be collected.
+    Returns:
+        dict/None: Slate data or None when required keys are missing.
     """
     if slate_data is None and slate_name is None:
         raise TypeError(
@@ -63,17 +61,14 @@ def create_slates(
         log.error("Slate data of <{}> miss required keys: {}".format(
             slate_name, ", ".join(missing_keys)
         ))
-        return False
+        return None
+    return slate_data
 
-    width = slate_data["width"]
-    height = slate_data["height"]
-    dst_path = slate_data["destination_path"]
-    style = slate_data.get("style") or {}
-
-    main = MainFrame(width, height, dst_path, fill_data, style=style)
 
+def load_items(main, items_data):
+    """Create slate items from data under main frame."""
     load_queue = Queue()
-    for item in slate_data["items"]:
+    for item in items_data:
         load_queue.put((item, main))
 
     while not load_queue.empty():
@@ -131,12 +126,8 @@ def create_slates(
                 "Not implemented object type `{}` - skipping".format(item_type)
             )
 
-    main.draw()
-    log.debug("Slate creation finished")
-
-    if not data_output_json:
-        return
 
+def write_output_json(output_data, data_output_json):
     if not data_output_json.endswith(".json"):
         raise ValueError("Output path must be .json file.")
 
@@ -145,8 +136,162 @@ def create_slates(
         log.info("Creating folder \"{}\"".format(data_output_json_dir))
         os.makedirs(data_output_json_dir)
 
-    output_data = main.collect_data()
     with open(data_output_json, "w") as json_file:
         json_file.write(json.dumps(output_data, indent=4))
 
     log.info("Metadata collected in \"{}\".".format(data_output_json))
+
+
+# TODO proper documentation
+def create_slates(
+    fill_data, slate_name=None, slate_data=None, data_output_json=None
+):
+    """Implmentation for command line executing.
+
+    Data for slates are by defaule taken from presets. That requires to enter,
+    `slate_name`. If `slate_data` are entered then they are used.
+
+    `data_output` should be path to json file where data will be collected.
+    """
+    slate_data = get_slate_data(slate_name, slate_data)
+    if slate_data is None:
+        return False
+
+    width = slate_data["width"]
+    height = slate_data["height"]
+    dst_path = slate_data["destination_path"]
+    style = slate_data.get("style") or {}
+
+    main = MainFrame(width, height, dst_path, fill_data, style=style)
+    load_items(main, slate_data["items"])
+
+    main.draw()
+    log.debug("Slate creation finished")
+
+    if not data_output_json:
+        return
+
+    write_output_json(main.collect_data(), data_output_json)
+
+
+def is_static_item(item_data):
+    """Item does not use fill data so it looks same on all slates.
+
+    Placeholders are never static because their data are collected for each
+    slate.
+    """
+    item_type = item_data["type"].lower()
+    if item_type == "placeholder":
+        return False
+
+    if item_type == "layer":
+        return all(
+            is_static_item(item) for item in item_data.get("items") or []
+        )
+
+    return not re.search(BaseObj.fill_data_regex, json.dumps(item_data))
+
+
+# Data of slates rendered in current worker process
+_batch_worker_data = {}
+
+
+def _init_batch_worker(slate_data, items_data, base_image):
+    _batch_worker_data["slate_data"] = slate_data
+    _batch_worker_data["items_data"] = items_data
+    _batch_worker_data["base_image"] = base_image
+
+
+def _render_batch_slate(fill_data):
+    slate_data = _batch_worker_data["slate_data"]
+    main = MainFrame(
+        slate_data["width"],
+        slate_data["height"],
+        slate_data["destination_path"],
+        fill_data,
+        style=slate_data.get("style") or {},
+        base_image=_batch_worker_data["base_image"]
+    )
+    load_items(main, _batch_worker_data["items_data"])
+    main.draw()
+    return main.collect_data()
+
+
+def create_slates_batch(
+    fill_data_list, slate_name=None, slate_data=None, data_output_json=None,
+    workers=None
+):
+    """Create slates with same layout for multiple fill data.
+
+    Layout data are resolved once. Leading top level items which don't use
+    fill data are drawn only once to base image and each slate draws only
+    remaining items. Slates are rendered in worker processes.
+
+    Args:
+        fill_data_list (list): Fill data for each slate. Destination path
+            in slate data should contain fill keys to create unique paths.
+        slate_name (str): Name of slate preset.
+        slate_data (dict): Slate layout data used instead of preset.
+        data_output_json (str): Path to json file where list of collected
+            data of all slates is stored.
+        workers (int): Number of worker processes. Defaults to cpu count.
+
+    Returns:
+        list/bool: Collected data of slates in order of fill data or False
+            when slate data are invalid.
+    """
+    slate_data = get_slate_data(slate_name, slate_data)
+    if slate_data is None:
+        return False
+
+    if not fill_data_list:
+        return []
+
+    # Only leading static items can be drawn to base image so they are
+    # still drawn below following items
+    static_items = []
+    variable_items = list(slate_data["items"])
+    while variable_items and is_static_item(variable_items[0]):
+        static_items.append(variable_items.pop(0))
+
+    base_image = None
+    if static_items:
+        base_frame = MainFrame(
+            slate_data["width"],
+            slate_data["height"],
+            "",
+            {},
+            style=slate_data.get("style") or {}
+        )
+        load_items(base_frame, static_items)
+        base_image = base_frame.render()
+
+    if not workers:
+        workers = multiprocessing.cpu_count()
+    workers = max(1, min(workers, len(fill_data_list)))
+
+    init_args = (slate_data, variable_items, base_image)
+    if workers == 1:
+        _init_batch_worker(*init_args)
+        output_data = [
+            _render_batch_slate(fill_data) for fill_data in fill_data_list
+        ]
+    else:
+        pool = multiprocessing.Pool(
+            workers, initializer=_init_batch_worker, initargs=init_args
+        )
+        try:
+            chunksize = max(1, len(fill_data_list) // (workers * 4))
+            output_data = pool.map(
+                _render_batch_slate, fill_data_list, chunksize
+            )
+        finally:
+            pool.close()
+            pool.join()
+
+    log.debug("Creation of {} slates finished".format(len(output_data)))
+
+    if data_output_json:
+        write_output_json(output_data, data_output_json)
+
+    return output_data
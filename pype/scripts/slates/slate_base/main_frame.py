@@ -13,6 +13,8 @@ class MainFrame(BaseObj):
     def __init__(
         self, width, height, destination_path, fill_data={}, *args, **kwargs
     ):
+        # Pre-rendered image used as background instead of `bg-color`
+        self.base_image = kwargs.pop("base_image", None)
         kwargs["parent"] = None
         super(MainFrame, self).__init__(*args, **kwargs)
         self._width = width
@@ -47,17 +49,26 @@ class MainFrame(BaseObj):
     def height(self):
         return self._height
 
+    def render(self):
+        """Draw items to new image and return it."""
+        if self.base_image is not None:
+            image = self.base_image.copy()
+        else:
+            bg_color = self.style["bg-color"]
+            image = Image.new(
+                "RGB", (self.width(), self.height()), color=bg_color
+            )
+        drawer = ImageDraw.Draw(image)
+        for item in self.items.values():
+            item.draw(image, drawer)
+        return image
+
     def draw(self, path=None):
         dir_path = os.path.dirname(self.dst_path)
         if not os.path.exists(dir_path):
             os.makedirs(dir_path)
 
-        bg_color = self.style["bg-color"]
-        image = Image.new("RGB", (self.width(), self.height()), color=bg_color)
-        drawer = ImageDraw.Draw(image)
-        for item in self.items.values():
-            item.draw(image, drawer)
-
+        image = self.render()
         image.save(self.dst_path)
         self.reset()
 
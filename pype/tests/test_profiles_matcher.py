@@ -0,0 +1,73 @@
+from pype.lib import get_profiles_matcher
+
+
+def find_profile_name(profiles, host_name, task_name, family):
+    matcher = get_profiles_matcher(profiles)
+    profile = matcher.find_matching_profile(host_name, task_name, family)
+    if profile is None:
+        return None
+    return profile["name"]
+
+
+def test_filter_value_matches():
+    """Test matching of set, not set and invalid filters."""
+    profiles = [
+        {"name": "maya", "hosts": ["maya"]},
+        {"name": "invalid", "hosts": [""]},
+        {"name": "regex", "hosts": [None, "nuke.*"]},
+        {"name": "any", "hosts": []}
+    ]
+
+    assert find_profile_name(profiles, "maya", "comp", "render") == "maya"
+    assert find_profile_name(
+        profiles, "nukestudio", "comp", "render"
+    ) == "regex"
+    assert find_profile_name(profiles, "houdini", "comp", "render") == "any"
+
+
+def test_filter_with_empty_items_does_not_match():
+    """Test profile with only empty filter items is not used."""
+    profiles = [
+        {"name": "empty", "hosts": [""]},
+        {"name": "any"}
+    ]
+
+    assert find_profile_name(profiles, "maya", "compositing", "render") == (
+        "any"
+    )
+    assert find_profile_name(profiles[:1], "maya", "comp", "render") is None
+
+
+def test_most_points_profile():
+    """Test profile with most matching filters is used."""
+    profiles = [
+        {"name": "host", "hosts": ["maya"]},
+        {"name": "host_family", "hosts": ["maya"], "families": ["render"]},
+        {"name": "other_host", "hosts": ["nuke"], "families": ["render"]}
+    ]
+
+    assert find_profile_name(profiles, "maya", "comp", "render") == (
+        "host_family"
+    )
+    assert find_profile_name(profiles, "maya", "comp", "review") == "host"
+
+
+def test_profile_exclusion_order():
+    """Test profiles with same points are excluded by host, task, family."""
+    profiles = [
+        {"name": "family", "families": ["render"]},
+        {"name": "task", "tasks": ["comp"]},
+        {"name": "host", "hosts": ["maya"]},
+        {"name": "host_2", "hosts": ["maya"]}
+    ]
+
+    # Host match is preferred and first of them is used
+    assert find_profile_name(profiles, "maya", "comp", "render") == "host"
+
+    # Task match is preferred over family match
+    assert find_profile_name(profiles, "nuke", "comp", "render") == "task"
+    assert find_profile_name(profiles, "nuke", "anim", "render") == "family"
+
+    # Profiles without filters match anything
+    profiles = [{"name": "first"}, {"name": "second"}]
+    assert find_profile_name(profiles, "nuke", "anim", "review") == "first"
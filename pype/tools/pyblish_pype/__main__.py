@@ -1,3 +1,5 @@
+import sys
+
 from .app import show
 
 
@@ -6,6 +8,11 @@ if __name__ == '__main__':
 
     parser = argparse.ArgumentParser()
     parser.add_argument("--debug", action="store_true")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Publish without GUI and exit with non-zero code on error."
+    )
 
     args = parser.parse_args()
 
@@ -16,4 +23,12 @@ if __name__ == '__main__':
         for Plugin in mock.plugins:
             pyblish.api.register_plugin(Plugin)
 
+    if args.headless:
+        from .control import HeadlessController
+
+        controller = HeadlessController()
+        controller.reset()
+        controller.publish()
+        sys.exit(int(controller.errored))
+
     show()
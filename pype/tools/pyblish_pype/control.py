@@ -7,6 +7,7 @@ an active window manager; such as via Travis-CI.
 """
 import os
 import sys
+import time
 import traceback
 import inspect
 
@@ -18,10 +19,10 @@ import pyblish.logic
 import pyblish.lib
 import pyblish.version
 
-from . import util
+from . import settings, util
 from .constants import InstanceStates
 
-from pype.api import config
+from pype.api import get_presets
 
 
 class IterationBreak(Exception):
@@ -69,6 +70,7 @@ class Controller(QtCore.QObject):
         self.context = None
         self.plugins = {}
         self.optional_default = {}
+        self.time_slice = util.processing_time_slice(settings.TimeSlice)
         self.instance_toggled.connect(self._on_instance_toggled)
 
     def reset_variables(self):
@@ -116,7 +118,7 @@ class Controller(QtCore.QObject):
 
     def presets_by_hosts(self):
         # Get global filters as base
-        presets = config.get_presets().get("plugins", {})
+        presets = get_presets().get("plugins", {})
         if not presets:
             return {}
 
@@ -337,21 +339,48 @@ class Controller(QtCore.QObject):
 
         self.passed_group.emit(self.processing["next_group_order"])
 
+    def _next_pair(self):
+        """Move to next pair from pair generator.
+
+        Returns:
+            bool: Pair is ready to be processed.
+
+        Raises:
+            StopIteration: When all pairs were processed.
+        """
+        try:
+            self.current_pair = next(self.pair_generator)
+            if isinstance(self.current_pair, IterationBreak):
+                raise self.current_pair
+
+        except IterationBreak:
+            self.is_running = False
+            self.was_stopped.emit()
+            return False
+
+        self.about_to_process.emit(*self.current_pair)
+        return True
+
+    def _process_current_pair(self):
+        result = self._process(*self.current_pair)
+        if result["error"] is not None:
+            self.errored = True
+
+        self.was_processed.emit(result)
+
     def iterate_and_process(self, on_finished=lambda: None):
         """ Iterating inserted plugins with current context.
         Collectors do not contain instances, they are None when collecting!
         This process don't stop on one
+
+        When `time_slice` is set pairs are processed back to back and
+        control is given back to Qt event loop only when the time slice
+        (in milliseconds) has elapsed so the GUI can repaint.
         """
         def on_next():
             try:
-                self.current_pair = next(self.pair_generator)
-                if isinstance(self.current_pair, IterationBreak):
-                    raise self.current_pair
-
-            except IterationBreak:
-                self.is_running = False
-                self.was_stopped.emit()
-                return
+                if not self._next_pair():
+                    return
 
             except StopIteration:
                 self.is_running = False
@@ -368,16 +397,11 @@ class Controller(QtCore.QObject):
                     500, lambda: on_unexpected_error(error=exc_msg)
                 )
 
-            self.about_to_process.emit(*self.current_pair)
             util.defer(100, on_process)
 
         def on_process():
             try:
-                result = self._process(*self.current_pair)
-                if result["error"] is not None:
-                    self.errored = True
-
-                self.was_processed.emit(result)
+                self._process_current_pair()
 
             except Exception:
                 # TODO this should be handled much differently
@@ -389,12 +413,50 @@ class Controller(QtCore.QObject):
 
             util.defer(10, on_next)
 
+        def on_next_slice():
+            deadline = time.time() + (self.time_slice / 1000.0)
+            while True:
+                try:
+                    if not self._next_pair():
+                        return
+
+                except StopIteration:
+                    self.is_running = False
+                    # All pairs were processed successfully!
+                    return QtCore.QTimer.singleShot(0, on_finished)
+
+                except Exception:
+                    # This is a bug
+                    exc_type, exc_msg, exc_tb = sys.exc_info()
+                    traceback.print_exception(exc_type, exc_msg, exc_tb)
+                    self.is_running = False
+                    self.was_stopped.emit()
+                    return on_unexpected_error(error=exc_msg)
+
+                try:
+                    self._process_current_pair()
+
+                except Exception:
+                    # TODO this should be handled much differently
+                    exc_type, exc_msg, exc_tb = sys.exc_info()
+                    traceback.print_exception(exc_type, exc_msg, exc_tb)
+                    return on_unexpected_error(error=exc_msg)
+
+                if time.time() >= deadline:
+                    break
+
+            # Give Qt event loop chance to repaint
+            QtCore.QTimer.singleShot(0, on_next_slice)
+
         def on_unexpected_error(error):
             util.u_print(u"An unexpected error occurred:\n %s" % error)
             return util.defer(500, on_finished)
 
         self.is_running = True
-        util.defer(10, on_next)
+        if self.time_slice:
+            QtCore.QTimer.singleShot(0, on_next_slice)
+        else:
+            util.defer(10, on_next)
 
     def collect(self):
         """ Iterate and process Collect plugins
@@ -446,3 +508,42 @@ class Controller(QtCore.QObject):
                     )
                 )
                 traceback.print_exception(*sys.exc_info())
+
+
+class HeadlessController(Controller):
+    """Controller processing all pairs synchronously without event loop.
+
+    Uses the same pair yielder as GUI controller so ordering, validation
+    stops and plugin filtering behave the same way. Meant for farm and
+    command line publishing where no window is shown.
+
+    Example:
+        >>> controller = HeadlessController()
+        >>> controller.reset()
+        >>> controller.publish()
+        >>> controller.errored
+        False
+    """
+
+    def act(self, plugin, action):
+        self.is_running = True
+        result = pyblish.plugin.process(
+            plugin, self.context, None, action.id
+        )
+        self.is_running = False
+        self.was_acted.emit(result)
+
+    def iterate_and_process(self, on_finished=lambda: None):
+        self.is_running = True
+        while True:
+            try:
+                if not self._next_pair():
+                    return
+
+            except StopIteration:
+                self.is_running = False
+                break
+
+            self._process_current_pair()
+
+        on_finished()
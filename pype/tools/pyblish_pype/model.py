@@ -35,7 +35,7 @@ from six import text_type
 from .vendor import qtawesome
 from .constants import PluginStates, InstanceStates, GroupStates, Roles
 
-from pype.api import config
+from pype.api import get_presets
 
 
 # ItemTypes
@@ -104,7 +104,7 @@ class IntentModel(QtGui.QStandardItemModel):
         self.default_index = 0
 
         intents_preset = (
-            config.get_presets()
+            get_presets()
             .get("global", {})
             .get("intent", {})
         )
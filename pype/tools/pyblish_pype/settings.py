@@ -8,6 +8,11 @@ InitialTab = "artist"
 # Customize the window size.
 WindowSize = (430, 600)
 
+# Milliseconds of processing before control is given back to GUI for repaint.
+# - `0` or `None` adds artificial delay between each plugin/instance pair
+# - can be overridden with environment "PYBLISH_TIME_SLICE"
+TimeSlice = 50
+
 TerminalFilters = {
     "info": True,
     "log_debug": True,
@@ -50,6 +50,24 @@ def defer(delay, func):
         return func()
 
 
+def processing_time_slice(default=None):
+    """Time slice in milliseconds for processing between GUI repaints.
+
+    Value of environment "PYBLISH_TIME_SLICE" has priority over `default`.
+    Returns `0` when plugin/instance pairs should be processed with
+    artificial delays.
+    """
+    value = os.environ.get("PYBLISH_TIME_SLICE")
+    if value is None:
+        value = default
+
+    try:
+        value = float(value or 0)
+    except ValueError:
+        return 0
+    return max(value, 0)
+
+
 def u_print(msg, **kwargs):
     """`print` with encoded unicode.
 